@@ -0,0 +1,83 @@
+"""Benchmark default allocation and relocation on a large hall.
+
+Run from the repository root:
+    python -m benchmarks.bench_large_hall > bench_output.txt
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from models.cinema import Cinema
+from utils.booking_utils import get_seat_code
+
+
+def _measure(action: Callable[[], None], repeat: int) -> List[float]:
+    """Run an action repeatedly and measure every run in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _report(name: str, timings: List[float]) -> None:
+    """Print the median and the worst timing of an action."""
+    timings = sorted(timings)
+    median = timings[len(timings) // 2]
+    print(f"{name:<40} median {median:8.3f} ms   max {timings[-1]:8.3f} ms")
+
+
+def run(rows: int, cols: int, repeat: int) -> None:
+    """Run the benchmark on a hall of given dimensions.
+    Args:
+        rows(int): number of rows of the hall.
+        cols(int): number of seats in each row.
+        repeat(int): number of runs of every action.
+    """
+    print(f"Hall of {rows} x {cols} = {rows * cols} seats, {repeat} runs each")
+    _report(
+        "create hall", _measure(lambda: Cinema("Arena", rows, cols).seat_map, repeat)
+    )
+    cinema = Cinema("Arena", rows, cols)
+    for num_tickets in [1, 4, cols, cols * 5]:
+
+        def reserve_and_abandon():
+            cinema.create_default_booking(num_tickets)
+            cinema.abandon_booking()
+
+        _report(
+            f"default allocation of {num_tickets} tickets",
+            _measure(reserve_and_abandon, repeat),
+        )
+    mid_position = get_seat_code(rows // 2, cols // 2)
+    last_position = get_seat_code(rows - 1, cols - 1)
+    for num_tickets in [4, cols * 2]:
+        cinema.create_default_booking(num_tickets)
+        positions = iter([mid_position, last_position] * repeat)
+        _report(
+            f"relocation of {num_tickets} tickets",
+            _measure(lambda: cinema.change_seating_position(next(positions)), repeat),
+        )
+        cinema.abandon_booking()
+    _report("book 8 tickets", _measure(lambda: cinema.book_tickets(8), repeat))
+    _report("render screen", _measure(cinema.screen_display, repeat))
+    _report(
+        "fill the hall 50 tickets at a time",
+        _measure(
+            lambda: Cinema("Arena", rows, cols).create_bookings_batch(
+                [50] * (rows * cols // 50)
+            ),
+            1,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--cols", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    run(args.rows, args.cols, args.repeat)
@@ -0,0 +1,319 @@
+import json
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Tuple
+
+import utils.constants as consts
+import utils.messages as msg
+from models.booking import Booking
+from models.cinema import Cinema
+from models.show_catalog import ShowCatalog
+from utils.booking_utils import parse_booking_id, parse_seat_code
+from utils.validation import (
+    is_valid_show_id,
+    parse_hall_definition,
+    validate_number_of_tickets,
+    validate_string_input,
+)
+
+# The rows and seats per row of the hall of every show id.
+Halls = Dict[str, Tuple[int, int]]
+
+
+class BatchHandler:
+    def __init__(
+        self, catalog: Optional[ShowCatalog] = None, display: bool = False
+    ) -> None:
+        """Initialize the handler of non-interactive batch commands.
+            Every command is a JSON object on its own line, e.g.
+            {"command": "book", "show_id": "S1", "tickets": 4, "confirm": true}.
+            Every result is written as a JSON object on its own line.
+        Args:
+            catalog(ShowCatalog): the catalog of shows to run the commands on.
+                Start with an empty catalog by default.
+            display(bool): add the seat map to the result of every command.
+        """
+        if catalog is None:
+            catalog = ShowCatalog()
+        self.catalog = catalog
+        self.display = display
+        self.commands: Dict[str, Callable[[dict], dict]] = {
+            consts.BATCH_COMMAND_CREATE: self._create,
+            consts.BATCH_COMMAND_BOOK: self._book,
+            consts.BATCH_COMMAND_RELOCATE: self._relocate,
+            consts.BATCH_COMMAND_CONFIRM: self._confirm,
+            consts.BATCH_COMMAND_CHECK: self._check,
+            consts.BATCH_COMMAND_RELEASE: self._release,
+        }
+        self.validators: Dict[str, Callable[[dict, Halls], None]] = {
+            consts.BATCH_COMMAND_CREATE: self._validate_create,
+            consts.BATCH_COMMAND_BOOK: self._validate_book,
+            consts.BATCH_COMMAND_RELOCATE: self._validate_relocate,
+            consts.BATCH_COMMAND_CONFIRM: self._validate_show,
+            consts.BATCH_COMMAND_CHECK: self._validate_booking_id,
+            consts.BATCH_COMMAND_RELEASE: self._validate_booking_id,
+        }
+
+    def run(self, command_lines: Iterable[str], output: TextIO) -> int:
+        """Run a stream of commands and write their results.
+        Args:
+            command_lines(Iterable[str]): the lines of JSON commands.
+            output(TextIO): the stream to write the lines of JSON results to.
+        Returns:
+            the number of failed commands.
+        """
+        num_failed = 0
+        for line_number, command_line in enumerate(command_lines, start=1):
+            if command_line.strip() == "":
+                continue
+            result = self.handle_line(command_line)
+            if not result["ok"]:
+                num_failed += 1
+                result["line"] = line_number
+            output.write(json.dumps(result, separators=(",", ":")))
+            output.write("\n")
+        return num_failed
+
+    def validate(self, command_lines: Iterable[str], output: TextIO) -> int:
+        """Check a stream of commands without running them.
+            Shows created by earlier commands are taken into account, so show ids
+            and seating positions are checked against their halls.
+            Only the invalid commands get a result.
+        Args:
+            command_lines(Iterable[str]): the lines of JSON commands.
+            output(TextIO): the stream to write the lines of JSON results to.
+        Returns:
+            the number of invalid commands.
+        """
+        halls = {
+            show_id: (cinema.rows, cinema.seats_per_row)
+            for show_id, cinema in self.catalog.shows.items()
+        }
+        num_invalid = 0
+        for line_number, command_line in enumerate(command_lines, start=1):
+            if command_line.strip() == "":
+                continue
+            try:
+                command = _parse_command(command_line, self.validators)
+                self.validators[command["command"]](command, halls)
+            except (ValueError, KeyError) as error:
+                num_invalid += 1
+                result = {"ok": False, "error": str(error.args[0]), "line": line_number}
+                output.write(json.dumps(result, separators=(",", ":")))
+                output.write("\n")
+        return num_invalid
+
+    def handle_line(self, command_line: str) -> dict:
+        """Run one command.
+        Args:
+            command_line(str): a JSON command.
+        Returns:
+            the result of the command, with "ok" false and an "error" on failure.
+        """
+        try:
+            command = _parse_command(command_line, self.commands)
+            result = self.commands[command["command"]](command)
+        except (ValueError, KeyError) as error:
+            return {"ok": False, "error": str(error.args[0])}
+        if self._is_displayed(command) and "map" not in result:
+            cinema = self.catalog.get_show(
+                str(result.get("show_id") or command["show_id"])
+            )
+            result["map"] = list(cinema.screen_lines())
+        return {"ok": True, **result}
+
+    def _is_displayed(self, command: dict) -> bool:
+        """Check whether the seat map is added to the result of a command."""
+        return self.display or command.get("display", False)
+
+    def _create(self, command: dict) -> dict:
+        """Create a new show.
+        Args:
+            command(dict): the command with title, rows and seats_per_row,
+                and an optional show_id.
+        Returns:
+            the result with the show id.
+        """
+        movie_title, rows, seats_per_row = _parse_hall(command)
+        show_id = str(command.get("show_id", f"S{len(self.catalog) + 1}"))
+        cinema = self.catalog.add_show(show_id, movie_title, rows, seats_per_row)
+        return {"show_id": cinema.show_id}
+
+    def _book(self, command: dict) -> dict:
+        """Reserve tickets, optionally at a seating position and confirmed at once.
+        Args:
+            command(dict): the command with show_id and tickets,
+                an optional position and an optional confirm flag.
+            The seating position is checked before any seat is reserved, and the
+            reservation is released again if it cannot be moved there.
+        Returns:
+            the result with the booking id and seats.
+        """
+        cinema = self._get_cinema(command)
+        num_tickets = _parse_tickets(command)
+        seating_position = None
+        if "position" in command:
+            seating_position = _parse_position(cinema, command)
+        cinema.create_default_booking(num_tickets)
+        if seating_position is not None:
+            try:
+                cinema.change_seating_position(seating_position)
+            except (ValueError, KeyError):
+                cinema.abandon_booking()
+                raise
+        booking = cinema.current_booking
+        if command.get("confirm", False):
+            cinema.confirm_booking()
+        return _booking_result(cinema, booking)
+
+    def _relocate(self, command: dict) -> dict:
+        """Move the pending booking to a seating position.
+        Args:
+            command(dict): the command with show_id and position.
+        Returns:
+            the result with the booking id and seats.
+        """
+        cinema = self._get_cinema(command)
+        cinema.change_seating_position(_parse_position(cinema, command))
+        return _booking_result(cinema, cinema.current_booking)
+
+    def _confirm(self, command: dict) -> dict:
+        """Confirm the pending booking.
+        Args:
+            command(dict): the command with show_id.
+        Returns:
+            the result with the booking id and seats.
+        """
+        cinema = self._get_cinema(command)
+        booking = cinema.current_booking
+        cinema.confirm_booking()
+        return _booking_result(cinema, booking)
+
+    def _check(self, command: dict) -> dict:
+        """Check a confirmed booking.
+            Like the check dialog, its seats are highlighted on the seat map.
+        Args:
+            command(dict): the command with show_id and booking_id.
+        Returns:
+            the result with the booking id and seats.
+        """
+        cinema = self._get_cinema(command)
+        session = cinema.get_session(consts.DEFAULT_SESSION_ID)
+        processing_mode = session.processing_mode
+        cinema.start_checking()
+        try:
+            cinema.check_booking(str(_get_field(command, "booking_id")))
+            result = _booking_result(cinema, session.current_checking)
+            if self._is_displayed(command):
+                result["map"] = list(cinema.screen_lines())
+        finally:
+            session.processing_mode = processing_mode
+        return result
+
+    def _release(self, command: dict) -> dict:
+        """Release a confirmed booking.
+        Args:
+            command(dict): the command with show_id and booking_id.
+        Returns:
+            the result with the booking id.
+        """
+        cinema = self._get_cinema(command)
+        booking_id = str(_get_field(command, "booking_id")).upper()
+        cinema.release_booking(booking_id)
+        return {"booking_id": booking_id}
+
+    def _get_cinema(self, command: dict) -> Cinema:
+        """Get the show of the command."""
+        return self.catalog.get_show(str(_get_field(command, "show_id")))
+
+    def _validate_create(self, command: dict, halls: Halls) -> None:
+        """Check a create command and remember the hall of the new show."""
+        _, rows, seats_per_row = _parse_hall(command)
+        show_id = str(command.get("show_id", f"S{len(halls) + 1}")).upper()
+        if not is_valid_show_id(show_id):
+            raise ValueError(msg.MSG_INVALID_SHOW_ID)
+        if show_id in halls:
+            raise ValueError(msg.MSG_DUPLICATED_SHOW_ID.format(show_id=show_id))
+        halls[show_id] = (rows, seats_per_row)
+
+    def _validate_book(self, command: dict, halls: Halls) -> None:
+        """Check a book command."""
+        self._validate_show(command, halls)
+        _parse_tickets(command)
+        if "position" in command:
+            self._validate_relocate(command, halls)
+
+    def _validate_relocate(self, command: dict, halls: Halls) -> None:
+        """Check a relocate command."""
+        rows, seats_per_row = self._validate_show(command, halls)
+        seating_position = str(_get_field(command, "position"))
+        if parse_seat_code(seating_position, rows, seats_per_row) is None:
+            raise ValueError(msg.MSG_INVALID_SEATING_POSITION)
+
+    def _validate_booking_id(self, command: dict, halls: Halls) -> None:
+        """Check a check or release command."""
+        self._validate_show(command, halls)
+        parse_booking_id(str(_get_field(command, "booking_id")))
+
+    @staticmethod
+    def _validate_show(command: dict, halls: Halls) -> Tuple[int, int]:
+        """Check the show of a command and get the dimensions of its hall."""
+        show_id = str(_get_field(command, "show_id")).upper()
+        if show_id not in halls:
+            raise ValueError(msg.MSG_NOT_EXIST_SHOW_ID.format(show_id=show_id))
+        return halls[show_id]
+
+
+def _parse_command(command_line: str, commands: Dict[str, Callable]) -> dict:
+    """Decode a JSON command and check its name."""
+    command = json.loads(command_line)
+    if not isinstance(command, dict):
+        raise ValueError(msg.MSG_INVALID_BATCH_COMMAND.format(command=command))
+    name = command.get("command")
+    if not isinstance(name, str) or name not in commands:
+        raise ValueError(msg.MSG_INVALID_BATCH_COMMAND.format(command=name))
+    return command
+
+
+def _parse_hall(command: dict) -> Tuple[str, int, int]:
+    """Parse the movie title, rows and seats per row of a create command."""
+    hall_definition = parse_hall_definition(
+        " ".join(
+            str(_get_field(command, field))
+            for field in ("title", "rows", "seats_per_row")
+        )
+    )
+    if hall_definition is None:
+        raise ValueError(msg.MSG_INVALID_MOVIE_TITLE_ROWS_SEATS_PER_ROW)
+    return hall_definition
+
+
+def _parse_tickets(command: dict) -> int:
+    """Parse the number of tickets of a book command."""
+    is_valid, num_tickets = validate_number_of_tickets(
+        str(_get_field(command, "tickets"))
+    )
+    if not is_valid:
+        raise ValueError(msg.MSG_INVALID_NUMBER_OF_TICKETS)
+    return num_tickets
+
+
+def _parse_position(cinema: Cinema, command: dict) -> str:
+    """Parse the seating position of a book or relocate command."""
+    is_valid, seating_position = validate_string_input(
+        str(_get_field(command, "position"))
+    )
+    if not is_valid or not cinema.is_seating_position_exist(seating_position):
+        raise ValueError(msg.MSG_INVALID_SEATING_POSITION)
+    return seating_position
+
+
+def _get_field(command: dict, field: str):
+    """Get a required field of a command."""
+    if field not in command:
+        raise KeyError(msg.MSG_MISSING_BATCH_FIELD.format(field=field))
+    return command[field]
+
+
+def _booking_result(cinema: Cinema, booking: Booking) -> dict:
+    """Describe a booking of a show as a result."""
+    seats: List[str] = [cinema.seat_codes[row][col] for row, col in booking.positions()]
+    return {"booking_id": booking.booking_id, "status": booking.status, "seats": seats}
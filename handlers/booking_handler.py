@@ -1,62 +1,119 @@
-from typing import Optional
+from typing import Optional, Sequence
 
+import utils.constants as consts
 import utils.messages as msg
 from handlers.cinema.cinema_creation_handler import CinemaCreationHandler
-from handlers.cinema.cinema_handler_factory import CinemaHandlerFactory
+from handlers.cinema.cinema_handler import CinemaHandler
+from handlers.cinema.cinema_handler_registry import (
+    CinemaHandlerRegistry,
+    MenuOption,
+)
+from handlers.cinema.show_selection_handler import ShowSelectionHandler
 from handlers.io.console_io_handler import ConsoleIOHandler
 from handlers.io.io_handler import IOHandler
 from models.cinema import Cinema
+from models.show_catalog import ShowCatalog
 from utils.validation import validate_menu_selection
 
 
 class BookingHandler:
-    def __init__(self, io_handler: IOHandler = None) -> None:
+    def __init__(
+        self,
+        io_handler: IOHandler = None,
+        catalog: Optional[ShowCatalog] = None,
+        menu_options: Optional[Sequence[MenuOption]] = None,
+    ) -> None:
         """Initialize the handler for Cinema booking management system.
         Args:
             io_handler(IOHandler): the handler of input and output.
                 Use console input and output by default.
+            catalog(ShowCatalog): the catalog of shows to select from.
+                Create a single cinema from input by default.
+            menu_options(Sequence[MenuOption]): the options of the main menu.
+                Use booking, checking and exit by default.
         """
         if io_handler is None:
             io_handler = ConsoleIOHandler()
         self.io_handler: IOHandler = io_handler
+        self.catalog: Optional[ShowCatalog] = catalog
         self.cinema: Optional[Cinema] = None
+        self.session_id: str = consts.DEFAULT_SESSION_ID
+        self.state: Optional[str] = None
+        self.cinema_creation_handler = CinemaCreationHandler(self.io_handler)
+        self.show_selection_handler = ShowSelectionHandler(self.io_handler)
+        self.cinema_handler: Optional[CinemaHandler] = None
+        self.cinema_handler_registry = CinemaHandlerRegistry(
+            self.io_handler, menu_options
+        )
 
     def run(self) -> None:
-        """Run the cinema booking processes."""
-        self.cinema = CinemaCreationHandler().run()
-        self._main_menu()
+        """Run the cinema booking processes, reading input until exit.
+        A show selected from the catalog is shared with other customers,
+        so the bookings are done in a session of its own.
+        """
+        self.start()
+        try:
+            while True:
+                self.handle_input(self.io_handler.input())
+        finally:
+            self.close()
 
-    def _main_menu(self) -> None:
-        """Display main menu."""
-        option = self._input_menu_selection()
-        self._get_handler(option)
+    def start(self) -> None:
+        """Start the dialog by asking for the cinema to book."""
+        if self.catalog is None:
+            self.state = consts.DIALOG_STATE_CREATE_CINEMA
+            self.cinema_creation_handler.start()
+        else:
+            self.state = consts.DIALOG_STATE_SELECT_SHOW
+            self.show_selection_handler.start(self.catalog)
 
-    def _get_handler(self, option: str) -> None:
-        """Process ticket booking.
+    def handle_input(self, input_str: str) -> None:
+        """Handle one line of input and move the dialog to its next state.
         Args:
-            option(str): a menu selection.
+            input_str(str): a line of input.
         """
-        cinema_handler = CinemaHandlerFactory.get_handler(option)
-        cinema_handler.run(self.cinema)
-        self._main_menu()
-
-    def _input_menu_selection(self) -> str:
-        """Select an option from the menu.
-        Returns:
-            a menu selection.
+        match self.state:
+            case consts.DIALOG_STATE_CREATE_CINEMA:
+                cinema = self.cinema_creation_handler.handle_input(input_str)
+                if cinema is not None:
+                    self.cinema = cinema
+                    self._enter_main_menu()
+            case consts.DIALOG_STATE_SELECT_SHOW:
+                cinema = self.show_selection_handler.handle_input(input_str)
+                if cinema is not None:
+                    self.cinema = cinema
+                    self.session_id = self.cinema.open_session()
+                    self._enter_main_menu()
+            case consts.DIALOG_STATE_MAIN_MENU:
+                self._handle_menu_selection(input_str)
+            case consts.DIALOG_STATE_CINEMA_HANDLER:
+                if not self.cinema_handler.handle_input(input_str):
+                    self._enter_main_menu()
+
+    def close(self) -> None:
+        """Close the booking session and release its pending reservation."""
+        if self.cinema is not None and self.session_id in self.cinema.sessions:
+            self.cinema.close_session(self.session_id)
+
+    def _enter_main_menu(self) -> None:
+        """Display main menu."""
+        self.state = consts.DIALOG_STATE_MAIN_MENU
+        self.cinema_handler = None
+        self.io_handler.output(self.cinema_handler_registry.menu(self.cinema))
+
+    def _handle_menu_selection(self, selection_str: str) -> None:
+        """Start the handler of the selected menu option.
+        Args:
+            selection_str(str): the input of the menu selection.
         """
-        is_valid_selection = False
-        selection = None
-        menu_str = msg.MSG_WELCOME.format(
-            movie_title=self.cinema.movie_title,
-            seats_available=self.cinema.available_seats,
+        is_valid, option = validate_menu_selection(
+            selection_str, self.cinema_handler_registry.handlers
         )
-        while not is_valid_selection:
-            self.io_handler.output(menu_str)
-            selection_str = self.io_handler.input()
-            is_valid, selection = validate_menu_selection(selection_str)
-            if not is_valid:
-                self.io_handler.output(msg.MSG_INVALID_MENU_SELECTION)
-            else:
-                is_valid_selection = True
-        return selection
+        if not is_valid:
+            self.io_handler.output(msg.MSG_INVALID_MENU_SELECTION)
+            self._enter_main_menu()
+            return
+        self.cinema_handler = self.cinema_handler_registry.get_handler(option)
+        self.state = consts.DIALOG_STATE_CINEMA_HANDLER
+        if not self.cinema_handler.start(self.cinema, self.session_id):
+            self._enter_main_menu()
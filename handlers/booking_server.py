@@ -0,0 +1,62 @@
+import asyncio
+
+import utils.constants as consts
+from handlers.booking_handler import BookingHandler
+from handlers.io.async_io_handler import AsyncIOHandler
+from models.show_catalog import ShowCatalog
+
+
+class BookingServer:
+    def __init__(self, catalog: ShowCatalog, host: str, port: int) -> None:
+        """Initialize the TCP server of the booking system.
+            Every client runs the booking dialog on the shows of the same catalog.
+        Args:
+            catalog(ShowCatalog): the catalog of shows shared by all clients.
+            host(str): the host to listen on.
+            port(int): the port to listen on.
+        """
+        self.catalog = catalog
+        self.host = host
+        self.port = port
+
+    def run(self) -> None:
+        """Run the server until it is interrupted."""
+        asyncio.run(self.serve_forever())
+
+    async def serve_forever(self) -> None:
+        """Start the server and serve clients forever."""
+        server = await self.start()
+        async with server:
+            await server.serve_forever()
+
+    async def start(self) -> asyncio.Server:
+        """Start listening for clients.
+        Returns:
+            the started server.
+        """
+        return await asyncio.start_server(
+            self.handle_client, self.host, self.port, backlog=consts.SERVER_BACKLOG
+        )
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client until the dialog ends or the client disconnects.
+            The dialog is a state machine fed one line at a time,
+            so an idle client only holds its connection and dialog state.
+        Args:
+            reader(asyncio.StreamReader): the reader of the connection.
+            writer(asyncio.StreamWriter): the writer of the connection.
+        """
+        io_handler = AsyncIOHandler(reader, writer)
+        booking_handler = BookingHandler(io_handler, self.catalog)
+        try:
+            booking_handler.start()
+            while True:
+                await io_handler.drain()
+                booking_handler.handle_input(await io_handler.read_line())
+        except (SystemExit, EOFError, ConnectionError):
+            pass
+        finally:
+            booking_handler.close()
+            await io_handler.close()
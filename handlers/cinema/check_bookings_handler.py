@@ -1,3 +1,4 @@
+import utils.constants as consts
 import utils.messages as msg
 from handlers.cinema.cinema_handler import CinemaHandler
 from handlers.io.io_handler import IOHandler
@@ -10,51 +11,50 @@ class CheckBookingsHandler(CinemaHandler):
         """Initialize the handler for check bookings."""
         super().__init__(io_handler)
         self.cinema = None
+        self.session_id = consts.DEFAULT_SESSION_ID
 
-    def run(self, cinema: Cinema) -> None:
+    def start(
+        self, cinema: Cinema, session_id: str = consts.DEFAULT_SESSION_ID
+    ) -> bool:
         """Start check bookings process.
         Args:
             cinema(Cinema): a given cinema to process check bookings.
+            session_id(str): the token of the booking session on the cinema.
+        Returns:
+            a boolean value to indicate the handler is waiting for input or not.
         """
         self.cinema = cinema
-        self.cinema.start_checking()
-        while True:
-            booking_id = self._input_booking_id()
-            if booking_id is None:
-                break
-            else:
-                self.cinema.check_booking(booking_id)
-                self._display_current_checking()
-        self.cinema.exit_processing()
+        self.session_id = session_id
+        self.cinema.start_checking(self.session_id)
+        self.io_handler.output(msg.MSG_INPUT_BOOKING_ID)
+        return True
 
-    def _input_booking_id(self) -> str:
-        """Input booking to check.
+    def handle_input(self, booking_id_str: str) -> bool:
+        """Handle the booking id to check.
+        Args:
+            booking_id_str(str): the input of the booking id.
         Returns:
-            a booking id
+            a boolean value to indicate the handler is waiting for more input or not.
         """
-        is_valid_input = False
-        booking_id = None
-        while not is_valid_input:
-            self.io_handler.output(msg.MSG_INPUT_BOOKING_ID)
-            booking_id_str = self.io_handler.input()
-            if booking_id_str == "":
-                booking_id = None
-                break
-            is_valid, booking_id = validate_string_input(booking_id_str)
-            if not is_valid:
-                self.io_handler.output(msg.MSG_INVALID_BOOKING_ID)
-            else:
-                is_booking_id_exist = self.cinema.is_booking_id_exist(booking_id)
-                if not is_booking_id_exist:
-                    self.io_handler.output(
-                        msg.MSG_NOT_EXIST_BOOKING_ID.format(booking_id=booking_id)
-                    )
-                else:
-                    is_valid_input = True
-        return booking_id
+        if booking_id_str == "":
+            self.cinema.exit_processing(self.session_id)
+            return False
+        is_valid, booking_id = validate_string_input(booking_id_str)
+        if not is_valid:
+            self.io_handler.output(msg.MSG_INVALID_BOOKING_ID)
+        elif not self.cinema.is_booking_id_exist(booking_id):
+            self.io_handler.output(
+                msg.MSG_NOT_EXIST_BOOKING_ID.format(booking_id=booking_id)
+            )
+        else:
+            self.cinema.check_booking(booking_id, self.session_id)
+            self._display_current_checking()
+        self.io_handler.output(msg.MSG_INPUT_BOOKING_ID)
+        return True
 
     def _display_current_checking(self) -> None:
         """Display the current checking and seat map to output."""
-        booking_id = self.cinema.current_checking.booking_id
+        session = self.cinema.get_session(self.session_id)
+        booking_id = session.current_checking.booking_id
         self.io_handler.output(msg.MSG_OUTPUT_BOOKING_ID.format(booking_id=booking_id))
-        self.io_handler.output(self.cinema.screen_display())
+        self.io_handler.output_lines(self.cinema.screen_lines(self.session_id))
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import utils.messages as msg
 from handlers.io.console_io_handler import ConsoleIOHandler
 from handlers.io.io_handler import IOHandler
@@ -21,25 +23,27 @@ class CinemaCreationHandler:
         Returns:
             a new object of Cinema.
         """
-        self.io_handler.output(msg.MSG_BEGIN)
-        movie_title, rows, seats_per_row = self._input_title_rows_seats_per_row()
-        cinema = Cinema(movie_title, rows, seats_per_row)
+        self.start()
+        cinema = None
+        while cinema is None:
+            cinema = self.handle_input(self.io_handler.input())
         return cinema
 
-    def _input_title_rows_seats_per_row(self) -> tuple:
-        """Input movie title, rows and seats per row.
+    def start(self) -> None:
+        """Output the prompt of movie title, rows and seats per row."""
+        self.io_handler.output(msg.MSG_BEGIN)
+
+    def handle_input(self, title_rows_seats_per_row_str: str) -> Optional[Cinema]:
+        """Handle the input of movie title, rows and seats per row.
+        Args:
+            title_rows_seats_per_row_str(str): the input of the hall definition.
         Returns:
-            a tuple of movie title, rows and seats per row.
+            a new object of Cinema, or None when the input is invalid.
         """
-        is_valid_input = False
-        movie_title, rows, seats_per_row = None, None, None
-        while not is_valid_input:
-            title_rows_seats_per_row_str = self.io_handler.input()
-            is_valid, movie_title, rows, seats_per_row = (
-                validate_title_rows_seats_per_row(title_rows_seats_per_row_str)
-            )
-            if not is_valid:
-                self.io_handler.output(msg.MSG_INVALID_MOVIE_TITLE_ROWS_SEATS_PER_ROW)
-            else:
-                is_valid_input = True
-        return movie_title, rows, seats_per_row
+        is_valid, movie_title, rows, seats_per_row = validate_title_rows_seats_per_row(
+            title_rows_seats_per_row_str
+        )
+        if not is_valid:
+            self.io_handler.output(msg.MSG_INVALID_MOVIE_TITLE_ROWS_SEATS_PER_ROW)
+            return None
+        return Cinema(movie_title, rows, seats_per_row)
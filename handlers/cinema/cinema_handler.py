@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+import utils.constants as consts
 from handlers.io.console_io_handler import ConsoleIOHandler
 from handlers.io.io_handler import IOHandler
 from models.cinema import Cinema
@@ -16,7 +17,34 @@ class CinemaHandler(ABC):
             io_handler = ConsoleIOHandler()
         self.io_handler = io_handler
 
+    def run(self, cinema: Cinema, session_id: str = consts.DEFAULT_SESSION_ID) -> None:
+        """Start run the handler, reading input until the handler is done.
+        Args:
+            cinema(Cinema): a given cinema to process.
+            session_id(str): the token of the booking session on the cinema.
+        """
+        is_waiting = self.start(cinema, session_id)
+        while is_waiting:
+            is_waiting = self.handle_input(self.io_handler.input())
+
     @abstractmethod
-    def run(self, cinema: Cinema) -> None:
-        """Start run the handler."""
-        raise NotImplementedError("run() should be implemented in subclasses.")
+    def start(
+        self, cinema: Cinema, session_id: str = consts.DEFAULT_SESSION_ID
+    ) -> bool:
+        """Start the handler and output its first prompt.
+        Args:
+            cinema(Cinema): a given cinema to process.
+            session_id(str): the token of the booking session on the cinema.
+        Returns:
+            a boolean value to indicate the handler is waiting for input or not.
+        """
+        raise NotImplementedError("start() should be implemented in subclasses.")
+
+    def handle_input(self, input_str: str) -> bool:
+        """Handle one line of input.
+        Args:
+            input_str(str): a line of input.
+        Returns:
+            a boolean value to indicate the handler is waiting for more input or not.
+        """
+        return False
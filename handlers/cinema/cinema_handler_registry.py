@@ -0,0 +1,95 @@
+from typing import Dict, List, NamedTuple, Optional, Sequence, Type
+
+import utils.constants as consts
+import utils.messages as msg
+from handlers.cinema.check_bookings_handler import CheckBookingsHandler
+from handlers.cinema.cinema_handler import CinemaHandler
+from handlers.cinema.exit_handler import ExitHandler
+from handlers.cinema.ticket_booking_handler import TicketBookingHandler
+from handlers.io.io_handler import IOHandler
+from models.cinema import Cinema
+
+
+class MenuOption(NamedTuple):
+    option: str
+    label: str
+    handler_class: Type[CinemaHandler]
+
+
+DEFAULT_MENU_OPTIONS = (
+    MenuOption(
+        consts.MENU_OPTION_BOOK_TICKETS,
+        msg.MSG_MENU_BOOK_TICKETS,
+        TicketBookingHandler,
+    ),
+    MenuOption(
+        consts.MENU_OPTION_CHECK_BOOKINGS,
+        msg.MSG_MENU_CHECK_BOOKINGS,
+        CheckBookingsHandler,
+    ),
+    MenuOption(consts.MENU_OPTION_EXIT, msg.MSG_MENU_EXIT, ExitHandler),
+)
+
+
+class CinemaHandlerRegistry:
+    def __init__(
+        self,
+        io_handler: IOHandler,
+        menu_options: Optional[Sequence[MenuOption]] = None,
+    ) -> None:
+        """Initialize the handlers of the menu options for one booking session.
+            Every handler is created once with the session's handler of input
+            and output, and reused whenever its option is selected.
+        Args:
+            io_handler(IOHandler): the handler of input and output of the session.
+            menu_options(Sequence[MenuOption]): the options of the menu in order.
+                Use booking, checking and exit by default.
+        """
+        self.io_handler = io_handler
+        self.handlers: Dict[str, CinemaHandler] = {}
+        self.labels: List[str] = []
+        self.menu_template = ""
+        for menu_option in menu_options or DEFAULT_MENU_OPTIONS:
+            self.register(menu_option)
+
+    def register(self, menu_option: MenuOption) -> None:
+        """Register a handler for a new menu option.
+            The label of a custom option is shown as literal text.
+        Args:
+            menu_option(MenuOption): the option, its label and its handler class.
+        """
+        if menu_option.option in self.handlers:
+            raise ValueError(
+                msg.MSG_DUPLICATED_MENU_OPTION.format(option=menu_option.option)
+            )
+        self.handlers[menu_option.option] = menu_option.handler_class(self.io_handler)
+        label = msg.MSG_MENU_OPTION.format(
+            option=menu_option.option, label=menu_option.label
+        )
+        if menu_option not in DEFAULT_MENU_OPTIONS:
+            # Only the built-in labels have fields, the others are shown as is.
+            label = label.replace("{", "{{").replace("}", "}}")
+        self.labels.append(label)
+        self.menu_template = "\n".join(
+            [msg.MSG_WELCOME, *self.labels, msg.MSG_MENU_SELECTION]
+        )
+
+    def get_handler(self, option: str) -> CinemaHandler:
+        """Get the handler of given option to start next steps.
+        Args:
+            option(str): a menu selection.
+        Returns:
+            the handler of the option.
+        """
+        return self.handlers[option]
+
+    def menu(self, cinema: Cinema) -> str:
+        """Render the menu for given cinema.
+        Args:
+            cinema(Cinema): the cinema of the booking session.
+        Returns:
+            the text of the menu.
+        """
+        return self.menu_template.format(
+            movie_title=cinema.movie_title, seats_available=cinema.available_seats
+        )
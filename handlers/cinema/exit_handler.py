@@ -1,3 +1,4 @@
+import utils.constants as consts
 import utils.messages as msg
 from handlers.cinema.cinema_handler import CinemaHandler
 from handlers.io.io_handler import IOHandler
@@ -10,7 +11,10 @@ class ExitHandler(CinemaHandler):
         super().__init__(io_handler)
         self.cinema = None
 
-    def run(self, cinema: Cinema) -> None:
+    def start(
+        self, cinema: Cinema, session_id: str = consts.DEFAULT_SESSION_ID
+    ) -> bool:
         """Exit booking system."""
         self.io_handler.output(msg.MSG_OUTPUT_GOODBYE)
         self.io_handler.exit()
+        return False
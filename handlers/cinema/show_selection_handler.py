@@ -0,0 +1,76 @@
+from typing import Optional
+
+import utils.constants as consts
+import utils.messages as msg
+from handlers.io.console_io_handler import ConsoleIOHandler
+from handlers.io.io_handler import IOHandler
+from models.cinema import Cinema
+from models.show_catalog import ShowCatalog
+from utils.validation import validate_string_input
+
+
+class ShowSelectionHandler:
+    def __init__(self, io_handler: IOHandler = None) -> None:
+        """Initialize the handler for show selection.
+        Args:
+            io_handler(IOHandler): the handler of input and output.
+                Use console input and output by default.
+        """
+        if io_handler is None:
+            io_handler = ConsoleIOHandler()
+        self.io_handler = io_handler
+        self.catalog: Optional[ShowCatalog] = None
+
+    def run(self, catalog: ShowCatalog) -> Cinema:
+        """Start show selection process.
+        Args:
+            catalog(ShowCatalog): the catalog of shows to select from.
+        Returns:
+            the cinema of the selected show.
+        """
+        self.start(catalog)
+        cinema = None
+        while cinema is None:
+            cinema = self.handle_input(self.io_handler.input())
+        return cinema
+
+    def start(self, catalog: ShowCatalog) -> None:
+        """Display all shows of the catalog and output the prompt of show id.
+        Args:
+            catalog(ShowCatalog): the catalog of shows to select from.
+        """
+        self.catalog = catalog
+        self._display_shows()
+        self.io_handler.output(msg.MSG_INPUT_SHOW_ID)
+
+    def handle_input(self, show_id_str: str) -> Optional[Cinema]:
+        """Handle the input of show id.
+        Args:
+            show_id_str(str): the input of the show id.
+        Returns:
+            the cinema of the selected show, or None when the input is invalid.
+        """
+        is_valid, show_id = validate_string_input(show_id_str)
+        if not is_valid:
+            self.io_handler.output(msg.MSG_INVALID_SHOW_ID)
+        elif not self.catalog.is_show_id_exist(show_id):
+            self.io_handler.output(msg.MSG_NOT_EXIST_SHOW_ID.format(show_id=show_id))
+        else:
+            return self.catalog.get_show(show_id)
+        self.io_handler.output(msg.MSG_INPUT_SHOW_ID)
+        return None
+
+    def _display_shows(self) -> None:
+        """Display all shows of the catalog to output."""
+        for cinema in self.catalog.list_shows():
+            start_time = msg.MSG_INFO_NO_START_TIME
+            if cinema.start_time is not None:
+                start_time = cinema.start_time.strftime(consts.SHOW_START_TIME_FORMAT)
+            self.io_handler.output(
+                msg.MSG_OUTPUT_SHOW.format(
+                    show_id=cinema.show_id,
+                    movie_title=cinema.movie_title,
+                    start_time=start_time,
+                    seats_available=cinema.available_seats,
+                )
+            )
@@ -0,0 +1,53 @@
+import asyncio
+
+import utils.messages as msg
+from handlers.io.io_handler import IOHandler
+
+
+class AsyncIOHandler(IOHandler):
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Initialize the handler of input and output with a stream connection.
+            The dialog is fed line by line with read_line() on the event loop,
+            its output is buffered by the stream and flushed with drain(),
+            so a slow client never blocks the other clients.
+        Args:
+            reader(asyncio.StreamReader): the reader of the connection.
+            writer(asyncio.StreamWriter): the writer of the connection.
+        """
+        self.reader = reader
+        self.writer = writer
+
+    async def read_line(self) -> str:
+        """Read one line from the connection, without the line break."""
+        line = await self.reader.readline()
+        if not line:
+            raise EOFError
+        return line.decode().rstrip("\r\n")
+
+    async def drain(self) -> None:
+        """Wait until the buffered output is flushed to the connection."""
+        await self.writer.drain()
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if not self.writer.is_closing():
+            self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    def input(self) -> str:
+        """Blocking input is not supported, use read_line() instead."""
+        raise RuntimeError(msg.MSG_INVALID_BLOCKING_INPUT)
+
+    def output(self, output_str: str) -> None:
+        """Handle output with the connection without waiting for the client."""
+        self.writer.write(f"{output_str}\n".encode())
+
+    def exit(self) -> None:
+        """Handle exit by closing the connection after the buffered output."""
+        self.writer.close()
+        raise SystemExit(0)
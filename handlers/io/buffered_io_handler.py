@@ -0,0 +1,64 @@
+import sys
+from typing import Iterable, List, Optional, TextIO
+
+import utils.constants as consts
+from handlers.io.io_handler import IOHandler
+
+
+class BufferedIOHandler(IOHandler):
+    def __init__(
+        self,
+        input_stream: Optional[TextIO] = None,
+        output_stream: Optional[TextIO] = None,
+        buffer_size: int = consts.OUTPUT_BUFFER_SIZE,
+    ) -> None:
+        """Initialize the handler of input and output with buffered output.
+            The output is collected in memory and written at once when input is
+            requested, on exit, or when the buffer reaches the buffer size.
+        Args:
+            input_stream(TextIO): the stream to read input from, stdin by default.
+            output_stream(TextIO): the stream to write output to, stdout by default.
+            buffer_size(int): the number of characters which triggers a flush.
+        """
+        self.input_stream = input_stream if input_stream is not None else sys.stdin
+        self.output_stream = output_stream if output_stream is not None else sys.stdout
+        self.buffer_size = buffer_size
+        self.buffer: List[str] = []
+        self.buffered_size = 0
+
+    def input(self) -> str:
+        """Flush the buffered output, then handle input with the input stream."""
+        self.flush()
+        line = self.input_stream.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
+
+    def output(self, output_str: str) -> None:
+        """Buffer a line of output."""
+        self._append(f"{output_str}\n")
+
+    def output_lines(self, output_lines: Iterable[str]) -> None:
+        """Buffer many lines of output as they are produced."""
+        for output_str in output_lines:
+            self._append(f"{output_str}\n")
+
+    def flush(self) -> None:
+        """Write the buffered output to the output stream with a single write."""
+        if self.buffer:
+            self.output_stream.write("".join(self.buffer))
+            self.buffer.clear()
+            self.buffered_size = 0
+        self.output_stream.flush()
+
+    def exit(self) -> None:
+        """Flush the buffered output and exit."""
+        self.flush()
+        sys.exit(0)
+
+    def _append(self, output_str: str) -> None:
+        """Append to the buffer, flush it when it reaches the buffer size."""
+        self.buffer.append(output_str)
+        self.buffered_size += len(output_str)
+        if self.buffered_size >= self.buffer_size:
+            self.flush()
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 
 class IOHandler(ABC):
@@ -12,6 +13,11 @@ class IOHandler(ABC):
         """Handle output."""
         raise NotImplementedError("output() should be implemented in subclasses.")
 
+    def output_lines(self, output_lines: Iterable[str]) -> None:
+        """Handle output of many lines, one by one."""
+        for output_str in output_lines:
+            self.output(output_str)
+
     @abstractmethod
     def exit(self) -> None:
         """Handle exit."""
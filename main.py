@@ -1,10 +1,160 @@
+import argparse
+import sys
+from typing import List, Optional
+
+import utils.constants as consts
+import utils.messages as msg
+from handlers.batch_handler import BatchHandler
 from handlers.booking_handler import BookingHandler
+from handlers.booking_server import BookingServer
+from handlers.io.buffered_io_handler import BufferedIOHandler
+from models.show_catalog import ShowCatalog
+from storage.booking_store import BookingStore
+from utils.validation import validate_title_rows_seats_per_row
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse the command line arguments.
+    Args:
+        argv(list): the command line arguments.
+    Returns:
+        the parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="GIC Cinemas booking system")
+    parser.add_argument("--serve", action="store_true", help="serve clients over TCP")
+    parser.add_argument("--host", default=consts.DEFAULT_SERVER_HOST)
+    parser.add_argument("--port", type=int, default=consts.DEFAULT_SERVER_PORT)
+    parser.add_argument(
+        "--batch",
+        metavar="PATH",
+        help="run JSON line commands from a file, or from stdin with -",
+    )
+    parser.add_argument(
+        "--display",
+        action="store_true",
+        help="add the seat map to every batch result",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only check the batch commands and report the invalid ones",
+    )
+    parser.add_argument(
+        "--buffered",
+        action="store_true",
+        help="write the console output in one go before every input",
+    )
+    parser.add_argument(
+        "--data-dir",
+        metavar="DIR",
+        help="persist the bookings of the shows in a directory",
+    )
+    parser.add_argument(
+        "--store",
+        metavar="PATH",
+        help="keep the bookings of the shows in a SQLite database",
+    )
+    parser.add_argument(
+        "--show",
+        action="append",
+        default=[],
+        help="a show to select from in [Title] [Row] [SeatsPerRow] format",
+    )
+    args = parser.parse_args(argv)
+    if args.serve and not args.show:
+        parser.error(msg.MSG_INVALID_SHOW_DEFINITION.format(show=""))
+    return args
+
+
+def build_catalog(
+    shows: List[str],
+    thread_safe: bool = True,
+    data_dir: Optional[str] = None,
+    store_path: Optional[str] = None,
+) -> ShowCatalog:
+    """Build a catalog of shows.
+    Args:
+        shows(list): the shows in [Title] [Row] [SeatsPerRow] format.
+        thread_safe(bool): create shows which can be booked concurrently.
+        data_dir(str): the directory to persist the bookings of the shows in.
+        store_path(str): the SQLite database to keep the bookings of the shows in.
+    Returns:
+        a catalog with shows identified as S1, S2, ...
+    """
+    store = BookingStore(store_path) if store_path is not None else None
+    catalog = ShowCatalog(thread_safe=thread_safe, data_dir=data_dir, store=store)
+    for number, show in enumerate(shows, start=1):
+        is_valid, movie_title, rows, seats_per_row = validate_title_rows_seats_per_row(
+            show
+        )
+        if not is_valid:
+            raise ValueError(msg.MSG_INVALID_SHOW_DEFINITION.format(show=show))
+        show_id = f"{consts.SERVER_SHOW_ID_PREFIX}{number}"
+        catalog.add_show(show_id, movie_title, rows, seats_per_row)
+    return catalog
+
+
+def run_batch(
+    path: str, catalog: ShowCatalog, display: bool, check: bool = False
+) -> int:
+    """Run the JSON line commands of a file and write the results to stdout.
+    Args:
+        path(str): the path of the file, or - for stdin.
+        catalog(ShowCatalog): the catalog of shows to run the commands on.
+        display(bool): add the seat map to every result.
+        check(bool): only check the commands and write the invalid ones.
+    Returns:
+        the number of failed, or invalid, commands.
+    """
+    batch_handler = BatchHandler(catalog, display)
+    handle = batch_handler.validate if check else batch_handler.run
+    if path == "-":
+        return handle(sys.stdin, sys.stdout)
+    with open(path, encoding="utf-8") as command_lines:
+        return handle(command_lines, sys.stdout)
 
 
-def main() -> None:
-    booking_handler = BookingHandler()
-    booking_handler.run()
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv or [])
+    if args.serve:
+        catalog = build_catalog(
+            args.show, data_dir=args.data_dir, store_path=args.store
+        )
+        print(msg.MSG_INFO_SERVING.format(host=args.host, port=args.port))
+        try:
+            BookingServer(catalog, args.host, args.port).run()
+        finally:
+            catalog.close()
+        return
+    if args.batch is not None:
+        catalog = build_catalog(
+            args.show,
+            thread_safe=False,
+            data_dir=args.data_dir,
+            store_path=args.store,
+        )
+        try:
+            num_failed = run_batch(args.batch, catalog, args.display, args.check)
+        finally:
+            catalog.close()
+        if num_failed > 0:
+            sys.exit(1)
+        return
+    io_handler = BufferedIOHandler() if args.buffered else None
+    if not args.show:
+        BookingHandler(io_handler).run()
+        return
+    catalog = build_catalog(
+        args.show,
+        thread_safe=False,
+        data_dir=args.data_dir,
+        store_path=args.store,
+    )
+    try:
+        BookingHandler(io_handler, catalog).run()
+    finally:
+        catalog.close()
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
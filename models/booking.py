@@ -1,13 +1,20 @@
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import utils.constants as consts
 import utils.messages as msg
 from models.seat import Seat
 
+BOOKING_STATUS_SEAT_CODES = {
+    consts.BOOKING_STATUS_RESERVED: consts.SEAT_CODE_RESERVED,
+    consts.BOOKING_STATUS_CONFIRMED: consts.SEAT_CODE_BOOKED,
+}
+
 
 class Booking:
     def __init__(self, booking_id: str, status: str, seats: List[Seat]):
         """Initialize an object of the booking.
+            The seats of a seat map are kept as (row, start_col, length) runs of
+            adjacent seats, and only turned into Seat objects on request.
         Args:
             booking_id(str): unique identifier of the booking.
             status(str): the state of the booking. Either Reserved or Confirmed.
@@ -15,24 +22,84 @@ class Booking:
                 If booking status is Reserved, then all seat's state must be Reserved.
                 If booking status is Confirmed, then all seat's state must be Booked.
         """
+        seat_map = _get_common_seat_map(seats)
+        self._init(
+            booking_id,
+            status,
+            seat_map,
+            build_seat_runs((seat.row, seat.col) for seat in seats),
+            None if seat_map is not None else list(seats),
+        )
+
+    @classmethod
+    def from_positions(
+        cls, booking_id: str, status: str, seat_map, positions: Iterable[tuple]
+    ) -> "Booking":
+        """Create a booking of the seats of a seat map, without Seat objects.
+        Args:
+            booking_id(str): unique identifier of the booking.
+            status(str): the state of the booking. Either Reserved or Confirmed.
+            seat_map(SeatMap): the seat map which holds the state of the seats.
+            positions(Iterable[tuple]): the (row, col) positions of the seats.
+        Returns:
+            the booking.
+        """
+        booking = cls.__new__(cls)
+        booking._init(booking_id, status, seat_map, build_seat_runs(positions), None)
+        return booking
+
+    def _init(
+        self,
+        booking_id: str,
+        status: str,
+        seat_map,
+        runs: List[Tuple[int, int, int]],
+        seats: Optional[List[Seat]],
+    ) -> None:
+        """Validate and set the attributes of the booking.
+        Args:
+            booking_id(str): unique identifier of the booking.
+            status(str): the state of the booking. Either Reserved or Confirmed.
+            seat_map(SeatMap): the seat map of the seats, None for standalone seats.
+            runs(List[Tuple[int, int, int]]): the (row, start_col, length) runs.
+            seats(List[Seat]): the standalone seats, None for a seat map.
+        """
         if booking_id is None or booking_id.strip() == "":
             raise ValueError(msg.MSG_INVALID_BOOKING_ID)
         self.booking_id = booking_id
-        if status not in [
-            consts.BOOKING_STATUS_RESERVED,
-            consts.BOOKING_STATUS_CONFIRMED,
-        ]:
+        if status not in BOOKING_STATUS_SEAT_CODES:
             raise ValueError(msg.MSG_INVALID_STATUS)
         self.status = status
-        if status == consts.BOOKING_STATUS_RESERVED and any(
-            [seat for seat in seats if seat.state != consts.SEAT_STATE_RESERVED]
-        ):
-            raise ValueError(msg.MSG_INVALID_STATUS_RESERVED)
-        if status == consts.BOOKING_STATUS_CONFIRMED and any(
-            [seat for seat in seats if seat.state != consts.SEAT_STATE_BOOKED]
-        ):
+        self._seat_map = seat_map
+        self._seats = seats
+        self.runs = runs
+        if not self._has_seat_code(BOOKING_STATUS_SEAT_CODES[status]):
+            if status == consts.BOOKING_STATUS_RESERVED:
+                raise ValueError(msg.MSG_INVALID_STATUS_RESERVED)
             raise ValueError(msg.MSG_INVALID_STATUS_CONFIRMED)
-        self.seats = seats
+        self.seat_masks = build_seat_masks(runs)
+
+    @property
+    def seats(self) -> List[Seat]:
+        """Get the seats of the booking, views of a seat map are created here."""
+        if self._seats is not None:
+            return self._seats
+        return [
+            Seat.view(self._seat_map, row, col)
+            for row, start_col, length in self.runs
+            for col in range(start_col, start_col + length)
+        ]
+
+    @property
+    def num_seats(self) -> int:
+        """Get the number of seats of the booking."""
+        return sum(length for _, _, length in self.runs)
+
+    def positions(self) -> Iterator[tuple]:
+        """Iterate the (row, col) positions of the seats in row-major order."""
+        for row, start_col, length in self.runs:
+            for col in range(start_col, start_col + length):
+                yield row, col
 
     def update_status(self, new_status: str) -> None:
         """Do update status of the booking.
@@ -41,28 +108,98 @@ class Booking:
         Args:
             new_status(str): the new status of the booking.
         """
-        if new_status not in [
-            consts.BOOKING_STATUS_RESERVED,
-            consts.BOOKING_STATUS_CONFIRMED,
-        ]:
+        if new_status not in BOOKING_STATUS_SEAT_CODES:
             raise ValueError(msg.MSG_INVALID_STATUS)
         self.status = new_status
-        new_seat_state = (
-            consts.SEAT_STATE_RESERVED
-            if new_status == consts.BOOKING_STATUS_RESERVED
-            else consts.SEAT_STATE_BOOKED
-        )
-        for seat in self.seats:
-            seat.update_state(new_seat_state)
+        self._update_seat_code(BOOKING_STATUS_SEAT_CODES[new_status])
 
     def release_reserved_seats(self) -> None:
         """Do release reserved seats"""
-        for seat in self.seats:
-            seat.update_state(consts.SEAT_STATE_EMPTY)
+        self._update_seat_code(consts.SEAT_CODE_EMPTY)
 
     def update_seats(self, new_seats: List[Seat]) -> None:
         """Do update seats with the new list.
         Args:
             new_seats(List[Seat]): the new list of seats.
         """
-        self.seats = new_seats
+        self._seat_map = _get_common_seat_map(new_seats)
+        self._seats = None if self._seat_map is not None else list(new_seats)
+        self.runs = build_seat_runs((seat.row, seat.col) for seat in new_seats)
+        self.seat_masks = build_seat_masks(self.runs)
+
+    def update_positions(self, new_positions: Iterable[tuple]) -> None:
+        """Do update the seats of a seat map booking with the new positions.
+        Args:
+            new_positions(Iterable[tuple]): the (row, col) positions of the seats.
+        """
+        self.runs = build_seat_runs(new_positions)
+        self.seat_masks = build_seat_masks(self.runs)
+
+    def _update_seat_code(self, new_code: int) -> None:
+        """Update the state code of all seats, one run at a time.
+        Args:
+            new_code(int): the new state code of the seats.
+        """
+        if self._seats is not None:
+            for seat in self._seats:
+                seat.update_state(consts.SEAT_CODE_STATES[new_code])
+            return
+        for row, start_col, length in self.runs:
+            self._seat_map.set_run_state_code(row, start_col, length, new_code)
+
+    def _has_seat_code(self, code: int) -> bool:
+        """Check whether all seats of the booking have given state code.
+        Args:
+            code(int): the state code.
+        Returns:
+            a boolean value to indicate all seats have the state code or not.
+        """
+        if self._seats is not None:
+            state = consts.SEAT_CODE_STATES[code]
+            return all(seat.state == state for seat in self._seats)
+        return all(
+            self._seat_map.run_codes(row, start_col, length).count(code) == length
+            for row, start_col, length in self.runs
+        )
+
+
+def _get_common_seat_map(seats: List[Seat]):
+    """Get the seat map which holds all given seats.
+    Args:
+        seats(List[Seat]): the list of seats.
+    Returns:
+        the seat map, or None if any seat is standalone or they differ.
+    """
+    seat_maps = {id(seat._seat_map): seat._seat_map for seat in seats}
+    if len(seat_maps) != 1:
+        return None
+    return next(iter(seat_maps.values()))
+
+
+def build_seat_runs(positions: Iterable[tuple]) -> List[Tuple[int, int, int]]:
+    """Build the runs of adjacent seats of given positions.
+    Args:
+        positions(Iterable[tuple]): the (row, col) positions of the seats.
+    Returns:
+        a list of (row, start_col, length) runs in row-major order.
+    """
+    runs = []
+    for row, col in sorted(positions):
+        if runs and runs[-1][0] == row and runs[-1][1] + runs[-1][2] == col:
+            runs[-1][2] += 1
+        else:
+            runs.append([row, col, 1])
+    return [tuple(run) for run in runs]
+
+
+def build_seat_masks(runs: List[Tuple[int, int, int]]) -> Dict[int, int]:
+    """Build a bitmask of the seat columns for every row of the seat runs.
+    Args:
+        runs(List[Tuple[int, int, int]]): the (row, start_col, length) runs.
+    Returns:
+        a dictionary which maps the row index to the bitmask of its columns.
+    """
+    seat_masks = {}
+    for row, start_col, length in runs:
+        seat_masks[row] = seat_masks.get(row, 0) | ((1 << length) - 1) << start_col
+    return seat_masks
@@ -0,0 +1,83 @@
+import threading
+from typing import Iterator, Optional
+
+import utils.constants as consts
+
+
+class BookingIdBlocks:
+    def __init__(self, last_number: int = 0) -> None:
+        """Initialize the shared source of booking number blocks of one hall.
+            Every block starts right after the end of the previous one, so the
+            numbers are never handed out twice.
+        Args:
+            last_number(int): the last booking number already handed out.
+        """
+        self.last_number = last_number
+        self.lock = threading.Lock()
+
+    def reserve(self, block_size: int) -> range:
+        """Reserve the next block of booking numbers.
+        Args:
+            block_size(int): number of booking numbers in the block.
+        Returns:
+            the range of booking numbers of the block.
+        """
+        with self.lock:
+            first_number = self.last_number + 1
+            self.last_number += block_size
+        return range(first_number, first_number + block_size)
+
+    def advance_to(self, last_number: int) -> None:
+        """Never hand out booking numbers up to given number.
+        Args:
+            last_number(int): the last booking number already used.
+        """
+        with self.lock:
+            self.last_number = max(self.last_number, last_number)
+
+
+class BookingIdAllocator:
+    def __init__(
+        self,
+        blocks: Optional[BookingIdBlocks] = None,
+        block_size: int = consts.BOOKING_ID_BLOCK_SIZE,
+    ) -> None:
+        """Initialize an allocator which issues booking numbers of one hall.
+            Numbers are taken from blocks reserved in the shared source, so many
+            allocators, in threads or processes, only coordinate once per block.
+            Each allocator issues its numbers in increasing order.
+        Args:
+            blocks(BookingIdBlocks): the shared source of blocks.
+                Use a source of its own by default.
+            block_size(int): number of booking numbers reserved at a time.
+        """
+        self.blocks = blocks if blocks is not None else BookingIdBlocks()
+        self.block_size = block_size
+        self.last_number = 0
+        self.lock = threading.Lock()
+        self._block: Iterator[int] = iter(())
+
+    def issue(self) -> int:
+        """Issue the next booking number.
+        Returns:
+            the booking number.
+        """
+        with self.lock:
+            number = next(self._block, None)
+            if number is None:
+                self._block = iter(self.blocks.reserve(self.block_size))
+                number = next(self._block)
+            self.last_number = number
+        return number
+
+    def advance_to(self, last_number: int) -> None:
+        """Skip the booking numbers up to given number, e.g. after a recovery.
+        Args:
+            last_number(int): the last booking number already used.
+        """
+        with self.lock:
+            if last_number <= self.last_number:
+                return
+            self.blocks.advance_to(last_number)
+            self.last_number = last_number
+            self._block = iter(())
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from models.booking import Booking
+
+
+class BookingSession:
+    def __init__(self, session_id: str) -> None:
+        """Initialize a booking session of one customer on a cinema.
+        Args:
+            session_id(str): the unique token of the session.
+        """
+        self.session_id = session_id
+        self.processing_mode: Optional[str] = None
+        self.current_booking: Optional[Booking] = None
+        self.current_checking: Optional[Booking] = None
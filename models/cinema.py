@@ -1,81 +1,362 @@
+import secrets
+from contextlib import nullcontext
+from datetime import datetime
+from typing import ContextManager, Dict, Iterator, List, Mapping, Optional, Tuple
+
 import utils.constants as consts
 import utils.messages as msg
 from models.booking import Booking
+from models.booking_id_allocator import BookingIdAllocator
+from models.booking_session import BookingSession
+from models.hall_layout import get_hall_layout
 from models.seat import Seat
+from models.seat_map import SeatMap
+from storage.booking_store import BookingStore
+from storage.seat_map_snapshot import SeatMapSnapshot
 from utils.booking_utils import (
-    build_index_map,
-    generate_booking_id,
+    format_booking_id,
     generate_default_seats,
     generate_seats_by_position,
+    parse_booking_id,
+    parse_seat_code,
+    relocate_seats,
+)
+
+SEAT_DISPLAY_TABLE = bytes.maketrans(
+    bytes(range(len(consts.SEAT_CODE_DISPLAYS))),
+    "".join(consts.SEAT_CODE_DISPLAYS).encode(),
 )
 
 
 class Cinema:
-    def __init__(self, movie_title: str, rows: int, seats_per_row: int) -> None:
+    def __init__(
+        self,
+        movie_title: str,
+        rows: int,
+        seats_per_row: int,
+        debug: bool = False,
+        show_id: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        thread_safe: bool = False,
+        id_allocator: Optional[BookingIdAllocator] = None,
+    ) -> None:
         """Initialize an object of the cinema.
              rows * seats_per_row empty seats.
         Args:
             movie_title(str): the title of the movie.
             rows(str): number of rows in of the cinema.
             seats_per_row(str): number of tickets in each row.
+            debug(bool): cross-check the seat counters against a full scan on read.
+            show_id(str): the unique identifier of the show.
+            start_time(datetime): the start time of the show.
+            thread_safe(bool): allow many threads to book the cinema at once.
+            id_allocator(BookingIdAllocator): the allocator of the booking numbers,
+                to share the booking numbers of the hall with other workers.
         """
         self.movie_title = movie_title
         self.rows = rows
         self.seats_per_row = seats_per_row
-        self.seat_map = [
-            [Seat(row, col, consts.SEAT_STATE_EMPTY) for col in range(seats_per_row)]
-            for row in range(rows)
-        ]
-        self.index_map = build_index_map(rows, seats_per_row)
-        self.last_booking_number = 0
-        self.bookings = {}
-        self.processing_mode = None
-        self.current_booking: None | Booking = None
-        self.current_checking: None | Booking = None
+        self.debug = debug
+        self.show_id = show_id
+        self.start_time = start_time
+        self.layout = get_hall_layout(rows, seats_per_row)
+        self.id_allocator = (
+            id_allocator if id_allocator is not None else BookingIdAllocator()
+        )
+        self._bookings: Dict[str, Booking] = {}
+        self.sessions: Dict[str, BookingSession] = {
+            consts.DEFAULT_SESSION_ID: BookingSession(consts.DEFAULT_SESSION_ID)
+        }
+        self.thread_safe = thread_safe
+        self._seat_map: Optional[SeatMap] = None
+        self._row_lines = None
+        self._seat_owners: List[Optional[str]] = []
+        self._snapshot: Optional[SeatMapSnapshot] = None
+        self.journal = None
+        self.store: Optional[BookingStore] = None
+        if thread_safe:
+            self._create_seat_map()
+
+    @property
+    def index_map(self) -> Mapping[str, tuple]:
+        """Get the shared map of seat codes to (row, col) of the hall."""
+        return self.layout.index_map
+
+    @property
+    def seat_codes(self) -> Tuple[Tuple[str, ...], ...]:
+        """Get the shared table of seat codes by row and column of the hall."""
+        return self.layout.seat_codes
+
+    @property
+    def last_booking_number(self) -> int:
+        """Get the last booking number issued by the cinema."""
+        return self.id_allocator.last_number
+
+    @last_booking_number.setter
+    def last_booking_number(self, last_booking_number: int) -> None:
+        """Issue only booking numbers after given number from now on."""
+        self.id_allocator.advance_to(last_booking_number)
+
+    @property
+    def seat_map(self) -> SeatMap:
+        """Get the seat map of the cinema, it is created on first use."""
+        if self._seat_map is None:
+            self._create_seat_map()
+        return self._seat_map
+
+    @property
+    def seat_owners(self) -> List[Optional[str]]:
+        """Get the confirmed booking id of every seat by row * cols + col.
+        Seats which are not booked have None.
+        """
+        if self._seat_map is None:
+            self._create_seat_map()
+        return self._seat_owners
+
+    @property
+    def bookings(self) -> Dict[str, Booking]:
+        """Get the confirmed bookings of the cinema by booking id."""
+        if self._snapshot is not None:
+            self._create_seat_map()
+        return self._bookings
+
+    def _create_seat_map(self) -> None:
+        """Create the seat map and the row render cache of the cinema.
+        A loaded snapshot is turned into the seat map and the bookings here.
+        """
+        self._row_lines = [(-1, "")] * self.rows
+        self._seat_owners = [None] * self.layout.num_seats
+        if self._snapshot is None:
+            self._seat_map = SeatMap(
+                self.rows, self.seats_per_row, self.debug, self.thread_safe
+            )
+            return
+        snapshot, self._snapshot = self._snapshot, None
+        self._seat_map = snapshot.seat_map(self.debug, self.thread_safe)
+        for booking_id, positions in snapshot.bookings():
+            self._bookings[booking_id] = Booking.from_positions(
+                booking_id, consts.BOOKING_STATUS_CONFIRMED, self._seat_map, positions
+            )
+            for row, col in positions:
+                self._seat_owners[row * self.seats_per_row + col] = booking_id
+
+    def attach_store(self, store: BookingStore) -> None:
+        """Keep the confirmed bookings of the cinema in a booking store.
+            The bookings confirmed from now on are written to the store instead
+            of the bookings dict, and looked up from it when checked.
+            The seats already booked in the store are marked Booked, and booking
+            numbers are only issued after the last one kept in the store.
+        Args:
+            store(BookingStore): the booking store.
+        """
+        self.store = store
+        booking_ids = set()
+        for seat, booking_id in store.list_seats(self._store_show_id):
+            row, col = divmod(seat, self.seats_per_row)
+            self.seat_map.set_state_code(row, col, consts.SEAT_CODE_BOOKED)
+            self._seat_owners[seat] = booking_id
+            booking_ids.add(booking_id)
+        if booking_ids:
+            self.last_booking_number = max(map(parse_booking_id, booking_ids))
+
+    def load_snapshot(self, snapshot: SeatMapSnapshot) -> None:
+        """Load the seats and bookings of a snapshot instead of the current ones.
+            They are only read from the snapshot when the cinema is first used.
+        Args:
+            snapshot(SeatMapSnapshot): the snapshot of the hall.
+        """
+        if (snapshot.rows, snapshot.cols) != (self.rows, self.seats_per_row):
+            raise ValueError(msg.MSG_INVALID_SEAT_MAP_SNAPSHOT)
+        self._snapshot = snapshot
+        self._seat_map = None
+        self._bookings = {}
+        self.last_booking_number = snapshot.last_booking_number
+        if self.thread_safe:
+            self._create_seat_map()
 
     @property
     def available_seats(self) -> int:
-        return sum(
-            [
-                sum(
-                    [
-                        self.seat_map[row][col].state == consts.SEAT_STATE_EMPTY
-                        for col in range(self.seats_per_row)
-                    ]
-                )
-                for row in range(self.rows)
-            ]
-        )
+        if self._seat_map is None:
+            if self._snapshot is not None:
+                return self._snapshot.num_empty
+            return self.layout.num_seats
+        return self._seat_map.count(consts.SEAT_STATE_EMPTY)
+
+    @property
+    def processing_mode(self) -> Optional[str]:
+        """Get the processing mode of the default session."""
+        return self.sessions[consts.DEFAULT_SESSION_ID].processing_mode
+
+    @property
+    def current_booking(self) -> Optional[Booking]:
+        """Get the pending booking of the default session."""
+        return self.sessions[consts.DEFAULT_SESSION_ID].current_booking
+
+    @property
+    def current_checking(self) -> Optional[Booking]:
+        """Get the checking booking of the default session."""
+        return self.sessions[consts.DEFAULT_SESSION_ID].current_checking
+
+    def open_session(self) -> str:
+        """Open a new booking session.
+        Returns:
+            the token of the session.
+        """
+        session_id = secrets.token_hex(consts.SESSION_TOKEN_BYTES)
+        self.sessions[session_id] = BookingSession(session_id)
+        return session_id
+
+    def close_session(self, session_id: str) -> None:
+        """Close the booking session and release its pending reservation.
+        Args:
+            session_id(str): the token of the session.
+        """
+        self.exit_processing(session_id)
+        if session_id != consts.DEFAULT_SESSION_ID:
+            del self.sessions[session_id]
+
+    def get_session(
+        self, session_id: str = consts.DEFAULT_SESSION_ID
+    ) -> BookingSession:
+        """Get the booking session with given token.
+        Args:
+            session_id(str): the token of the session.
+        Returns:
+            the booking session.
+        """
+        if session_id not in self.sessions:
+            raise KeyError(msg.MSG_NOT_EXIST_SESSION_ID)
+        return self.sessions[session_id]
 
-    def start_booking(self) -> None:
+    def start_booking(self, session_id: str = consts.DEFAULT_SESSION_ID) -> None:
         """Start processing in booking mode."""
-        self.processing_mode = consts.PROCESSING_BOOKING_MODE
+        self.get_session(session_id).processing_mode = consts.PROCESSING_BOOKING_MODE
 
-    def exit_processing(self) -> None:
-        """End processing."""
-        self.processing_mode = None
-        self.current_booking = None
-        self.current_checking = None
+    def exit_processing(self, session_id: str = consts.DEFAULT_SESSION_ID) -> None:
+        """End processing, release the pending reservation if any."""
+        self.abandon_booking(session_id)
+        session = self.get_session(session_id)
+        session.processing_mode = None
+        session.current_checking = None
 
-    def create_default_booking(self, num_tickets: int) -> None:
+    def create_default_booking(
+        self, num_tickets: int, session_id: str = consts.DEFAULT_SESSION_ID
+    ) -> None:
         """Auto create new booking reservation.
         Args:
             num_tickets(int): number of tickets to order.
+            session_id(str): the token of the session which holds the reservation.
         Returns:
             a booking with default reserved seats.
         """
-        if num_tickets > self.available_seats:
+        session = self.get_session(session_id)
+        self.abandon_booking(session_id)
+        available_seats = self.available_seats
+        if num_tickets > available_seats:
             raise ValueError(
                 msg.MSG_INVALID_EXCEEDING_NUMBER_OF_TICKETS.format(
-                    num_seats=self.available_seats
+                    num_seats=available_seats
                 )
             )
-        booking_id = generate_booking_id(self.last_booking_number)
         seats = generate_default_seats(self.seat_map, num_tickets)
-        self.current_booking = Booking(
-            booking_id, consts.BOOKING_STATUS_RESERVED, seats
+        session.current_booking = Booking(
+            self._issue_booking_id(), consts.BOOKING_STATUS_RESERVED, seats
         )
 
+    def abandon_booking(self, session_id: str = consts.DEFAULT_SESSION_ID) -> None:
+        """Release the pending reservation of the session.
+        Args:
+            session_id(str): the token of the session.
+        """
+        session = self.get_session(session_id)
+        if session.current_booking is not None:
+            session.current_booking.release_reserved_seats()
+            session.current_booking = None
+
+    def create_bookings_batch(
+        self,
+        tickets: List[int],
+        seating_positions: Optional[List[Optional[str]]] = None,
+    ) -> List[str]:
+        """Allocate and confirm many bookings in one pass over the seat map.
+        Args:
+            tickets(List[int]): number of tickets of every booking.
+            seating_positions(List[Optional[str]]): the optional starting seating
+                position of every booking. Use default seats for None.
+        Returns:
+            a list of confirmed booking ids in the given order.
+        """
+        if seating_positions is None:
+            seating_positions = [None] * len(tickets)
+        if len(seating_positions) != len(tickets):
+            raise ValueError(msg.MSG_INVALID_NUMBER_OF_TICKETS)
+        if any(num_tickets <= 0 for num_tickets in tickets):
+            raise ValueError(msg.MSG_INVALID_NUMBER_OF_TICKETS)
+        start_positions = []
+        for seating_position in seating_positions:
+            if seating_position is None:
+                start_positions.append(None)
+            else:
+                start_positions.append(self._parse_seating_position(seating_position))
+        available_seats = self.available_seats
+        if sum(tickets) > available_seats:
+            raise ValueError(
+                msg.MSG_INVALID_EXCEEDING_NUMBER_OF_TICKETS.format(
+                    num_seats=available_seats
+                )
+            )
+        booking_ids = []
+        furthest_row = 0
+        for num_tickets, start_position in zip(tickets, start_positions):
+            if start_position is None:
+                seats = generate_default_seats(self.seat_map, num_tickets, furthest_row)
+                furthest_row = seats[-1].row
+            else:
+                start_row, start_col = start_position
+                seats = generate_seats_by_position(
+                    self.seat_map, num_tickets, start_row, start_col
+                )
+            booking_ids.append(self._confirm_seats(seats))
+        return booking_ids
+
+    def book_tickets(self, num_tickets: int) -> str:
+        """Reserve default seats and confirm them in one step.
+            In thread-safe mode it can be called from many threads at once.
+        Args:
+            num_tickets(int): number of tickets to order.
+        Returns:
+            the confirmed booking id.
+        """
+        available_seats = self.available_seats
+        if num_tickets > available_seats:
+            raise ValueError(
+                msg.MSG_INVALID_EXCEEDING_NUMBER_OF_TICKETS.format(
+                    num_seats=available_seats
+                )
+            )
+        seats = generate_default_seats(self.seat_map, num_tickets)
+        return self._confirm_seats(seats)
+
+    def _issue_booking_id(self) -> str:
+        """Issue the next booking id of the cinema."""
+        return format_booking_id(self.id_allocator.issue())
+
+    def _confirm_seats(self, seats: List[Seat]) -> str:
+        """Confirm reserved seats as a new booking.
+        Args:
+            seats(List[Seat]): the reserved seats.
+        Returns:
+            the confirmed booking id.
+        """
+        booking_id = self._issue_booking_id()
+        booking = Booking(booking_id, consts.BOOKING_STATUS_RESERVED, seats)
+        with self._journal_lock():
+            booking.update_status(consts.BOOKING_STATUS_CONFIRMED)
+            self._save_booking(booking)
+            if self.journal is not None:
+                self.journal.record_confirm(booking, self.last_booking_number)
+        return booking_id
+
     def is_seating_position_exist(self, seating_position: str) -> bool:
         """Check whether given seat position exist in seat map or not.
         Args:
@@ -83,32 +364,174 @@ class Cinema:
         Returns:
             a boolean value to indicate the seat position exist or not.
         """
-        seating_position = seating_position.upper()
-        return seating_position in self.index_map
+        return (
+            parse_seat_code(seating_position, self.rows, self.seats_per_row) is not None
+        )
+
+    def _parse_seating_position(self, seating_position: str) -> tuple:
+        """Parse a seating position into the indexes of the seat.
+        Args:
+            seating_position(str): the seat position in row and column format. E.g. A08
+        Returns:
+            the (row, col) indexes of the seat.
+        """
+        position = parse_seat_code(seating_position, self.rows, self.seats_per_row)
+        if position is None:
+            raise KeyError(msg.MSG_INVALID_SEATING_POSITION)
+        return position
 
-    def change_seating_position(self, seating_position: str) -> None:
+    def change_seating_position(
+        self, seating_position: str, session_id: str = consts.DEFAULT_SESSION_ID
+    ) -> None:
         """Re-generate booking seats with the specific starting position.
         Args:
             seating_position(str): seating position.
+            session_id(str): the token of the session which holds the reservation.
         """
-        seating_position = seating_position.upper()
-        if not self.is_seating_position_exist(seating_position):
-            raise KeyError(msg.MSG_INVALID_SEATING_POSITION)
-        self.current_booking.release_reserved_seats()
-        num_seats = len(self.current_booking.seats)
-        start_row, start_col = self.index_map[seating_position]
-        seats = generate_seats_by_position(
-            self.seat_map, num_seats, start_row, start_col
+        start_row, start_col = self._parse_seating_position(seating_position)
+        current_booking = self.get_session(session_id).current_booking
+        if current_booking is None:
+            raise ValueError(msg.MSG_NOT_EXIST_PENDING_BOOKING)
+        transaction = self.seat_map.begin_transaction()
+        try:
+            positions = relocate_seats(
+                transaction, current_booking.runs, start_row, start_col
+            )
+        except ValueError:
+            transaction.rollback()
+            raise
+        transaction.commit()
+        current_booking.update_positions(positions)
+
+    def confirm_booking(self, session_id: str = consts.DEFAULT_SESSION_ID) -> None:
+        """Confirm current booking.
+        Args:
+            session_id(str): the token of the session which holds the reservation.
+        """
+        session = self.get_session(session_id)
+        current_booking = session.current_booking
+        if current_booking is None:
+            raise ValueError(msg.MSG_NOT_EXIST_PENDING_BOOKING)
+        with self._journal_lock():
+            current_booking.update_status(consts.BOOKING_STATUS_CONFIRMED)
+            self._save_booking(current_booking)
+            if self.journal is not None:
+                self.journal.record_confirm(current_booking, self.last_booking_number)
+        session.current_booking = None
+
+    def release_booking(self, booking_id: str) -> None:
+        """Release a confirmed booking and make its seats Empty again.
+        Args:
+            booking_id(str): the booking id.
+        """
+        booking_id = booking_id.upper()
+        with self._journal_lock():
+            booking = self._pop_booking(booking_id)
+            if booking is None:
+                raise ValueError(
+                    msg.MSG_NOT_EXIST_BOOKING_ID.format(booking_id=booking_id)
+                )
+            booking.release_reserved_seats()
+            if self.journal is not None:
+                self.journal.record_release(booking_id)
+
+    def restore_booking(self, booking_id: str, positions: List[tuple]) -> None:
+        """Restore a confirmed booking from persisted state, without journaling it.
+            A booking which the booking store already keeps is not written again.
+        Args:
+            booking_id(str): the booking id.
+            positions(List[tuple]): a list of (row, col) positions of its seats.
+        """
+        for row, col in positions:
+            self.seat_map.set_state_code(row, col, consts.SEAT_CODE_BOOKED)
+        booking = Booking.from_positions(
+            booking_id, consts.BOOKING_STATUS_CONFIRMED, self.seat_map, positions
+        )
+        if self.store is not None and self.store.has_booking(
+            self._store_show_id, booking_id
+        ):
+            self._set_seat_owner(booking, booking_id)
+            return
+        self._save_booking(booking)
+
+    def _save_booking(self, booking: Booking) -> None:
+        """Save a confirmed booking into the booking store or the bookings dict.
+        Args:
+            booking(Booking): the confirmed booking.
+        """
+        self._set_seat_owner(booking, booking.booking_id)
+        if self.store is None:
+            self._bookings[booking.booking_id] = booking
+            return
+        self.store.add_booking(
+            self._store_show_id,
+            booking.booking_id,
+            [row * self.seats_per_row + col for row, col in booking.positions()],
+        )
+
+    def _find_booking(self, booking_id: str) -> Optional[Booking]:
+        """Find a confirmed booking in the bookings dict, then in the booking store.
+        Args:
+            booking_id(str): the booking id.
+        Returns:
+            the booking, or None if it does not exist.
+        """
+        booking = self.bookings.get(booking_id)
+        if booking is None and self.store is not None:
+            seats = self.store.get_booking(self._store_show_id, booking_id)
+            if seats is not None:
+                booking = self._load_booking(booking_id, seats)
+        return booking
+
+    def _pop_booking(self, booking_id: str) -> Optional[Booking]:
+        """Remove a confirmed booking from the bookings dict or the booking store.
+        Args:
+            booking_id(str): the booking id.
+        Returns:
+            the removed booking, or None if it does not exist.
+        """
+        booking = self.bookings.pop(booking_id, None)
+        if booking is None and self.store is not None:
+            seats = self.store.remove_booking(self._store_show_id, booking_id)
+            if seats is not None:
+                booking = self._load_booking(booking_id, seats)
+        if booking is not None:
+            self._set_seat_owner(booking, None)
+        return booking
+
+    def _set_seat_owner(self, booking: Booking, booking_id: Optional[str]) -> None:
+        """Set the owner of the seats of a booking, one run at a time.
+        Args:
+            booking(Booking): the booking.
+            booking_id(str): the booking id of the owner, None for no owner.
+        """
+        for row, start_col, length in booking.runs:
+            start = row * self.seats_per_row + start_col
+            self._seat_owners[start : start + length] = [booking_id] * length
+
+    def _load_booking(self, booking_id: str, seats: List[int]) -> Booking:
+        """Create a confirmed booking from the packed seats kept in the store.
+        Args:
+            booking_id(str): the booking id.
+            seats(List[int]): the packed seats of the booking.
+        Returns:
+            the booking.
+        """
+        positions = [divmod(seat, self.seats_per_row) for seat in seats]
+        return Booking.from_positions(
+            booking_id, consts.BOOKING_STATUS_CONFIRMED, self.seat_map, positions
         )
-        self.current_booking.update_seats(seats)
 
-    def confirm_booking(self) -> None:
-        """Confirm current booking."""
-        self.current_booking.update_status(consts.BOOKING_STATUS_CONFIRMED)
-        booking_id = self.current_booking.booking_id
-        self.bookings[booking_id] = self.current_booking
-        self.current_booking = None
-        self.last_booking_number += 1
+    @property
+    def _store_show_id(self) -> str:
+        """Get the show id the bookings of the cinema are stored under."""
+        return self.show_id or consts.DEFAULT_SHOW_ID
+
+    def _journal_lock(self) -> ContextManager:
+        """Get the lock which orders the changes recorded by the journal."""
+        if self.journal is None:
+            return nullcontext()
+        return self.journal.lock
 
     def is_booking_id_exist(self, booking_id: str) -> bool:
         """Check whether given booking id exist in seat map or not.
@@ -118,58 +541,158 @@ class Cinema:
             a boolean value to indicate the booking id exist or not.
         """
         booking_id = booking_id.upper()
-        return booking_id in self.bookings
+        if booking_id in self.bookings:
+            return True
+        if self.store is None:
+            return False
+        return self.store.has_booking(self._store_show_id, booking_id)
+
+    def get_seat_owner(self, seating_position: str) -> Optional[str]:
+        """Get the confirmed booking which holds the seat at given position.
+        Args:
+            seating_position(str): the seat position in row and column format. E.g. A08
+        Returns:
+            the booking id, or None if the seat is not booked.
+        """
+        row, col = self._parse_seating_position(seating_position)
+        return self._get_seat_owner(row, col)
+
+    def get_block_owners(
+        self, first_position: str, last_position: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Get the confirmed bookings which hold the seats of a block.
+            The block spans the rows and columns between two seat positions,
+            e.g. F01 to F20 for a whole row, or A03 to C05 for a block of nine seats.
+        Args:
+            first_position(str): the seat position of one corner of the block.
+            last_position(str): the seat position of the opposite corner.
+                Use the whole row of the first position by default.
+        Returns:
+            the booking id of every booked seat of the block by seat position.
+        """
+        positions = [
+            self._parse_seating_position(seating_position)
+            for seating_position in [first_position, last_position]
+            if seating_position is not None
+        ]
+        if len(positions) == 1:
+            row = positions[0][0]
+            positions = [(row, 0), (row, self.seats_per_row - 1)]
+        (first_row, first_col), (last_row, last_col) = positions
+        first_row, last_row = sorted([first_row, last_row])
+        first_col, last_col = sorted([first_col, last_col])
+        owners = {}
+        for row in range(first_row, last_row + 1):
+            start = row * self.seats_per_row
+            row_owners = self.seat_owners[start + first_col : start + last_col + 1]
+            for col, booking_id in enumerate(row_owners, start=first_col):
+                if booking_id is None:
+                    booking_id = self._get_seat_owner(row, col)
+                if booking_id is not None:
+                    owners[self.seat_codes[row][col]] = booking_id
+        return owners
 
-    def start_checking(self) -> None:
+    def _get_seat_owner(self, row: int, col: int) -> Optional[str]:
+        """Get the confirmed booking which holds the seat at given indexes.
+            Booked seats of bookings which were only kept in the booking store are
+            looked up in the store once and remembered.
+        Args:
+            row(int): the row index of the seat.
+            col(int): the column index of the seat.
+        Returns:
+            the booking id, or None if the seat is not booked.
+        """
+        seat = row * self.seats_per_row + col
+        booking_id = self.seat_owners[seat]
+        if (
+            booking_id is None
+            and self.store is not None
+            and self.seat_map.states[seat] == consts.SEAT_CODE_BOOKED
+        ):
+            booking_id = self.store.find_seat_booking(self._store_show_id, seat)
+            self._seat_owners[seat] = booking_id
+        return booking_id
+
+    def start_checking(self, session_id: str = consts.DEFAULT_SESSION_ID) -> None:
         """Start processing in checking mode."""
-        self.processing_mode = consts.PROCESSING_CHECKING_MODE
+        self.get_session(session_id).processing_mode = consts.PROCESSING_CHECKING_MODE
 
-    def check_booking(self, booking_id: str) -> None:
+    def check_booking(
+        self, booking_id: str, session_id: str = consts.DEFAULT_SESSION_ID
+    ) -> None:
         """Do check the booking with given booking id."""
+        session = self.get_session(session_id)
         booking_id = booking_id.upper()
-        if self.is_booking_id_exist(booking_id):
-            self.current_checking = self.bookings[booking_id]
+        booking = self._find_booking(booking_id)
+        if booking is not None:
+            session.current_checking = booking
         else:
             raise ValueError(msg.MSG_NOT_EXIST_BOOKING_ID.format(booking_id=booking_id))
 
-    def screen_display(self) -> str:
+    def screen_display(self, session_id: str = consts.DEFAULT_SESSION_ID) -> str:
         """Display the current state of the cinema in string format.
+        Args:
+            session_id(str): the token of the session to display for.
         Returns:
              a string to display on the screen.
         """
-        top_lines = self._get_top_lines()
-        mid_lines = self._get_mid_lines()
-        bottom_lines = self._get_bottom_lines()
-        return f"{top_lines}{mid_lines}{bottom_lines}"
+        return "\n".join(self.screen_lines(session_id))
 
-    def _get_top_lines(self) -> str:
-        """Get top lines of the screen."""
-        screen_line = " ".join(list(msg.MSG_INFO_SCREEN))
-        dash_line = "-" * self.seats_per_row * 2
-        return f"{msg.MSG_INFO_SELECTED_SEATS}{screen_line}\n{dash_line}\n"
+    def screen_lines(
+        self, session_id: str = consts.DEFAULT_SESSION_ID
+    ) -> Iterator[str]:
+        """Stream the lines of the screen one by one, without line breaks.
+        Args:
+            session_id(str): the token of the session to display for.
+        Returns:
+            an iterator of the lines, from the screen to the column numbers.
+        """
+        session = self.get_session(session_id)
+        yield from self.layout.top_lines
+        yield from self._get_mid_lines(session)
+        yield self.layout.bottom_lines
 
-    def _get_mid_lines(self) -> str:
-        """Get middle lines of the screen."""
-        mid_lines = ""
+    def _get_mid_lines(self, session: BookingSession) -> Iterator[str]:
+        """Get middle lines of the screen.
+        Args:
+            session(BookingSession): the session whose checking booking is highlighted.
+        """
+        checking_masks = {}
+        if session.processing_mode == consts.PROCESSING_CHECKING_MODE:
+            checking_masks = session.current_checking.seat_masks
         for row in range(self.rows - 1, -1, -1):
-            line_str = consts.ALPHABET_LIST[row]
-            for col in range(self.seats_per_row):
-                if self.processing_mode == consts.PROCESSING_CHECKING_MODE and any(
-                    [
-                        seat
-                        for seat in self.current_checking.seats
-                        if seat.row == row and seat.col == col
-                    ]
-                ):
-                    line_str += consts.DISPLAY_RESERVED
-                else:
-                    line_str += str(self.seat_map[row][col])
-            mid_lines += " ".join(list(line_str)) + "\n"
-        return mid_lines
-
-    def _get_bottom_lines(self) -> str:
-        """Get bottom lines of the screen."""
-        bottom_line = " "
-        for col in range(1, self.seats_per_row + 1):
-            bottom_line += " " + str(col)
-        return bottom_line
+            if row in checking_masks:
+                yield self._render_highlighted_row(row, checking_masks[row])
+            else:
+                yield self._get_row_line(row)
+
+    def _get_row_line(self, row: int) -> str:
+        """Get the line of given row, re-render it only when the row is dirty.
+        Args:
+            row(int): the row index.
+        Returns:
+            the rendered line of the row.
+        """
+        version = self.seat_map.row_versions[row]
+        cached_version, line = self._row_lines[row]
+        if cached_version != version:
+            row_displays = self.seat_map.row_codes(row).translate(SEAT_DISPLAY_TABLE)
+            line = self.layout.row_labels[row] + " ".join(row_displays.decode())
+            self._row_lines[row] = (version, line)
+        return line
+
+    def _render_highlighted_row(self, row: int, highlight_mask: int) -> str:
+        """Render the line of given row with the highlighted seats.
+        Args:
+            row(int): the row index.
+            highlight_mask(int): the bitmask of the columns to highlight.
+        Returns:
+            the rendered line of the row.
+        """
+        row_codes = bytearray(self.seat_map.row_codes(row))
+        while highlight_mask:
+            lowest_bit = highlight_mask & -highlight_mask
+            row_codes[lowest_bit.bit_length() - 1] = consts.SEAT_CODE_RESERVED
+            highlight_mask ^= lowest_bit
+        row_displays = row_codes.translate(SEAT_DISPLAY_TABLE).decode()
+        return self.layout.row_labels[row] + " ".join(row_displays)
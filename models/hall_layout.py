@@ -0,0 +1,61 @@
+from functools import lru_cache
+from typing import Mapping, Tuple
+
+import utils.messages as msg
+from utils.booking_utils import (
+    build_index_map,
+    build_seat_codes,
+    get_mid_most_order,
+    get_row_label,
+)
+
+
+class HallLayout:
+    def __init__(self, rows: int, cols: int) -> None:
+        """Initialize the layout of a hall.
+            The layout only depends on the hall dimensions and never changes,
+            so it is shared by all shows which use a hall of the same shape.
+        Args:
+            rows(int): number of rows of the hall.
+            cols(int): number of seats in each row.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.num_seats = rows * cols
+        label_width = len(get_row_label(rows - 1))
+        self.row_labels = tuple(
+            get_row_label(row).ljust(label_width) + " " for row in range(rows)
+        )
+        self.mid_most_order = get_mid_most_order(cols)
+        screen_line = " ".join(list(msg.MSG_INFO_SCREEN))
+        dash_line = "-" * cols * 2
+        self.top_lines = (
+            msg.MSG_INFO_SELECTED_SEATS.rstrip("\n"),
+            screen_line,
+            dash_line,
+        )
+        self.bottom_lines = " " * (label_width + 1) + " ".join(
+            str(col) for col in range(1, cols + 1)
+        )
+
+    @property
+    def index_map(self) -> Mapping[str, tuple]:
+        """Get the shared map of seat codes to (row, col), built on first use."""
+        return build_index_map(self.rows, self.cols)
+
+    @property
+    def seat_codes(self) -> Tuple[Tuple[str, ...], ...]:
+        """Get the shared table of seat codes by row and column, built on first use."""
+        return build_seat_codes(self.rows, self.cols)
+
+
+@lru_cache(maxsize=None)
+def get_hall_layout(rows: int, cols: int) -> HallLayout:
+    """Get the shared layout of a hall with given dimensions.
+    Args:
+        rows(int): number of rows of the hall.
+        cols(int): number of seats in each row.
+    Returns:
+        the layout of the hall.
+    """
+    return HallLayout(rows, cols)
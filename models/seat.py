@@ -3,6 +3,8 @@ import utils.messages as msg
 
 
 class Seat:
+    __slots__ = ("row", "col", "_state", "_seat_map")
+
     def __init__(self, row: int, col: int, state: str) -> None:
         """Initialize an object of the seat.
         Args:
@@ -19,7 +21,32 @@ class Seat:
             consts.SEAT_STATE_BOOKED,
         ]:
             raise ValueError(msg.MSG_INVALID_STATE)
-        self.state = state
+        self._state = state
+        self._seat_map = None
+
+    @classmethod
+    def view(cls, seat_map, row: int, col: int) -> "Seat":
+        """Create a view of the seat which is stored in a seat map.
+        Args:
+            seat_map(SeatMap): the seat map which holds the state of the seat.
+            row (int): the row index of the seat
+            col (int): the column index of the seat
+        Returns:
+            a seat which reads and writes its state through the seat map.
+        """
+        seat = cls.__new__(cls)
+        seat.row = row
+        seat.col = col
+        seat._state = None
+        seat._seat_map = seat_map
+        return seat
+
+    @property
+    def state(self) -> str:
+        """Get the state of the seat."""
+        if self._seat_map is not None:
+            return self._seat_map.get_state(self.row, self.col)
+        return self._state
 
     def __eq__(self, other) -> bool:
         """Do compare the seat with another based on whether same row index and column index or not.
@@ -39,9 +66,10 @@ class Seat:
         Returns:
             a string value to represent the state for display.
         """
-        if self.state == consts.SEAT_STATE_EMPTY:
+        state = self.state
+        if state == consts.SEAT_STATE_EMPTY:
             return consts.DISPLAY_EMPTY
-        elif self.state == consts.SEAT_STATE_RESERVED:
+        elif state == consts.SEAT_STATE_RESERVED:
             return consts.DISPLAY_RESERVED
         else:
             return consts.DISPLAY_BOOKED
@@ -57,4 +85,7 @@ class Seat:
             consts.SEAT_STATE_BOOKED,
         ]:
             raise ValueError(msg.MSG_INVALID_STATE)
-        self.state = new_state
+        if self._seat_map is not None:
+            self._seat_map.set_state(self.row, self.col, new_state)
+        else:
+            self._state = new_state
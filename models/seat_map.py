@@ -0,0 +1,505 @@
+import threading
+from typing import List
+
+import utils.constants as consts
+import utils.messages as msg
+from models.seat import Seat
+
+FREE_SEAT_DIGITS_TABLE = bytes.maketrans(
+    bytes(range(len(consts.SEAT_CODE_STATES))),
+    bytes(
+        ord("1") if code == consts.SEAT_CODE_EMPTY else ord("0")
+        for code in range(len(consts.SEAT_CODE_STATES))
+    ),
+)
+
+
+class SeatMap:
+    def __init__(
+        self, rows: int, cols: int, debug: bool = False, thread_safe: bool = False
+    ) -> None:
+        """Initialize a compact seat map of rows * cols empty seats.
+            The state of every seat is stored as one byte in a contiguous array,
+            the seat at (row, col) lives at index row * cols + col.
+            Occupancy counters of the whole map and of every row are kept up to date
+            on each state change, so that reading them is O(1).
+            Every row also keeps a free-seat bitmask, bit col is set when the seat
+            is Empty, and one more bitmask tells which rows still have space.
+            The version of a row is bumped whenever one of its seats changes state,
+            so that renderers can tell which rows are dirty.
+            In thread-safe mode every row is guarded by one of a few striped locks,
+            and the counters of the whole map by a short-lived counter lock.
+        Args:
+            rows(int): number of rows of the seat map.
+            cols(int): number of seats in each row.
+            debug(bool): cross-check the counters against a full scan on every read.
+            thread_safe(bool): guard the state changes with striped row locks.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.debug = debug
+        self.states = bytearray(rows * cols)
+        self.state_counts = [0] * len(consts.SEAT_CODE_STATES)
+        self.state_counts[consts.SEAT_CODE_EMPTY] = rows * cols
+        self.row_state_counts = [[0] * rows for _ in consts.SEAT_CODE_STATES]
+        self.row_state_counts[consts.SEAT_CODE_EMPTY] = [cols] * rows
+        self.free_masks = [(1 << cols) - 1 if cols else 0] * rows
+        self.rows_with_space = (1 << rows) - 1 if cols else 0
+        self.row_versions = [0] * rows
+        self.thread_safe = thread_safe
+        self.row_locks = None
+        self.counter_lock = None
+        if thread_safe:
+            self.row_locks = [threading.Lock() for _ in range(consts.NUM_ROW_LOCKS)]
+            self.counter_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of rows of the seat map."""
+        return self.rows
+
+    def get_state(self, row: int, col: int) -> str:
+        """Get the state of the seat at given position.
+        Args:
+            row(int): the row index of the seat.
+            col(int): the column index of the seat.
+        Returns:
+            the state of the seat. One of: Empty, Reserved, Booked.
+        """
+        return consts.SEAT_CODE_STATES[self.states[row * self.cols + col]]
+
+    def set_state(self, row: int, col: int, new_state: str) -> None:
+        """Set the state of the seat at given position.
+        Args:
+            row(int): the row index of the seat.
+            col(int): the column index of the seat.
+            new_state(str): new state of the seat.
+        """
+        if new_state not in consts.SEAT_STATE_CODES:
+            raise ValueError(msg.MSG_INVALID_STATE)
+        self.set_state_code(row, col, consts.SEAT_STATE_CODES[new_state])
+
+    def set_state_code(self, row: int, col: int, new_code: int) -> None:
+        """Set the raw state code of the seat at given position and update counters.
+        Args:
+            row(int): the row index of the seat.
+            col(int): the column index of the seat.
+            new_code(int): new state code of the seat.
+        """
+        if not self.thread_safe:
+            self._write_state_code(row, col, new_code)
+            return
+        with self.row_locks[row % consts.NUM_ROW_LOCKS]:
+            self._write_state_code(row, col, new_code)
+
+    def set_run_state_code(
+        self, row: int, start_col: int, length: int, new_code: int
+    ) -> None:
+        """Set the raw state code of a run of adjacent seats of a row at once.
+            The counters and the bitmasks are updated once for the whole run.
+        Args:
+            row(int): the row index of the seats.
+            start_col(int): the column index of the first seat of the run.
+            length(int): number of seats in the run.
+            new_code(int): new state code of the seats.
+        """
+        if not self.thread_safe:
+            self._write_run_state_code(row, start_col, length, new_code)
+            return
+        with self.row_locks[row % consts.NUM_ROW_LOCKS]:
+            self._write_run_state_code(row, start_col, length, new_code)
+
+    def _write_run_state_code(
+        self, row: int, start_col: int, length: int, new_code: int
+    ) -> None:
+        """Write the raw state code of a run of seats and update counters.
+            In thread-safe mode the caller must hold the lock of the row.
+        Args:
+            row(int): the row index of the seats.
+            start_col(int): the column index of the first seat of the run.
+            length(int): number of seats in the run.
+            new_code(int): new state code of the seats.
+        """
+        old_codes = self.run_codes(row, start_col, length)
+        old_counts = [
+            old_codes.count(code) for code in range(len(consts.SEAT_CODE_STATES))
+        ]
+        if old_counts[new_code] == length:
+            return
+        idx = row * self.cols + start_col
+        self.states[idx : idx + length] = bytes([new_code]) * length
+        self.row_versions[row] += 1
+        for code, old_count in enumerate(old_counts):
+            self.row_state_counts[code][row] -= old_count
+        self.row_state_counts[new_code][row] += length
+        run_mask = ((1 << length) - 1) << start_col
+        had_space = bool(self.free_masks[row])
+        if new_code == consts.SEAT_CODE_EMPTY:
+            self.free_masks[row] |= run_mask
+        else:
+            self.free_masks[row] &= ~run_mask
+        row_space_change = bool(self.free_masks[row]) - had_space
+        if not self.thread_safe:
+            self._update_run_counters(row, old_counts, new_code, row_space_change)
+            return
+        with self.counter_lock:
+            self._update_run_counters(row, old_counts, new_code, row_space_change)
+
+    def _update_run_counters(
+        self, row: int, old_counts: List[int], new_code: int, row_space_change: int
+    ) -> None:
+        """Update the counters of the whole seat map after a run state change.
+        Args:
+            row(int): the row index of the changed seats.
+            old_counts(List[int]): number of changed seats of every old state code.
+            new_code(int): the new state code of the seats.
+            row_space_change(int): 1 if the row gets space, -1 if it gets full.
+        """
+        for code, old_count in enumerate(old_counts):
+            self.state_counts[code] -= old_count
+        self.state_counts[new_code] += sum(old_counts)
+        if row_space_change == -1:
+            self.rows_with_space &= ~(1 << row)
+        elif row_space_change == 1:
+            self.rows_with_space |= 1 << row
+
+    def reserve_if_empty(self, row: int, col: int) -> bool:
+        """Atomically reserve the seat at given position if it is Empty.
+        Args:
+            row(int): the row index of the seat.
+            col(int): the column index of the seat.
+        Returns:
+            a boolean value to indicate the seat is reserved or not.
+        """
+        return self.compare_and_set(
+            [(row, col, consts.SEAT_CODE_EMPTY, consts.SEAT_CODE_RESERVED)]
+        )
+
+    def compare_and_set(self, changes: List[tuple]) -> bool:
+        """Atomically change the state codes of many seats.
+            Either every seat is still in its expected state and all changes are
+            applied, or no change is applied at all.
+        Args:
+            changes(List[tuple]): a list of (row, col, expected_code, new_code).
+        Returns:
+            a boolean value to indicate the changes are applied or not.
+        """
+        locks = []
+        if self.thread_safe:
+            stripes = sorted({row % consts.NUM_ROW_LOCKS for row, _, _, _ in changes})
+            locks = [self.row_locks[stripe] for stripe in stripes]
+        for lock in locks:
+            lock.acquire()
+        try:
+            for row, col, expected_code, _ in changes:
+                if self.states[row * self.cols + col] != expected_code:
+                    return False
+            for row, col, _, new_code in changes:
+                self._write_state_code(row, col, new_code)
+            return True
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def _write_state_code(self, row: int, col: int, new_code: int) -> None:
+        """Write the raw state code of the seat and update counters.
+            In thread-safe mode the caller must hold the lock of the row.
+        Args:
+            row(int): the row index of the seat.
+            col(int): the column index of the seat.
+            new_code(int): new state code of the seat.
+        """
+        idx = row * self.cols + col
+        old_code = self.states[idx]
+        if old_code == new_code:
+            return
+        self.states[idx] = new_code
+        self.row_versions[row] += 1
+        self.row_state_counts[old_code][row] -= 1
+        self.row_state_counts[new_code][row] += 1
+        row_space_change = 0
+        if old_code == consts.SEAT_CODE_EMPTY:
+            self.free_masks[row] &= ~(1 << col)
+            if not self.free_masks[row]:
+                row_space_change = -1
+        elif new_code == consts.SEAT_CODE_EMPTY:
+            self.free_masks[row] |= 1 << col
+            row_space_change = 1
+        if not self.thread_safe:
+            self._update_counters(row, old_code, new_code, row_space_change)
+            return
+        with self.counter_lock:
+            self._update_counters(row, old_code, new_code, row_space_change)
+
+    def _update_counters(
+        self, row: int, old_code: int, new_code: int, row_space_change: int
+    ) -> None:
+        """Update the counters of the whole seat map after a state change.
+        Args:
+            row(int): the row index of the changed seat.
+            old_code(int): the old state code of the seat.
+            new_code(int): the new state code of the seat.
+            row_space_change(int): 1 if the row gets space, -1 if it gets full.
+        """
+        self.state_counts[old_code] -= 1
+        self.state_counts[new_code] += 1
+        if row_space_change == -1:
+            self.rows_with_space &= ~(1 << row)
+        elif row_space_change == 1:
+            self.rows_with_space |= 1 << row
+
+    @classmethod
+    def from_buffer(
+        cls,
+        rows: int,
+        cols: int,
+        states,
+        debug: bool = False,
+        thread_safe: bool = False,
+    ) -> "SeatMap":
+        """Create a seat map which stores its state codes in a given buffer.
+            The buffer is used as is, so a memory-mapped buffer is never copied.
+        Args:
+            rows(int): number of rows of the seat map.
+            cols(int): number of seats in each row.
+            states(bytearray | memoryview): a writable buffer of rows * cols codes.
+            debug(bool): cross-check the counters against a full scan on every read.
+            thread_safe(bool): guard the state changes with striped row locks.
+        Returns:
+            the seat map.
+        """
+        if len(states) != rows * cols:
+            raise ValueError(msg.MSG_INVALID_SEAT_MAP_SNAPSHOT)
+        seat_map = cls(rows, 0, debug, thread_safe)
+        seat_map.cols = cols
+        seat_map.states = states
+        seat_map._rebuild_indexes()
+        return seat_map
+
+    def load_states(self, codes: bytes) -> None:
+        """Replace the state codes of all seats and rebuild counters and bitmasks.
+        Args:
+            codes(bytes): the state codes of all seats, in row-major order.
+        """
+        if len(codes) != self.rows * self.cols:
+            raise ValueError(msg.MSG_INVALID_SEAT_MAP_SNAPSHOT)
+        self.states[:] = codes
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild counters and bitmasks from the state codes with one row scan."""
+        self.state_counts = [0] * len(consts.SEAT_CODE_STATES)
+        self.rows_with_space = 0
+        for row in range(self.rows):
+            row_codes = self.row_codes(row)
+            for code in range(len(consts.SEAT_CODE_STATES)):
+                row_count = row_codes.count(code)
+                self.row_state_counts[code][row] = row_count
+                self.state_counts[code] += row_count
+            free_digits = row_codes.translate(FREE_SEAT_DIGITS_TABLE)[::-1]
+            self.free_masks[row] = int(free_digits, 2) if free_digits else 0
+            if self.free_masks[row]:
+                self.rows_with_space |= 1 << row
+            self.row_versions[row] += 1
+
+    def begin_transaction(self) -> "SeatTransaction":
+        """Begin a transaction which records the state changes in an undo log."""
+        return SeatTransaction(self)
+
+    def first_row_with_space(self, start_row: int = 0) -> int:
+        """Get the first row at or after given row which has at least one Empty seat.
+        Args:
+            start_row(int): the row index to start looking up.
+        Returns:
+            the row index, or -1 if there is no such row.
+        """
+        rows_mask = self.rows_with_space >> start_row
+        if not rows_mask:
+            return -1
+        return start_row + (rows_mask & -rows_mask).bit_length() - 1
+
+    def free_count(self, row: int) -> int:
+        """Count the Empty seats of given row.
+        Args:
+            row(int): the row index.
+        Returns:
+            number of Empty seats in the row.
+        """
+        return self.free_masks[row].bit_count()
+
+    def next_free_col(self, row: int, start_col: int = 0) -> int:
+        """Get the first Empty seat of given row at or after given column.
+        Args:
+            row(int): the row index.
+            start_col(int): the column index to start looking up.
+        Returns:
+            the column index, or -1 if there is no Empty seat.
+        """
+        free_mask = self.free_masks[row] >> start_col
+        if not free_mask:
+            return -1
+        return start_col + (free_mask & -free_mask).bit_length() - 1
+
+    def free_cols(self, row: int) -> List[int]:
+        """Get all Empty seats of given row.
+        Args:
+            row(int): the row index.
+        Returns:
+            a list of column indexes in ascending order.
+        """
+        free_cols = []
+        free_mask = self.free_masks[row]
+        while free_mask:
+            lowest_bit = free_mask & -free_mask
+            free_cols.append(lowest_bit.bit_length() - 1)
+            free_mask ^= lowest_bit
+        return free_cols
+
+    def is_free(self, row: int, col: int) -> bool:
+        """Check whether the seat at given position is Empty.
+        Args:
+            row(int): the row index of the seat.
+            col(int): the column index of the seat.
+        Returns:
+            a boolean value to indicate the seat is Empty or not.
+        """
+        return bool(self.free_masks[row] >> col & 1)
+
+    def seat(self, row: int, col: int) -> Seat:
+        """Get a lightweight view of the seat at given position.
+        Args:
+            row(int): the row index of the seat.
+            col(int): the column index of the seat.
+        Returns:
+            a seat which reads and writes its state through the seat map.
+        """
+        return Seat.view(self, row, col)
+
+    def seats(self, positions: List[tuple]) -> List[Seat]:
+        """Get views of the seats at given positions.
+        Args:
+            positions(List[tuple]): a list of (row, col) positions.
+        Returns:
+            a list of seats.
+        """
+        return [Seat.view(self, row, col) for row, col in positions]
+
+    def count(self, state: str) -> int:
+        """Count the seats in given state.
+        Args:
+            state(str): the state of seats to count.
+        Returns:
+            number of seats in given state.
+        """
+        if self.debug:
+            self.verify_counters()
+        return self.state_counts[consts.SEAT_STATE_CODES[state]]
+
+    def row_count(self, row: int, state: str) -> int:
+        """Count the seats in given state of given row.
+        Args:
+            row(int): the row index.
+            state(str): the state of seats to count.
+        Returns:
+            number of seats in given state of the row.
+        """
+        if self.debug:
+            self.verify_counters()
+        return self.row_state_counts[consts.SEAT_STATE_CODES[state]][row]
+
+    def verify_counters(self) -> None:
+        """Cross-check the counters and bitmasks against a full scan of the seat map."""
+        states = bytes(self.states)
+        for code in range(len(consts.SEAT_CODE_STATES)):
+            if states.count(code) != self.state_counts[code]:
+                raise RuntimeError(msg.MSG_INVALID_SEAT_COUNTERS)
+            for row in range(self.rows):
+                if self.row_codes(row).count(code) != self.row_state_counts[code][row]:
+                    raise RuntimeError(msg.MSG_INVALID_SEAT_COUNTERS)
+        for row in range(self.rows):
+            free_mask = sum(
+                1 << col
+                for col, code in enumerate(self.row_codes(row))
+                if code == consts.SEAT_CODE_EMPTY
+            )
+            if free_mask != self.free_masks[row]:
+                raise RuntimeError(msg.MSG_INVALID_SEAT_COUNTERS)
+            if bool(free_mask) != bool(self.rows_with_space >> row & 1):
+                raise RuntimeError(msg.MSG_INVALID_SEAT_COUNTERS)
+
+    def run_codes(self, row: int, start_col: int, length: int) -> bytes:
+        """Get the raw state codes of a run of adjacent seats of given row.
+        Args:
+            row(int): the row index.
+            start_col(int): the column index of the first seat of the run.
+            length(int): number of seats in the run.
+        Returns:
+            a bytes object of state codes.
+        """
+        start = row * self.cols + start_col
+        return bytes(self.states[start : start + length])
+
+    def row_codes(self, row: int) -> bytes:
+        """Get the raw state codes of all seats in given row.
+        Args:
+            row(int): the row index.
+        Returns:
+            a bytes object of state codes.
+        """
+        start = row * self.cols
+        return bytes(self.states[start : start + self.cols])
+
+
+class SeatTransaction:
+    def __init__(self, seat_map: SeatMap) -> None:
+        """Initialize a transaction of state changes on the seat map.
+            The original state code of every changed seat is kept in an undo log,
+            so that commit and rollback take time proportional to the change.
+        Args:
+            seat_map(SeatMap): the seat map to change.
+        """
+        self.seat_map = seat_map
+        self.undo_log = {}
+
+    def set_state_code(self, row: int, col: int, new_code: int) -> None:
+        """Set the raw state code of the seat and record its original state code.
+        Args:
+            row(int): the row index of the seat.
+            col(int): the column index of the seat.
+            new_code(int): new state code of the seat.
+        """
+        position = (row, col)
+        if position not in self.undo_log:
+            old_code = self.seat_map.states[row * self.seat_map.cols + col]
+            self.undo_log[position] = (old_code, new_code)
+        else:
+            self.undo_log[position] = (self.undo_log[position][0], new_code)
+        self.seat_map.set_state_code(row, col, new_code)
+
+    def compare_and_set(self, changes: List[tuple]) -> bool:
+        """Atomically change the state codes of many seats and record the changes.
+        Args:
+            changes(List[tuple]): a list of (row, col, expected_code, new_code).
+        Returns:
+            a boolean value to indicate the changes are applied or not.
+        """
+        if not self.seat_map.compare_and_set(changes):
+            return False
+        for row, col, old_code, new_code in changes:
+            position = (row, col)
+            if position in self.undo_log:
+                old_code = self.undo_log[position][0]
+            self.undo_log[position] = (old_code, new_code)
+        return True
+
+    def commit(self) -> None:
+        """Keep all changes and clear the undo log."""
+        self.undo_log = {}
+
+    def rollback(self) -> None:
+        """Restore the original state of the changed seats and clear the undo log.
+        A seat which was changed again outside the transaction is left untouched.
+        """
+        for (row, col), (old_code, new_code) in self.undo_log.items():
+            if self.seat_map.states[row * self.seat_map.cols + col] == new_code:
+                self.seat_map.set_state_code(row, col, old_code)
+        self.undo_log = {}
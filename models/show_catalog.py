@@ -0,0 +1,161 @@
+import os
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import utils.messages as msg
+from models.cinema import Cinema
+from storage.booking_journal import BookingJournal
+from storage.booking_store import BookingStore
+from utils.validation import is_valid_show_id
+
+
+class ShowCatalog:
+    def __init__(
+        self,
+        thread_safe: bool = False,
+        data_dir: Optional[str] = None,
+        store: Optional[BookingStore] = None,
+    ) -> None:
+        """Initialize an empty catalog of shows.
+        Shows are indexed by show id, by movie title and by start time.
+        Args:
+            thread_safe(bool): create shows which can be booked concurrently.
+            data_dir(str): the directory to persist the bookings of every show in,
+                it is created if it does not exist.
+                Keep the bookings in memory only by default.
+            store(BookingStore): the booking store to keep the bookings of every
+                show in, instead of the heap.
+        """
+        self.thread_safe = thread_safe
+        self.data_dir = data_dir
+        if data_dir is not None:
+            os.makedirs(data_dir, exist_ok=True)
+        self.store = store
+        self.journals: Dict[str, BookingJournal] = {}
+        self.shows: Dict[str, Cinema] = {}
+        self.title_index: Dict[str, List[str]] = {}
+        self.start_time_index: Dict[datetime, List[str]] = {}
+        self.start_times: List[datetime] = []
+
+    def __len__(self) -> int:
+        """Get the number of shows in the catalog."""
+        return len(self.shows)
+
+    def add_show(
+        self,
+        show_id: str,
+        movie_title: str,
+        rows: int,
+        seats_per_row: int,
+        start_time: Optional[datetime] = None,
+    ) -> Cinema:
+        """Create a new show and add it into the catalog.
+        Args:
+            show_id(str): the unique identifier of the show.
+            movie_title(str): the title of the movie.
+            rows(int): number of rows of the hall.
+            seats_per_row(int): number of seats in each row of the hall.
+            start_time(datetime): the start time of the show.
+        Returns:
+            the cinema of the new show.
+        """
+        if not is_valid_show_id(show_id):
+            raise ValueError(msg.MSG_INVALID_SHOW_ID)
+        show_id = show_id.upper()
+        if show_id in self.shows:
+            raise ValueError(msg.MSG_DUPLICATED_SHOW_ID.format(show_id=show_id))
+        cinema = Cinema(
+            movie_title,
+            rows,
+            seats_per_row,
+            show_id=show_id,
+            start_time=start_time,
+            thread_safe=self.thread_safe,
+        )
+        if self.store is not None:
+            cinema.attach_store(self.store)
+        if self.data_dir is not None:
+            self.journals[show_id] = BookingJournal.open(
+                cinema, os.path.join(self.data_dir, show_id)
+            )
+        self.shows[show_id] = cinema
+        self.title_index.setdefault(movie_title.lower(), []).append(show_id)
+        if start_time is not None:
+            if start_time not in self.start_time_index:
+                insort(self.start_times, start_time)
+            self.start_time_index.setdefault(start_time, []).append(show_id)
+        return cinema
+
+    def is_show_id_exist(self, show_id: str) -> bool:
+        """Check whether given show id exist in the catalog or not.
+        Args:
+            show_id(str): the show id.
+        Returns:
+            a boolean value to indicate the show id exist or not.
+        """
+        return show_id.upper() in self.shows
+
+    def get_show(self, show_id: str) -> Cinema:
+        """Get the show with given show id.
+        Args:
+            show_id(str): the show id.
+        Returns:
+            the cinema of the show.
+        """
+        show_id = show_id.upper()
+        if show_id not in self.shows:
+            raise ValueError(msg.MSG_NOT_EXIST_SHOW_ID.format(show_id=show_id))
+        return self.shows[show_id]
+
+    def find_by_title(self, movie_title: str) -> List[Cinema]:
+        """Find the shows of given movie title, case-insensitive.
+        Args:
+            movie_title(str): the title of the movie.
+        Returns:
+            a list of shows in the order they were added.
+        """
+        show_ids = self.title_index.get(movie_title.lower(), [])
+        return [self.shows[show_id] for show_id in show_ids]
+
+    def find_by_start_time(
+        self, start_time: datetime, end_time: Optional[datetime] = None
+    ) -> List[Cinema]:
+        """Find the shows which start at given time or within given time range.
+        Args:
+            start_time(datetime): the start time, or the beginning of the range.
+            end_time(datetime): the end of the range, inclusive.
+        Returns:
+            a list of shows ordered by start time.
+        """
+        if end_time is None:
+            show_ids = self.start_time_index.get(start_time, [])
+            return [self.shows[show_id] for show_id in show_ids]
+        lower = bisect_left(self.start_times, start_time)
+        upper = bisect_right(self.start_times, end_time)
+        return [
+            self.shows[show_id]
+            for time in self.start_times[lower:upper]
+            for show_id in self.start_time_index[time]
+        ]
+
+    def list_shows(self) -> List[Cinema]:
+        """List all shows ordered by start time, shows without start time last."""
+        timed_shows = [
+            self.shows[show_id]
+            for time in self.start_times
+            for show_id in self.start_time_index[time]
+        ]
+        untimed_shows = [
+            cinema for cinema in self.shows.values() if cinema.start_time is None
+        ]
+        return timed_shows + untimed_shows
+
+    def close(self) -> None:
+        """Flush and close the journals of all shows and the booking store."""
+        for journal in self.journals.values():
+            journal.close()
+        self.journals = {}
+        if self.store is not None:
+            self.store.close()
+            self.store = None
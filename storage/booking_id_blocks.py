@@ -0,0 +1,103 @@
+import os
+
+import utils.messages as msg
+from models.booking_id_allocator import BookingIdBlocks
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# Files are locked with flock on POSIX and with msvcrt on Windows.
+FILE_LOCK_SUPPORTED = fcntl is not None or msvcrt is not None
+
+
+class FileBookingIdBlocks(BookingIdBlocks):
+    def __init__(self, path: str) -> None:
+        """Initialize a source of booking number blocks shared between processes.
+            The last booking number handed out is kept in a file, which is
+            locked while a block is reserved.
+        Args:
+            path(str): the path of the file.
+        """
+        if not FILE_LOCK_SUPPORTED:
+            raise OSError(msg.MSG_FILE_LOCK_NOT_SUPPORTED)
+        super().__init__()
+        self.path = path
+
+    def reserve(self, block_size: int) -> range:
+        """Reserve the next block of booking numbers.
+        Args:
+            block_size(int): number of booking numbers in the block.
+        Returns:
+            the range of booking numbers of the block.
+        """
+        with self.lock:
+            first_number = self._update(lambda last_number: last_number + block_size)
+        return range(first_number, first_number + block_size)
+
+    def advance_to(self, last_number: int) -> None:
+        """Never hand out booking numbers up to given number.
+        Args:
+            last_number(int): the last booking number already used.
+        """
+        with self.lock:
+            self._update(lambda current_number: max(current_number, last_number))
+
+    def _update(self, update) -> int:
+        """Update the last booking number in the file under an exclusive lock.
+        Args:
+            update(Callable[[int], int]): compute the new last booking number.
+        Returns:
+            the number after the last booking number before the update.
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock(fd)
+            try:
+                content = os.read(fd, 32).strip()
+                last_number = int(content) if content else 0
+                self.last_number = update(last_number)
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, str(self.last_number).encode())
+                os.fsync(fd)
+            finally:
+                _unlock(fd)
+        finally:
+            os.close(fd)
+        return last_number + 1
+
+
+def _lock(fd: int) -> None:
+    """Lock an open file exclusively, waiting until no other process holds it.
+    Args:
+        fd(int): the file descriptor.
+    """
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return
+    # msvcrt locks the first byte, and LK_LOCK gives up after ten seconds.
+    while True:
+        os.lseek(fd, 0, os.SEEK_SET)
+        try:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock(fd: int) -> None:
+    """Unlock an open file locked by _lock.
+    Args:
+        fd(int): the file descriptor.
+    """
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return
+    os.lseek(fd, 0, os.SEEK_SET)
+    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,208 @@
+import json
+import os
+import threading
+from typing import List, Optional, TextIO
+
+import utils.constants as consts
+from models.booking import Booking
+from models.cinema import Cinema
+from storage.seat_map_snapshot import SeatMapSnapshot, write_snapshot
+
+
+class BookingJournal:
+    def __init__(
+        self,
+        path_prefix: str,
+        fsync_every: int = consts.JOURNAL_FSYNC_EVERY,
+        snapshot_every: int = consts.JOURNAL_SNAPSHOT_EVERY,
+    ) -> None:
+        """Initialize the write-ahead journal of the bookings of one hall.
+            Every confirmed and released booking is appended to the journal file
+            as a compact JSON line. A snapshot of the seat map and the booking index
+            is written every few records and the journal is truncated after it,
+            so recovery loads the snapshot and replays only the later records.
+        Args:
+            path_prefix(str): the path of the journal and snapshot files without suffix.
+            fsync_every(int): number of records between two fsync calls,
+                0 leaves flushing to the disk to the operating system.
+            snapshot_every(int): number of records between two snapshots,
+                0 disables the periodic snapshots.
+        """
+        self.journal_path = f"{path_prefix}{consts.JOURNAL_FILE_SUFFIX}"
+        self.snapshot_path = f"{path_prefix}{consts.SNAPSHOT_FILE_SUFFIX}"
+        self.fsync_every = fsync_every
+        self.snapshot_every = snapshot_every
+        self.lock = threading.RLock()
+        self.cinema: Optional[Cinema] = None
+        self.journal_file: Optional[TextIO] = None
+        self.sequence = 0
+        self.num_unsynced = 0
+        self.num_since_snapshot = 0
+
+    @classmethod
+    def open(cls, cinema: Cinema, path_prefix: str, **kwargs) -> "BookingJournal":
+        """Recover the cinema from its journal and record its next changes.
+        Args:
+            cinema(Cinema): the cinema to recover and record.
+            path_prefix(str): the path of the journal and snapshot files without suffix.
+        Returns:
+            the journal attached to the cinema.
+        """
+        journal = cls(path_prefix, **kwargs)
+        journal.recover(cinema)
+        return journal
+
+    def recover(self, cinema: Cinema) -> int:
+        """Load the latest snapshot, replay the later records and attach the cinema.
+        Args:
+            cinema(Cinema): a cinema without bookings.
+        Returns:
+            the number of replayed records.
+        """
+        self.sequence = self._load_snapshot(cinema)
+        num_replayed = self._replay(cinema)
+        self.cinema = cinema
+        # The journal owns the file for its lifetime, close() closes it.
+        self.journal_file = open(self.journal_path, "a", encoding="utf-8")  # noqa: SIM115
+        cinema.journal = self
+        return num_replayed
+
+    def record_confirm(self, booking: Booking, last_booking_number: int) -> None:
+        """Append a confirmed booking to the journal.
+        Args:
+            booking(Booking): the confirmed booking.
+            last_booking_number(int): the last booking number issued by the cinema.
+        """
+        self._append(
+            {
+                "t": consts.JOURNAL_RECORD_CONFIRM,
+                "b": booking.booking_id,
+                "n": last_booking_number,
+                "s": self._pack_seats(booking),
+            }
+        )
+
+    def record_release(self, booking_id: str) -> None:
+        """Append a released booking to the journal.
+        Args:
+            booking_id(str): the booking id.
+        """
+        self._append({"t": consts.JOURNAL_RECORD_RELEASE, "b": booking_id})
+
+    def snapshot(self) -> None:
+        """Write a binary snapshot of the cinema and truncate the journal."""
+        with self.lock:
+            cinema = self.cinema
+            write_snapshot(
+                self.snapshot_path,
+                cinema.seat_map,
+                cinema.bookings,
+                cinema.last_booking_number,
+                self.sequence,
+            )
+            self.journal_file.truncate(0)
+            self.num_unsynced = 0
+            self.num_since_snapshot = 0
+
+    def flush(self) -> None:
+        """Flush the journal file to the disk."""
+        with self.lock:
+            self.journal_file.flush()
+            os.fsync(self.journal_file.fileno())
+            self.num_unsynced = 0
+
+    def close(self) -> None:
+        """Flush and close the journal file and detach the cinema."""
+        with self.lock:
+            if self.journal_file is None:
+                return
+            self.flush()
+            self.journal_file.close()
+            self.journal_file = None
+            self.cinema.journal = None
+
+    def _append(self, record: dict) -> None:
+        """Append a record with the next sequence number.
+        Args:
+            record(dict): the record to append.
+        """
+        with self.lock:
+            self.sequence += 1
+            record = {"q": self.sequence, **record}
+            self.journal_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+            self.journal_file.flush()
+            self.num_unsynced += 1
+            if self.fsync_every and self.num_unsynced >= self.fsync_every:
+                self.flush()
+            self.num_since_snapshot += 1
+            if self.snapshot_every and self.num_since_snapshot >= self.snapshot_every:
+                self.snapshot()
+
+    def _load_snapshot(self, cinema: Cinema) -> int:
+        """Load the snapshot into the cinema if there is one.
+            The snapshot is memory-mapped and only read when the cinema is used.
+        Args:
+            cinema(Cinema): a cinema without bookings.
+        Returns:
+            the sequence number of the last record included in the snapshot.
+        """
+        if not os.path.exists(self.snapshot_path):
+            return 0
+        snapshot = SeatMapSnapshot(self.snapshot_path)
+        cinema.load_snapshot(snapshot)
+        return snapshot.sequence
+
+    def _replay(self, cinema: Cinema) -> int:
+        """Replay the records after the snapshot into the cinema.
+            A torn record at the end of the journal, left by a crash in the middle
+            of a write, is cut off.
+        Args:
+            cinema(Cinema): the cinema to replay into.
+        Returns:
+            the number of replayed records.
+        """
+        if not os.path.exists(self.journal_path):
+            return 0
+        num_replayed = 0
+        valid_size = 0
+        with open(self.journal_path, "rb") as journal_file:
+            for line in journal_file:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                valid_size += len(line)
+                if record["q"] <= self.sequence:
+                    continue
+                self._apply(cinema, record)
+                self.sequence = record["q"]
+                num_replayed += 1
+        if valid_size != os.path.getsize(self.journal_path):
+            os.truncate(self.journal_path, valid_size)
+        self.num_since_snapshot = num_replayed
+        return num_replayed
+
+    def _apply(self, cinema: Cinema, record: dict) -> None:
+        """Apply one record to the cinema.
+        Args:
+            cinema(Cinema): the cinema to apply to.
+            record(dict): the record to apply.
+        """
+        if record["t"] == consts.JOURNAL_RECORD_CONFIRM:
+            cinema.restore_booking(record["b"], self._unpack_seats(cinema, record["s"]))
+            cinema.last_booking_number = max(cinema.last_booking_number, record["n"])
+        elif record["t"] == consts.JOURNAL_RECORD_RELEASE:
+            cinema.release_booking(record["b"])
+
+    def _pack_seats(self, booking: Booking) -> List[int]:
+        """Pack the seats of a booking into row * cols + col integers."""
+        cols = self.cinema.seats_per_row
+        return [row * cols + col for row, col in booking.positions()]
+
+    @staticmethod
+    def _unpack_seats(cinema: Cinema, packed_seats: List[int]) -> List[tuple]:
+        """Unpack row * cols + col integers into (row, col) positions."""
+        cols = cinema.seats_per_row
+        return [divmod(packed_seat, cols) for packed_seat in packed_seats]
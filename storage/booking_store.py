@@ -0,0 +1,263 @@
+import queue
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import utils.constants as consts
+import utils.messages as msg
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS bookings (
+        show_id TEXT NOT NULL,
+        booking_id TEXT NOT NULL,
+        num_seats INTEGER NOT NULL,
+        PRIMARY KEY (show_id, booking_id)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS booking_seats (
+        show_id TEXT NOT NULL,
+        seat INTEGER NOT NULL,
+        booking_id TEXT NOT NULL,
+        PRIMARY KEY (show_id, seat)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS booking_seats_by_booking
+    ON booking_seats (show_id, booking_id)
+    """,
+)
+
+
+class BookingStore:
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = consts.STORE_BATCH_SIZE,
+        pool_size: int = consts.STORE_POOL_SIZE,
+        cache_size: int = consts.STORE_CACHE_SIZE,
+    ) -> None:
+        """Initialize a store of confirmed bookings in a SQLite database.
+            The database runs in WAL mode, so readers never wait for the writer.
+            Confirmed bookings are queued and written in batches, each in a single
+            transaction. Reads go through a small LRU cache, then the queue,
+            then one of a pool of reader connections.
+            The seats of a booking are stored as row * cols + col integers.
+        Args:
+            path(str): the path of the database file.
+            batch_size(int): number of queued bookings which triggers a write.
+            pool_size(int): number of reader connections.
+            cache_size(int): number of bookings kept in the cache.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self.write_lock = threading.Lock()
+        self.writer = self._connect()
+        self.writer.execute("PRAGMA journal_mode=WAL")
+        for statement in SCHEMA:
+            self.writer.execute(statement)
+        self.readers: queue.Queue = queue.Queue()
+        for _ in range(pool_size):
+            self.readers.put(self._connect())
+        self.pending: Dict[Tuple[str, str], Tuple[int, ...]] = {}
+        self.cache: OrderedDict = OrderedDict()
+        self.cache_lock = threading.Lock()
+
+    def add_booking(self, show_id: str, booking_id: str, seats: List[int]) -> None:
+        """Queue a confirmed booking to be written with the next batch.
+            An existing booking is never replaced.
+        Args:
+            show_id(str): the show id.
+            booking_id(str): the booking id.
+            seats(List[int]): the packed seats of the booking.
+        """
+        key = (show_id, booking_id)
+        if self.has_booking(show_id, booking_id):
+            raise ValueError(
+                msg.MSG_DUPLICATED_BOOKING_ID.format(booking_id=booking_id)
+            )
+        with self.write_lock:
+            self.pending[key] = tuple(seats)
+            is_batch_full = len(self.pending) >= self.batch_size
+        self._cache_put(key, tuple(seats))
+        if is_batch_full:
+            self.flush()
+
+    def remove_booking(self, show_id: str, booking_id: str) -> Optional[List[int]]:
+        """Remove a booking from the store.
+        Args:
+            show_id(str): the show id.
+            booking_id(str): the booking id.
+        Returns:
+            the packed seats of the removed booking, or None if it does not exist.
+        """
+        seats = self.get_booking(show_id, booking_id)
+        if seats is None:
+            return None
+        self.flush()
+        with self.write_lock:
+            self.writer.execute("BEGIN")
+            self.writer.execute(
+                "DELETE FROM bookings WHERE show_id = ? AND booking_id = ?",
+                (show_id, booking_id),
+            )
+            self.writer.execute(
+                "DELETE FROM booking_seats WHERE show_id = ? AND booking_id = ?",
+                (show_id, booking_id),
+            )
+            self.writer.execute("COMMIT")
+        self._cache_put((show_id, booking_id), None)
+        return seats
+
+    def get_booking(self, show_id: str, booking_id: str) -> Optional[List[int]]:
+        """Get the packed seats of a booking.
+        Args:
+            show_id(str): the show id.
+            booking_id(str): the booking id.
+        Returns:
+            the packed seats of the booking, or None if it does not exist.
+        """
+        key = (show_id, booking_id)
+        with self.cache_lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                seats = self.cache[key]
+                return None if seats is None else list(seats)
+        with self.write_lock:
+            seats = self.pending.get(key)
+        if seats is None:
+            with self._reader() as reader:
+                rows = reader.execute(
+                    "SELECT seat FROM booking_seats "
+                    "WHERE show_id = ? AND booking_id = ? ORDER BY seat",
+                    key,
+                ).fetchall()
+            seats = tuple(seat for (seat,) in rows) if rows else None
+        self._cache_put(key, seats)
+        return None if seats is None else list(seats)
+
+    def has_booking(self, show_id: str, booking_id: str) -> bool:
+        """Check whether a booking exists in the store.
+        Args:
+            show_id(str): the show id.
+            booking_id(str): the booking id.
+        Returns:
+            a boolean value to indicate the booking exists or not.
+        """
+        return self.get_booking(show_id, booking_id) is not None
+
+    def find_seat_booking(self, show_id: str, seat: int) -> Optional[str]:
+        """Find the booking which holds a seat of a show.
+        Args:
+            show_id(str): the show id.
+            seat(int): the packed seat.
+        Returns:
+            the booking id, or None if no booking holds the seat.
+        """
+        self.flush()
+        with self._reader() as reader:
+            row = reader.execute(
+                "SELECT booking_id FROM booking_seats WHERE show_id = ? AND seat = ?",
+                (show_id, seat),
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def list_seats(self, show_id: str) -> List[Tuple[int, str]]:
+        """List the booked seats of a show with the booking which holds each one.
+        Args:
+            show_id(str): the show id.
+        Returns:
+            a list of (seat, booking_id) pairs ordered by the packed seat.
+        """
+        self.flush()
+        with self._reader() as reader:
+            return reader.execute(
+                "SELECT seat, booking_id FROM booking_seats "
+                "WHERE show_id = ? ORDER BY seat",
+                (show_id,),
+            ).fetchall()
+
+    def count_bookings(self, show_id: str) -> int:
+        """Count the bookings of a show.
+        Args:
+            show_id(str): the show id.
+        Returns:
+            number of bookings of the show.
+        """
+        self.flush()
+        with self._reader() as reader:
+            (num_bookings,) = reader.execute(
+                "SELECT COUNT(*) FROM bookings WHERE show_id = ?", (show_id,)
+            ).fetchone()
+        return num_bookings
+
+    def flush(self) -> List[Tuple[str, str]]:
+        """Write the queued bookings in a single transaction.
+            Every booking is inserted under a savepoint of its own. A booking whose
+            id or one of whose seats is already stored is left out, and the other
+            bookings of the batch are still written.
+        Returns:
+            the (show_id, booking_id) keys of the bookings which were left out.
+        """
+        rejected = []
+        with self.write_lock:
+            if not self.pending:
+                return rejected
+            pending, self.pending = self.pending, {}
+            self.writer.execute("BEGIN")
+            for (show_id, booking_id), seats in pending.items():
+                self.writer.execute("SAVEPOINT booking")
+                try:
+                    self.writer.execute(
+                        "INSERT INTO bookings VALUES (?, ?, ?)",
+                        (show_id, booking_id, len(seats)),
+                    )
+                    self.writer.executemany(
+                        "INSERT INTO booking_seats VALUES (?, ?, ?)",
+                        [(show_id, seat, booking_id) for seat in seats],
+                    )
+                except sqlite3.IntegrityError:
+                    self.writer.execute("ROLLBACK TO booking")
+                    rejected.append((show_id, booking_id))
+                self.writer.execute("RELEASE booking")
+            self.writer.execute("COMMIT")
+        with self.cache_lock:
+            for key in rejected:
+                self.cache.pop(key, None)
+        return rejected
+
+    def close(self) -> None:
+        """Write the queued bookings and close all connections."""
+        self.flush()
+        self.writer.close()
+        while not self.readers.empty():
+            self.readers.get().close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection which can be shared between threads."""
+        connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a reader connection from the pool."""
+        reader = self.readers.get()
+        try:
+            yield reader
+        finally:
+            self.readers.put(reader)
+
+    def _cache_put(self, key: Tuple[str, str], seats: Optional[Tuple[int, ...]]):
+        """Put the seats of a booking, or None for a missing booking, in the cache."""
+        with self.cache_lock:
+            self.cache[key] = seats
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
@@ -0,0 +1,146 @@
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, List, Tuple
+
+import utils.constants as consts
+import utils.messages as msg
+from models.booking import Booking
+from models.seat_map import SeatMap
+
+SNAPSHOT_MAGIC = b"GICS"
+SNAPSHOT_VERSION = 1
+# magic, version, reserved, rows, cols, last booking number, sequence,
+# number of Empty seats, number of bookings.
+SNAPSHOT_HEADER = struct.Struct("<4sHHIIQQII")
+SNAPSHOT_BOOKING_ID_SIZE = 16
+# booking id, index of its first seat in the seat list, number of seats.
+SNAPSHOT_BOOKING = struct.Struct(f"<{SNAPSHOT_BOOKING_ID_SIZE}sII")
+SNAPSHOT_SEAT = struct.Struct("<I")
+SNAPSHOT_STATES_TABLE = bytes.maketrans(
+    bytes([consts.SEAT_CODE_RESERVED]), bytes([consts.SEAT_CODE_EMPTY])
+)
+
+
+class SeatMapSnapshot:
+    def __init__(self, path: str) -> None:
+        """Open a binary snapshot of a hall through a private memory map.
+            The file is laid out as a fixed-size header, the state code of every
+            seat, the booking index and the list of packed seats of all bookings.
+            Nothing is read besides the header until the seat map or the bookings
+            are requested, and the pages of the file are loaded lazily on access.
+            The memory map is copy-on-write, so the seat map can be changed in place
+            without touching the file.
+        Args:
+            path(str): the path of the snapshot file.
+        """
+        self.path = path
+        with open(path, "rb") as snapshot_file:
+            self.buffer = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        if len(self.buffer) < SNAPSHOT_HEADER.size:
+            raise ValueError(msg.MSG_INVALID_SNAPSHOT_FILE.format(path=path))
+        (
+            magic,
+            version,
+            _,
+            self.rows,
+            self.cols,
+            self.last_booking_number,
+            self.sequence,
+            self.num_empty,
+            self.num_bookings,
+        ) = SNAPSHOT_HEADER.unpack_from(self.buffer)
+        self.states_offset = SNAPSHOT_HEADER.size
+        self.bookings_offset = self.states_offset + self.rows * self.cols
+        self.seats_offset = (
+            self.bookings_offset + self.num_bookings * SNAPSHOT_BOOKING.size
+        )
+        if (
+            magic != SNAPSHOT_MAGIC
+            or version != SNAPSHOT_VERSION
+            or len(self.buffer) < self.seats_offset
+        ):
+            raise ValueError(msg.MSG_INVALID_SNAPSHOT_FILE.format(path=path))
+
+    def seat_map(self, debug: bool = False, thread_safe: bool = False) -> SeatMap:
+        """Create a seat map over the seat states of the snapshot without copying.
+        Args:
+            debug(bool): cross-check the counters against a full scan on every read.
+            thread_safe(bool): guard the state changes with striped row locks.
+        Returns:
+            the seat map.
+        """
+        states = memoryview(self.buffer)[self.states_offset : self.bookings_offset]
+        return SeatMap.from_buffer(self.rows, self.cols, states, debug, thread_safe)
+
+    def bookings(self) -> Iterator[Tuple[str, List[tuple]]]:
+        """Iterate the booking index of the snapshot.
+        Returns:
+            an iterator of the booking id and the (row, col) positions of its seats.
+        """
+        for index in range(self.num_bookings):
+            booking_id, first_seat, num_seats = SNAPSHOT_BOOKING.unpack_from(
+                self.buffer, self.bookings_offset + index * SNAPSHOT_BOOKING.size
+            )
+            packed_seats = struct.unpack_from(
+                f"<{num_seats}I",
+                self.buffer,
+                self.seats_offset + first_seat * SNAPSHOT_SEAT.size,
+            )
+            positions = [divmod(packed_seat, self.cols) for packed_seat in packed_seats]
+            yield booking_id.rstrip(b"\0").decode("ascii"), positions
+
+
+def write_snapshot(
+    path: str,
+    seat_map: SeatMap,
+    bookings: Dict[str, Booking],
+    last_booking_number: int,
+    sequence: int,
+) -> None:
+    """Write a binary snapshot of a hall.
+        The snapshot is written to a temporary file and renamed over the previous
+        one, so a crash never leaves a partial snapshot behind.
+        Reserved seats are pending and are saved as Empty.
+    Args:
+        path(str): the path of the snapshot file.
+        seat_map(SeatMap): the seat map of the hall.
+        bookings(Dict[str, Booking]): the confirmed bookings of the hall.
+        last_booking_number(int): the last booking number issued by the hall.
+        sequence(int): the sequence number of the last journal record included.
+    """
+    states = bytes(seat_map.states).translate(SNAPSHOT_STATES_TABLE)
+    booking_index = bytearray()
+    packed_seats = []
+    for booking_id, booking in bookings.items():
+        encoded_booking_id = booking_id.encode("ascii")
+        if len(encoded_booking_id) > SNAPSHOT_BOOKING_ID_SIZE:
+            raise ValueError(
+                msg.MSG_INVALID_SNAPSHOT_BOOKING_ID.format(booking_id=booking_id)
+            )
+        booking_index += SNAPSHOT_BOOKING.pack(
+            encoded_booking_id, len(packed_seats), booking.num_seats
+        )
+        packed_seats.extend(
+            row * seat_map.cols + col for row, col in booking.positions()
+        )
+    header = SNAPSHOT_HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        0,
+        seat_map.rows,
+        seat_map.cols,
+        last_booking_number,
+        sequence,
+        states.count(consts.SEAT_CODE_EMPTY),
+        len(bookings),
+    )
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as snapshot_file:
+        snapshot_file.write(header)
+        snapshot_file.write(states)
+        snapshot_file.write(booking_index)
+        snapshot_file.write(struct.pack(f"<{len(packed_seats)}I", *packed_seats))
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+    os.replace(temp_path, path)
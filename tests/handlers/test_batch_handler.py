@@ -0,0 +1,236 @@
+import io
+import json
+
+import pytest
+
+from handlers.batch_handler import BatchHandler
+from main import main
+
+
+def _run(command_lines, display=False):
+    output = io.StringIO()
+    num_failed = BatchHandler(display=display).run(command_lines, output)
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    return num_failed, results
+
+
+def test_booking_commands():
+    command_lines = [
+        '{"command": "create", "title": "Inception", "rows": 8, "seats_per_row": 10}',
+        '{"command": "book", "show_id": "S1", "tickets": 4}',
+        '{"command": "relocate", "show_id": "S1", "position": "B03"}',
+        '{"command": "confirm", "show_id": "S1"}',
+        "",
+        '{"command": "book", "show_id": "s1", "tickets": 2, "confirm": true}',
+        '{"command": "check", "show_id": "S1", "booking_id": "gic0001"}',
+        '{"command": "release", "show_id": "S1", "booking_id": "gic0002"}',
+    ]
+    num_failed, results = _run(command_lines)
+    assert num_failed == 0
+    assert results == [
+        {"ok": True, "show_id": "S1"},
+        {
+            "ok": True,
+            "booking_id": "GIC0001",
+            "status": "Reserved",
+            "seats": ["A04", "A05", "A06", "A07"],
+        },
+        {
+            "ok": True,
+            "booking_id": "GIC0001",
+            "status": "Reserved",
+            "seats": ["B03", "B04", "B05", "B06"],
+        },
+        {
+            "ok": True,
+            "booking_id": "GIC0001",
+            "status": "Confirmed",
+            "seats": ["B03", "B04", "B05", "B06"],
+        },
+        {
+            "ok": True,
+            "booking_id": "GIC0002",
+            "status": "Confirmed",
+            "seats": ["A05", "A06"],
+        },
+        {
+            "ok": True,
+            "booking_id": "GIC0001",
+            "status": "Confirmed",
+            "seats": ["B03", "B04", "B05", "B06"],
+        },
+        {"ok": True, "booking_id": "GIC0002"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "command_line, error",
+    [
+        ("not json", "Expecting value: line 1 column 1 (char 0)"),
+        ("[1, 2]", "Invalid command [[1, 2]]."),
+        ('{"command": "fly"}', "Invalid command [fly]."),
+        ('{"command": ["book"]}', "Invalid command [['book']]."),
+        ('{"command": {}}', "Invalid command [{}]."),
+        (
+            '{"command": "create", "show_id": "../../x", "title": "Up", "rows": 2, '
+            '"seats_per_row": 3}',
+            "Invalid show id. Please try again.",
+        ),
+        ('{"command": "book", "show_id": "S1"}', "Missing field [tickets]."),
+        (
+            '{"command": "book", "show_id": "S9", "tickets": 1}',
+            "Show id [S9] does not exist. Please try again.",
+        ),
+        (
+            '{"command": "book", "show_id": "S1", "tickets": 0}',
+            "Invalid number of tickets. Please try again.",
+        ),
+        (
+            '{"command": "book", "show_id": "S1", "tickets": 81}',
+            "Sorry, there are only 80 seats available.",
+        ),
+        (
+            '{"command": "book", "show_id": "S1", "tickets": 2, "position": "Z01"}',
+            "Invalid seating position. Please try again.",
+        ),
+        (
+            '{"command": "confirm", "show_id": "S1"}',
+            "There is no pending booking. Please book tickets first.",
+        ),
+        (
+            '{"command": "check", "show_id": "S1", "booking_id": "GIC0009"}',
+            "Booking id [GIC0009] does not exist. Please try again.",
+        ),
+        (
+            '{"command": "create", "title": "Up", "rows": 703, "seats_per_row": 10}',
+            "Invalid movie title or rows or seats per row. Please try again.",
+        ),
+    ],
+)
+def test_invalid_commands(command_line, error):
+    command_lines = [
+        '{"command": "create", "title": "Inception", "rows": 8, "seats_per_row": 10}',
+        command_line,
+    ]
+    num_failed, results = _run(command_lines)
+    assert num_failed == 1
+    assert results[1] == {"ok": False, "error": error, "line": 2}
+
+
+def test_display_seat_map():
+    command_lines = [
+        '{"command": "create", "title": "Up", "rows": 2, "seats_per_row": 3}',
+        '{"command": "book", "show_id": "S1", "tickets": 2, "display": true}',
+    ]
+    num_failed, results = _run(command_lines)
+    assert "map" not in results[0]
+    assert results[1]["map"] == [
+        "Selected seats:",
+        "S C R E E N",
+        "------",
+        "B . . .",
+        "A . o o",
+        "  1 2 3",
+    ]
+    num_failed, results = _run(command_lines[:1], display=True)
+    assert results[0]["map"][-2:] == ["A . . .", "  1 2 3"]
+
+
+def test_display_checked_booking():
+    command_lines = [
+        '{"command": "create", "title": "Up", "rows": 2, "seats_per_row": 3}',
+        '{"command": "book", "show_id": "S1", "tickets": 2, "confirm": true}',
+        '{"command": "book", "show_id": "S1", "tickets": 1}',
+        '{"command": "check", "show_id": "S1", "booking_id": "GIC0001"}',
+        '{"command": "confirm", "show_id": "S1"}',
+    ]
+    num_failed, results = _run(command_lines, display=True)
+    assert num_failed == 0
+    assert results[2]["map"][-2] == "A o # #"
+    assert results[3]["map"][-2] == "A o o o"
+    assert results[4]["map"][-2] == "A # # #"
+
+
+def test_book_at_invalid_position():
+    command_lines = [
+        '{"command": "create", "title": "Up", "rows": 2, "seats_per_row": 3}',
+        '{"command": "book", "show_id": "S1", "tickets": 2, "position": "C01"}',
+        '{"command": "book", "show_id": 1, "tickets": 1}',
+    ]
+    batch_handler = BatchHandler()
+    num_failed = batch_handler.run(command_lines, io.StringIO())
+    assert num_failed == 2
+    cinema = batch_handler.catalog.get_show("S1")
+    assert cinema.available_seats == 6
+    assert cinema.current_booking is None
+
+
+def test_batch_mode_from_file(tmp_path, capfd):
+    path = tmp_path / "commands.jsonl"
+    path.write_text('{"command": "book", "show_id": "S1", "tickets": 3}\n')
+    main(["--batch", str(path), "--show", "Inception 8 10"])
+    output, err = capfd.readouterr()
+    assert json.loads(output)["seats"] == ["A04", "A05", "A06"]
+    path.write_text('{"command": "book", "show_id": "S2", "tickets": 3}\n')
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--batch", str(path), "--show", "Inception 8 10"])
+    assert exit_info.value.code == 1
+
+
+def test_validate_commands():
+    command_lines = [
+        '{"command": "create", "title": "Inception", "rows": 8, "seats_per_row": 10}',
+        '{"command": "book", "show_id": "s1", "tickets": 2, "position": "H10"}',
+        '{"command": "book", "show_id": "S1", "tickets": 2, "position": "I01"}',
+        '{"command": "relocate", "show_id": "S2", "position": "A01"}',
+        "",
+        '{"command": "create", "show_id": "s1", "title": "Up", "rows": 2, '
+        '"seats_per_row": 3}',
+        '{"command": "create", "title": "Up", "rows": 2, "seats_per_row": 3}',
+        '{"command": "relocate", "show_id": "S2", "position": "B03"}',
+        '{"command": "check", "show_id": "S2", "booking_id": "GIC12"}',
+        '{"command": "release", "show_id": "S2", "booking_id": "gic0012"}',
+        '{"command": "book", "show_id": "S2", "tickets": 0}',
+        '{"command": "confirm", "show_id": "S1"}',
+    ]
+    output = io.StringIO()
+    batch_handler = BatchHandler()
+    num_invalid = batch_handler.validate(command_lines, output)
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert num_invalid == 5
+    assert [result["line"] for result in results] == [3, 4, 6, 9, 11]
+    assert results[1]["error"] == "Show id [S2] does not exist. Please try again."
+    assert results[2]["error"] == "Show id [S1] already exists."
+    assert len(batch_handler.catalog) == 0
+
+
+def test_validate_unsafe_show_id():
+    output = io.StringIO()
+    command_line = (
+        '{"command": "create", "show_id": "../x", "title": "Up", "rows": 2, '
+        '"seats_per_row": 3}'
+    )
+    assert BatchHandler().validate([command_line], output) == 1
+    assert (
+        json.loads(output.getvalue())["error"] == "Invalid show id. Please try again."
+    )
+
+
+def test_validate_unhashable_command_name():
+    output = io.StringIO()
+    num_invalid = BatchHandler().validate(['{"command": ["book"]}'], output)
+    assert num_invalid == 1
+    assert json.loads(output.getvalue())["error"] == "Invalid command [['book']]."
+
+
+def test_check_mode_from_file(tmp_path, capfd):
+    path = tmp_path / "commands.jsonl"
+    path.write_text(
+        '{"command": "book", "show_id": "S1", "tickets": 3}\n'
+        '{"command": "book", "show_id": "S2", "tickets": 3}\n'
+    )
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--batch", str(path), "--check", "--show", "Inception 8 10"])
+    assert exit_info.value.code == 1
+    output, err = capfd.readouterr()
+    assert json.loads(output)["line"] == 2
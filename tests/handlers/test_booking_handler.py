@@ -1,6 +1,10 @@
+import sys
+from datetime import datetime
+
 import pytest
 
 from handlers.booking_handler import BookingHandler
+from models.show_catalog import ShowCatalog
 
 
 def test_invalid_movie_title_rows_seats_per_row(monkeypatch, capfd):
@@ -74,3 +78,59 @@ def test_invalid_booking_id(monkeypatch, capfd, booking_id, expected_output):
         handler.run()
     output, err = capfd.readouterr()
     assert expected_output in output
+
+
+def test_select_show_from_catalog(monkeypatch, capfd):
+    catalog = ShowCatalog()
+    catalog.add_show("S1", "Inception", 8, 10, datetime(2025, 1, 1, 10, 0))
+    catalog.add_show("S2", "Blue Sky", 5, 5, datetime(2025, 1, 1, 14, 0))
+    inputs = iter(["  ", "S9", "s2", "1", "2", "", "3"])
+    monkeypatch.setattr("builtins.input", lambda: next(inputs))
+    handler = BookingHandler(catalog=catalog)
+    expected_outputs = [
+        "[S1] Inception at 2025-01-01 10:00 (80 seats available)",
+        "[S2] Blue Sky at 2025-01-01 14:00 (25 seats available)",
+        "Please select a show by entering its show id:",
+        "Invalid show id. Please try again.",
+        "Show id [S9] does not exist. Please try again.",
+        "[1] Book tickets for Blue Sky (25 seats available)",
+        "Booking id: GIC0001 confirmed.",
+        "[1] Book tickets for Blue Sky (23 seats available)",
+    ]
+    with pytest.raises(SystemExit):
+        handler.run()
+    output, err = capfd.readouterr()
+    for line in expected_outputs:
+        assert line in output
+    assert catalog.get_show("S2").available_seats == 23
+    assert catalog.get_show("S1").available_seats == 80
+
+
+def test_long_session_keeps_constant_stack_depth(monkeypatch):
+    round_trips = sys.getrecursionlimit()
+    inputs = iter(["Inception 8 10"] + ["2", ""] * round_trips + ["3"])
+    monkeypatch.setattr("builtins.input", lambda: next(inputs))
+    handler = BookingHandler()
+    with pytest.raises(SystemExit):
+        handler.run()
+    assert next(inputs, None) is None
+
+
+def test_feed_dialog_line_by_line(capfd):
+    catalog = ShowCatalog()
+    catalog.add_show("S1", "Inception", 8, 10)
+    handler = BookingHandler(catalog=catalog)
+    handler.start()
+    assert handler.state == "Select_Show"
+    for line in ["S1", "1", "4"]:
+        handler.handle_input(line)
+    assert handler.state == "Cinema_Handler"
+    assert handler.cinema_handler.state == "Seating_Position"
+    assert catalog.get_show("S1").available_seats == 76
+    handler.handle_input("")
+    assert handler.state == "Main_Menu"
+    handler.close()
+    handler.close()
+    output, err = capfd.readouterr()
+    assert "Booking id: GIC0001 confirmed." in output
+    assert catalog.get_show("S1").sessions.keys() == {"default"}
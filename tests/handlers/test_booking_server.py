@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from handlers.booking_server import BookingServer
+from main import build_catalog
+
+
+async def _run_client(port: int, lines: list) -> str:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for line in lines:
+        writer.write(f"{line}\n".encode())
+    await writer.drain()
+    writer.write_eof()
+    output = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    return output.decode()
+
+
+async def _serve_clients(catalog, clients: list) -> list:
+    server = await BookingServer(catalog, "127.0.0.1", 0).start()
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        return await asyncio.wait_for(
+            asyncio.gather(*(_run_client(port, lines) for lines in clients)), 10
+        )
+
+
+def test_serve_concurrent_clients():
+    catalog = build_catalog(["Inception 8 10", "Blue Sky 5 5"])
+    clients = [["S1", "1", "2", "", "3"] for _ in range(20)]
+    clients.append(["s2", "2", "GIC0001", "", "3"])
+    outputs = asyncio.run(_serve_clients(catalog, clients))
+    for output in outputs[:-1]:
+        assert "[S1] Inception at TBA (" in output
+        assert "confirmed." in output
+        assert "Thank you for using GIC Cinemas system. Bye!" in output
+    assert "Booking id [GIC0001] does not exist. Please try again." in outputs[-1]
+    cinema = catalog.get_show("S1")
+    assert cinema.available_seats == 40
+    assert len(cinema.bookings) == 20
+    assert cinema.sessions.keys() == {"default"}
+
+
+def test_client_disconnects_in_the_middle():
+    catalog = build_catalog(["Inception 8 10"])
+    outputs = asyncio.run(_serve_clients(catalog, [["S1", "1", "4"]]))
+    assert "Successfully reserved 4 Inception tickets." in outputs[0]
+    cinema = catalog.get_show("S1")
+    assert cinema.available_seats == 80
+    assert cinema.sessions.keys() == {"default"}
+
+
+@pytest.mark.parametrize("shows", [["Inception"], ["Inception 703 10"]])
+def test_build_catalog_with_invalid_show(shows):
+    with pytest.raises(ValueError):
+        build_catalog(shows)
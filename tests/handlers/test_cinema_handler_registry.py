@@ -0,0 +1,78 @@
+import pytest
+
+import utils.constants as consts
+from handlers.booking_handler import BookingHandler
+from handlers.cinema.cinema_handler import CinemaHandler
+from handlers.cinema.cinema_handler_registry import (
+    DEFAULT_MENU_OPTIONS,
+    CinemaHandlerRegistry,
+    MenuOption,
+)
+from handlers.cinema.exit_handler import ExitHandler
+from handlers.cinema.ticket_booking_handler import TicketBookingHandler
+from handlers.io.console_io_handler import ConsoleIOHandler
+from models.cinema import Cinema
+
+
+class SeatsLeftHandler(CinemaHandler):
+    def start(
+        self, cinema: Cinema, session_id: str = consts.DEFAULT_SESSION_ID
+    ) -> bool:
+        self.io_handler.output(f"Seats left: {cinema.available_seats}")
+        return False
+
+
+def test_handlers_are_created_once_with_shared_io_handler():
+    io_handler = ConsoleIOHandler()
+    registry = CinemaHandlerRegistry(io_handler)
+    handler = registry.get_handler("1")
+    assert isinstance(handler, TicketBookingHandler)
+    assert registry.get_handler("1") is handler
+    assert isinstance(registry.get_handler("3"), ExitHandler)
+    assert all(h.io_handler is io_handler for h in registry.handlers.values())
+
+
+def test_menu():
+    registry = CinemaHandlerRegistry(ConsoleIOHandler())
+    registry.register(MenuOption("4", "Seats left", SeatsLeftHandler))
+    assert registry.menu(Cinema("Inception", 8, 10)) == (
+        "Welcome to GIC Cinemas\n"
+        "[1] Book tickets for Inception (80 seats available)\n"
+        "[2] Check bookings\n"
+        "[3] Exit\n"
+        "[4] Seats left\n"
+        "Please enter your selection:"
+    )
+
+
+def test_menu_with_braces_in_custom_label():
+    registry = CinemaHandlerRegistry(ConsoleIOHandler())
+    registry.register(
+        MenuOption("{4}", "Seats left {movie_title} {0} }", SeatsLeftHandler)
+    )
+    assert registry.menu(Cinema("Up", 2, 3)).splitlines()[-2:] == [
+        "[{4}] Seats left {movie_title} {0} }",
+        "Please enter your selection:",
+    ]
+
+
+def test_register_duplicated_option():
+    registry = CinemaHandlerRegistry(ConsoleIOHandler())
+    with pytest.raises(ValueError):
+        registry.register(MenuOption("2", "Seats left", SeatsLeftHandler))
+
+
+def test_custom_menu_option(monkeypatch, capfd):
+    inputs = iter(["Inception 8 10", "1", "4", "", "4", "9", "3"])
+    monkeypatch.setattr("builtins.input", lambda: next(inputs))
+    menu_options = [
+        *DEFAULT_MENU_OPTIONS,
+        MenuOption("9", "Seats left", SeatsLeftHandler),
+    ]
+    handler = BookingHandler(menu_options=menu_options)
+    with pytest.raises(SystemExit):
+        handler.run()
+    output, err = capfd.readouterr()
+    assert "[9] Seats left" in output
+    assert "Invalid menu selection. Please try again." in output
+    assert "Seats left: 76" in output
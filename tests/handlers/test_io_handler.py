@@ -1,5 +1,8 @@
+import io
+
 import pytest
 
+from handlers.io.buffered_io_handler import BufferedIOHandler
 from handlers.io.console_io_handler import ConsoleIOHandler
 from handlers.io.io_handler import IOHandler
 
@@ -20,3 +23,46 @@ def test_output(capfd, output_value, expected_output_value):
     io_handler.output(output_value)
     output, err = capfd.readouterr()
     assert expected_output_value == output
+
+
+class CountingStringIO(io.StringIO):
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.num_writes = 0
+
+    def write(self, output_str: str) -> int:
+        self.num_writes += 1
+        return super().write(output_str)
+
+
+def test_buffered_output_is_flushed_on_input():
+    output_stream = CountingStringIO()
+    io_handler = BufferedIOHandler(io.StringIO("Jim\n"), output_stream)
+    io_handler.output("Hello")
+    io_handler.output_lines(line for line in ["A . .", "  1 2"])
+    assert output_stream.getvalue() == ""
+    assert io_handler.input() == "Jim"
+    assert output_stream.getvalue() == "Hello\nA . .\n  1 2\n"
+    assert output_stream.num_writes == 1
+    with pytest.raises(EOFError):
+        io_handler.input()
+
+
+def test_buffered_output_is_flushed_on_buffer_size():
+    output_stream = CountingStringIO()
+    io_handler = BufferedIOHandler(io.StringIO(), output_stream, buffer_size=10)
+    io_handler.output("Hello")
+    assert output_stream.num_writes == 0
+    io_handler.output("World")
+    assert output_stream.getvalue() == "Hello\nWorld\n"
+    io_handler.output("Bye")
+    assert output_stream.num_writes == 1
+
+
+def test_buffered_output_is_flushed_on_exit():
+    output_stream = CountingStringIO()
+    io_handler = BufferedIOHandler(io.StringIO(), output_stream)
+    io_handler.output("Bye")
+    with pytest.raises(SystemExit):
+        io_handler.exit()
+    assert output_stream.getvalue() == "Bye\n"
@@ -2,6 +2,7 @@ import pytest
 
 from models.booking import Booking
 from models.seat import Seat
+from models.seat_map import SeatMap
 
 
 @pytest.mark.parametrize(
@@ -90,3 +91,55 @@ def test_update_status(booking, new_status, new_state):
 def test_update_status_with_invalid_new_status(booking, new_status):
     with pytest.raises(ValueError):
         booking.update_status(new_status)
+
+
+def test_seat_masks():
+    booking = Booking(
+        "ABC0001",
+        "Reserved",
+        [Seat(1, 2, "Reserved"), Seat(1, 3, "Reserved"), Seat(4, 0, "Reserved")],
+    )
+    assert booking.seat_masks == {1: 0b1100, 4: 0b1}
+    booking.update_seats([Seat(0, 5, "Reserved")])
+    assert booking.seat_masks == {0: 0b100000}
+
+
+def test_booking_of_seat_map_keeps_runs():
+    seat_map = SeatMap(4, 10)
+    positions = [(1, 5), (1, 4), (1, 6), (2, 0), (1, 8), (2, 1)]
+    for row, col in positions:
+        seat_map.set_state(row, col, "Reserved")
+    booking = Booking("GIC0001", "Reserved", seat_map.seats(positions))
+    assert booking.runs == [(1, 4, 3), (1, 8, 1), (2, 0, 2)]
+    assert booking.num_seats == 6
+    assert booking.seat_masks == {1: 0b101110000, 2: 0b11}
+    assert [(seat.row, seat.col) for seat in booking.seats] == sorted(positions)
+    booking.update_status("Confirmed")
+    assert seat_map.count("Booked") == 6
+    booking.release_reserved_seats()
+    assert seat_map.count("Empty") == 40
+    seat_map.verify_counters()
+
+
+def test_update_positions():
+    seat_map = SeatMap(4, 10)
+    seat_map.set_run_state_code(0, 3, 2, 1)
+    booking = Booking.from_positions("GIC0001", "Reserved", seat_map, [(0, 3), (0, 4)])
+    seat_map.set_run_state_code(0, 3, 2, 0)
+    seat_map.set_run_state_code(2, 8, 2, 1)
+    booking.update_positions([(2, 9), (2, 8)])
+    assert booking.runs == [(2, 8, 2)]
+    assert booking.seat_masks == {2: 0b1100000000}
+    assert [seat.state for seat in booking.seats] == ["Reserved", "Reserved"]
+
+
+def test_booking_from_positions():
+    seat_map = SeatMap(4, 10)
+    seat_map.set_run_state_code(3, 2, 5, 2)
+    booking = Booking.from_positions(
+        "GIC0001", "Confirmed", seat_map, [(3, col) for col in range(2, 7)]
+    )
+    assert booking.runs == [(3, 2, 5)]
+    assert list(booking.positions())[-1] == (3, 6)
+    with pytest.raises(ValueError):
+        Booking.from_positions("GIC0002", "Confirmed", seat_map, [(3, 6), (3, 7)])
@@ -0,0 +1,42 @@
+import threading
+
+from models.booking_id_allocator import BookingIdAllocator, BookingIdBlocks
+
+
+def test_issue_in_blocks():
+    blocks = BookingIdBlocks()
+    allocator = BookingIdAllocator(blocks, block_size=3)
+    other_allocator = BookingIdAllocator(blocks, block_size=3)
+    assert [allocator.issue() for _ in range(2)] == [1, 2]
+    assert other_allocator.issue() == 4
+    assert [allocator.issue() for _ in range(2)] == [3, 7]
+    assert blocks.last_number == 9
+    assert allocator.last_number == 7
+
+
+def test_advance_to():
+    allocator = BookingIdAllocator(block_size=10)
+    assert allocator.issue() == 1
+    allocator.advance_to(25)
+    assert allocator.last_number == 25
+    assert allocator.issue() == 26
+    allocator.advance_to(3)
+    assert allocator.issue() == 27
+
+
+def test_concurrent_allocators_issue_unique_numbers():
+    blocks = BookingIdBlocks()
+    allocators = [BookingIdAllocator(blocks, block_size=8) for _ in range(4)]
+    issued = [[] for _ in allocators]
+
+    def _issue(index):
+        for _ in range(1000):
+            issued[index].append(allocators[index].issue())
+
+    threads = [threading.Thread(target=_issue, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(numbers == sorted(numbers) for numbers in issued)
+    assert len(set(sum(issued, []))) == 4000
@@ -1,3 +1,6 @@
+import sys
+import threading
+
 import pytest
 
 import utils.constants as consts
@@ -350,3 +353,209 @@ def test_check_booking_with_invalid_booking_id(cinema, num_tickets, booking_id):
         cinema.confirm_booking()
         cinema.start_checking()
         cinema.check_booking(booking_id)
+
+
+def test_screen_display_re_renders_only_dirty_rows():
+    cinema = Cinema("Inception", 8, 10)
+    first_display = cinema.screen_display()
+    cached_lines = list(cinema._row_lines)
+    cinema.create_default_booking(4)
+    display_str = cinema.screen_display()
+    assert "A . . . o o o o . . ." in display_str
+    assert cinema._row_lines[0] != cached_lines[0]
+    assert cinema._row_lines[1:] == cached_lines[1:]
+    assert display_str.split("\n")[3:10] == first_display.split("\n")[3:10]
+
+
+def test_create_bookings_batch():
+    cinema = Cinema("Inception", 8, 10)
+    booking_ids = cinema.create_bookings_batch([4, 12, 3], [None, None, "H01"])
+    assert booking_ids == ["GIC0001", "GIC0002", "GIC0003"]
+    assert cinema.last_booking_number == 3
+    assert cinema.available_seats == 61
+    assert all(
+        seat.state == consts.SEAT_STATE_BOOKED
+        for booking_id in booking_ids
+        for seat in cinema.bookings[booking_id].seats
+    )
+    display_str = cinema.screen_display()
+    for line in [
+        "H # # # . . . . . . .",
+        "B . . # # # # # # . .",
+        "A # # # # # # # # # #",
+    ]:
+        assert line in display_str
+
+
+@pytest.mark.parametrize(
+    "tickets, seating_positions, error",
+    [
+        ([40, 41], None, ValueError),
+        ([4, 0], None, ValueError),
+        ([4, 4], [None], ValueError),
+        ([4, 4], [None, "Z99"], KeyError),
+    ],
+)
+def test_create_bookings_batch_with_invalid_orders(tickets, seating_positions, error):
+    cinema = Cinema("Inception", 8, 10)
+    with pytest.raises(error):
+        cinema.create_bookings_batch(tickets, seating_positions)
+    assert cinema.available_seats == 80
+    assert cinema.bookings == {}
+
+
+def test_book_tickets_concurrently_never_double_books():
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    cinema = Cinema("Inception", 26, 50, thread_safe=True)
+    barrier = threading.Barrier(16)
+
+    def kiosk(num_tickets: int) -> None:
+        barrier.wait()
+        while True:
+            try:
+                cinema.book_tickets(num_tickets)
+            except ValueError:
+                if cinema.available_seats < num_tickets:
+                    return
+
+    try:
+        threads = [
+            threading.Thread(target=kiosk, args=(num_tickets % 5 + 1,))
+            for num_tickets in range(16)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    booked_seats = [
+        (seat.row, seat.col)
+        for booking in cinema.bookings.values()
+        for seat in booking.seats
+    ]
+    assert len(booked_seats) == len(set(booked_seats)) == 26 * 50
+    assert cinema.seat_map.count(consts.SEAT_STATE_BOOKED) == 26 * 50
+    assert cinema.last_booking_number == len(cinema.bookings)
+    cinema.seat_map.verify_counters()
+
+
+def test_sessions_hold_independent_reservations():
+    cinema = Cinema("Inception", 8, 10)
+    first_session = cinema.open_session()
+    second_session = cinema.open_session()
+    assert first_session != second_session
+    cinema.create_default_booking(4, first_session)
+    cinema.create_default_booking(2, second_session)
+    first_booking = cinema.get_session(first_session).current_booking
+    second_booking = cinema.get_session(second_session).current_booking
+    assert first_booking.booking_id == "GIC0001"
+    assert second_booking.booking_id == "GIC0002"
+    assert cinema.current_booking is None
+    assert cinema.available_seats == 74
+    cinema.change_seating_position("C01", second_session)
+    assert [(seat.row, seat.col) for seat in second_booking.seats] == [(2, 0), (2, 1)]
+    cinema.confirm_booking(second_session)
+    cinema.abandon_booking(first_session)
+    assert cinema.get_session(first_session).current_booking is None
+    assert cinema.available_seats == 78
+    assert list(cinema.bookings) == ["GIC0002"]
+    cinema.close_session(first_session)
+    with pytest.raises(KeyError):
+        cinema.create_default_booking(1, first_session)
+
+
+def test_close_session_releases_pending_reservation():
+    cinema = Cinema("Inception", 8, 10)
+    session_id = cinema.open_session()
+    cinema.start_booking(session_id)
+    cinema.create_default_booking(10, session_id)
+    assert cinema.available_seats == 70
+    cinema.close_session(session_id)
+    assert cinema.available_seats == 80
+    assert session_id not in cinema.sessions
+
+
+def test_screen_display_highlights_checking_of_session():
+    cinema = Cinema("Inception", 8, 10)
+    cinema.create_bookings_batch([2, 2])
+    session_id = cinema.open_session()
+    cinema.start_checking(session_id)
+    cinema.check_booking("GIC0002", session_id)
+    assert "A . . . o # # o . . ." in cinema.screen_display(session_id)
+    assert "A . . . # # # # . . ." in cinema.screen_display()
+
+
+def test_release_booking():
+    cinema = Cinema("Inception", 8, 10)
+    cinema.create_bookings_batch([4, 2])
+    cinema.release_booking("gic0001")
+    assert list(cinema.bookings) == ["GIC0002"]
+    assert cinema.available_seats == 78
+    with pytest.raises(ValueError):
+        cinema.release_booking("GIC0001")
+    with pytest.raises(ValueError):
+        cinema.confirm_booking()
+
+
+def test_booking_ids_beyond_9999():
+    cinema = Cinema("Inception", 8, 10)
+    cinema.last_booking_number = 9998
+    first_booking_id = cinema.book_tickets(1)
+    second_booking_id = cinema.book_tickets(1)
+    assert (first_booking_id, second_booking_id) == ("GIC9999", "GIC10000")
+    assert cinema.is_booking_id_exist("gic10000")
+    assert not cinema.is_booking_id_exist("GIC0000")
+    assert len(cinema.bookings) == 2
+
+
+def test_seat_owners():
+    cinema = Cinema("Inception", 8, 10)
+    first_booking_id = cinema.book_tickets(4)
+    cinema.create_default_booking(3)
+    cinema.change_seating_position("B02")
+    assert cinema.get_seat_owner("b02") is None
+    cinema.confirm_booking()
+    assert cinema.get_seat_owner("A04") == first_booking_id
+    assert cinema.get_seat_owner("b02") == "GIC0002"
+    assert cinema.get_seat_owner("A01") is None
+    assert cinema.get_block_owners("B01") == {
+        "B02": "GIC0002",
+        "B03": "GIC0002",
+        "B04": "GIC0002",
+    }
+    assert cinema.get_block_owners("B04", "A02") == {
+        "A04": first_booking_id,
+        "B02": "GIC0002",
+        "B03": "GIC0002",
+        "B04": "GIC0002",
+    }
+    cinema.release_booking("GIC0002")
+    assert cinema.get_seat_owner("B02") is None
+    assert cinema.get_block_owners("B01") == {}
+    with pytest.raises(KeyError):
+        cinema.get_seat_owner("Z99")
+
+
+def test_large_hall():
+    cinema = Cinema("Arena", 30, 120)
+    assert cinema.is_seating_position_exist("ad120")
+    assert not cinema.is_seating_position_exist("AE01")
+    assert not cinema.is_seating_position_exist("A121")
+    cinema.create_default_booking(3)
+    cinema.change_seating_position("AC119")
+    assert [(seat.row, seat.col) for seat in cinema.current_booking.seats] == [
+        (28, 118),
+        (28, 119),
+        (29, 59),
+    ]
+    cinema.confirm_booking()
+    assert cinema.get_seat_owner("ac120") == "GIC0001"
+    lines = cinema.screen_display().splitlines()
+    assert lines[3].startswith("AD . . .")
+    assert lines[3].count("#") == 1
+    assert lines[4].endswith(". # #")
+    assert lines[-2].startswith("A  . . .")
+    assert lines[-1].startswith("   1 2 3")
+    assert lines[-1].endswith("119 120")
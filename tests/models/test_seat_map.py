@@ -0,0 +1,180 @@
+import pytest
+
+from models.seat_map import SeatMap
+
+
+@pytest.mark.parametrize("rows, cols", [(8, 10), (1, 1), (26, 50)])
+def test_initialization(rows, cols):
+    seat_map = SeatMap(rows, cols)
+    assert len(seat_map) == rows
+    assert seat_map.cols == cols
+    assert len(seat_map.states) == rows * cols
+    assert seat_map.count("Empty") == rows * cols
+    assert all(
+        seat_map.get_state(row, col) == "Empty"
+        for row in range(rows)
+        for col in range(cols)
+    )
+
+
+@pytest.mark.parametrize(
+    "row, col, new_state", [(0, 0, "Reserved"), (7, 9, "Booked"), (3, 4, "Empty")]
+)
+def test_set_state(row, col, new_state):
+    seat_map = SeatMap(8, 10)
+    seat_map.set_state(row, col, new_state)
+    assert seat_map.get_state(row, col) == new_state
+    assert seat_map.count(new_state) == (80 if new_state == "Empty" else 1)
+
+
+@pytest.mark.parametrize("new_state", [None, "", "Pre-booked"])
+def test_set_state_with_invalid_state(new_state):
+    seat_map = SeatMap(8, 10)
+    with pytest.raises(ValueError):
+        seat_map.set_state(0, 0, new_state)
+
+
+def test_seat_view():
+    seat_map = SeatMap(8, 10)
+    seat = seat_map.seat(2, 3)
+    assert (seat.row, seat.col, seat.state) == (2, 3, "Empty")
+    seat.update_state("Booked")
+    assert seat_map.get_state(2, 3) == "Booked"
+    assert str(seat) == "#"
+    seat_map.set_state(2, 3, "Reserved")
+    assert seat.state == "Reserved"
+
+
+def test_row_codes():
+    seat_map = SeatMap(2, 4)
+    seat_map.set_state(1, 1, "Reserved")
+    seat_map.set_state(1, 3, "Booked")
+    assert seat_map.row_codes(0) == bytes([0, 0, 0, 0])
+    assert seat_map.row_codes(1) == bytes([0, 1, 0, 2])
+
+
+def test_counters():
+    seat_map = SeatMap(3, 4)
+    seat_map.set_state(0, 0, "Reserved")
+    seat_map.set_state(0, 1, "Reserved")
+    seat_map.set_state(2, 3, "Booked")
+    seat_map.set_state(0, 1, "Booked")
+    seat_map.set_state(0, 1, "Booked")
+    assert seat_map.count("Empty") == 9
+    assert seat_map.count("Reserved") == 1
+    assert seat_map.count("Booked") == 2
+    assert seat_map.row_count(0, "Empty") == 2
+    assert seat_map.row_count(0, "Reserved") == 1
+    assert seat_map.row_count(0, "Booked") == 1
+    assert seat_map.row_count(1, "Empty") == 4
+    assert seat_map.row_count(2, "Booked") == 1
+    seat_map.verify_counters()
+
+
+def test_counters_in_debug_mode():
+    seat_map = SeatMap(3, 4, debug=True)
+    seat_map.set_state(1, 1, "Booked")
+    assert seat_map.count("Empty") == 11
+    seat_map.states[0] = 2
+    with pytest.raises(RuntimeError):
+        seat_map.count("Empty")
+
+
+def test_free_seat_index():
+    seat_map = SeatMap(3, 4)
+    for col in range(4):
+        seat_map.set_state(0, col, "Booked")
+    seat_map.set_state(1, 0, "Reserved")
+    seat_map.set_state(1, 2, "Booked")
+    assert seat_map.first_row_with_space() == 1
+    assert seat_map.first_row_with_space(2) == 2
+    assert seat_map.free_count(0) == 0
+    assert seat_map.free_count(1) == 2
+    assert seat_map.free_cols(1) == [1, 3]
+    assert seat_map.next_free_col(1) == 1
+    assert seat_map.next_free_col(1, 2) == 3
+    assert seat_map.next_free_col(0) == -1
+    assert not seat_map.is_free(1, 2)
+    seat_map.set_state(0, 2, "Empty")
+    assert seat_map.first_row_with_space() == 0
+    assert seat_map.free_cols(0) == [2]
+    for col in range(4):
+        seat_map.set_state(2, col, "Booked")
+    assert seat_map.first_row_with_space(2) == -1
+    seat_map.verify_counters()
+
+
+def test_transaction_commit():
+    seat_map = SeatMap(2, 4)
+    transaction = seat_map.begin_transaction()
+    transaction.set_state_code(0, 1, 1)
+    transaction.set_state_code(0, 1, 2)
+    transaction.set_state_code(1, 3, 1)
+    assert transaction.undo_log == {(0, 1): (0, 2), (1, 3): (0, 1)}
+    transaction.commit()
+    assert transaction.undo_log == {}
+    assert seat_map.get_state(0, 1) == "Booked"
+    assert seat_map.get_state(1, 3) == "Reserved"
+
+
+def test_transaction_rollback():
+    seat_map = SeatMap(2, 4)
+    seat_map.set_state(0, 0, "Reserved")
+    transaction = seat_map.begin_transaction()
+    transaction.set_state_code(0, 0, 0)
+    transaction.set_state_code(1, 1, 1)
+    transaction.set_state_code(1, 2, 1)
+    seat_map.set_state(1, 2, "Booked")
+    transaction.rollback()
+    assert seat_map.get_state(0, 0) == "Reserved"
+    assert seat_map.get_state(1, 1) == "Empty"
+    assert seat_map.get_state(1, 2) == "Booked"
+    seat_map.verify_counters()
+
+
+@pytest.mark.parametrize("thread_safe", [False, True])
+def test_reserve_if_empty(thread_safe):
+    seat_map = SeatMap(2, 4, thread_safe=thread_safe)
+    assert seat_map.reserve_if_empty(1, 2)
+    assert not seat_map.reserve_if_empty(1, 2)
+    assert seat_map.get_state(1, 2) == "Reserved"
+    assert not seat_map.compare_and_set([(0, 0, 0, 1), (1, 2, 0, 1)])
+    assert seat_map.get_state(0, 0) == "Empty"
+    assert seat_map.compare_and_set([(0, 0, 0, 1), (1, 2, 1, 2)])
+    assert seat_map.get_state(0, 0) == "Reserved"
+    assert seat_map.get_state(1, 2) == "Booked"
+    seat_map.verify_counters()
+
+
+def test_load_states():
+    seat_map = SeatMap(3, 4)
+    seat_map.set_state(0, 1, "Booked")
+    seat_map.set_state(2, 3, "Reserved")
+    for col in range(4):
+        seat_map.set_state(1, col, "Booked")
+    loaded_seat_map = SeatMap(3, 4)
+    loaded_seat_map.load_states(bytes(seat_map.states))
+    loaded_seat_map.verify_counters()
+    assert loaded_seat_map.free_masks == seat_map.free_masks
+    assert loaded_seat_map.first_row_with_space(1) == 2
+    assert loaded_seat_map.count("Booked") == 5
+    with pytest.raises(ValueError):
+        loaded_seat_map.load_states(bytes(11))
+
+
+@pytest.mark.parametrize("thread_safe", [False, True])
+def test_set_run_state_code(thread_safe):
+    seat_map = SeatMap(3, 8, thread_safe=thread_safe)
+    seat_map.set_state(1, 2, "Booked")
+    seat_map.set_run_state_code(1, 1, 4, 1)
+    assert seat_map.run_codes(1, 0, 6) == bytes([0, 1, 1, 1, 1, 0])
+    assert seat_map.free_cols(1) == [0, 5, 6, 7]
+    seat_map.set_run_state_code(2, 0, 8, 2)
+    assert seat_map.first_row_with_space(2) == -1
+    assert seat_map.row_versions[2] == 1
+    seat_map.set_run_state_code(2, 0, 8, 2)
+    assert seat_map.row_versions[2] == 1
+    seat_map.set_run_state_code(2, 3, 2, 0)
+    assert seat_map.first_row_with_space(2) == 2
+    assert seat_map.count("Booked") == 6
+    seat_map.verify_counters()
@@ -0,0 +1,115 @@
+from datetime import datetime
+
+import pytest
+
+from models.hall_layout import get_hall_layout
+from models.show_catalog import ShowCatalog
+from storage.booking_store import BookingStore
+from utils.booking_utils import build_index_map
+
+
+def _build_catalog() -> ShowCatalog:
+    catalog = ShowCatalog()
+    catalog.add_show("S3", "Inception", 8, 10, datetime(2025, 1, 1, 21, 0))
+    catalog.add_show("s1", "Inception", 8, 10, datetime(2025, 1, 1, 10, 0))
+    catalog.add_show("S2", "Blue Sky", 5, 5, datetime(2025, 1, 1, 14, 0))
+    catalog.add_show("S4", "Blue Sky", 5, 5)
+    return catalog
+
+
+def test_add_show():
+    catalog = _build_catalog()
+    assert len(catalog) == 4
+    cinema = catalog.get_show("S1")
+    assert cinema.show_id == "S1"
+    assert cinema.movie_title == "Inception"
+    assert cinema.available_seats == 80
+    assert catalog.is_show_id_exist("s2")
+    assert not catalog.is_show_id_exist("S5")
+
+
+@pytest.mark.parametrize(
+    "show_id", [None, "", "  ", "s3", "../../x", "S 1", "S1/journal", "S.1"]
+)
+def test_add_show_with_invalid_show_id(show_id):
+    catalog = _build_catalog()
+    with pytest.raises(ValueError):
+        catalog.add_show(show_id, "Inception", 8, 10)
+
+
+def test_get_show_with_invalid_show_id():
+    catalog = _build_catalog()
+    with pytest.raises(ValueError):
+        catalog.get_show("S5")
+
+
+def test_find_shows():
+    catalog = _build_catalog()
+    assert [c.show_id for c in catalog.find_by_title("inception")] == ["S3", "S1"]
+    assert catalog.find_by_title("Unknown") == []
+    assert [
+        c.show_id for c in catalog.find_by_start_time(datetime(2025, 1, 1, 14, 0))
+    ] == ["S2"]
+    assert [
+        c.show_id
+        for c in catalog.find_by_start_time(
+            datetime(2025, 1, 1, 9, 0), datetime(2025, 1, 1, 14, 0)
+        )
+    ] == ["S1", "S2"]
+    assert [c.show_id for c in catalog.list_shows()] == ["S1", "S2", "S3", "S4"]
+
+
+def test_shows_share_hall_layout():
+    catalog = _build_catalog()
+    first_show, second_show = catalog.find_by_title("Inception")
+    assert first_show.layout is second_show.layout is get_hall_layout(8, 10)
+    assert first_show.index_map is second_show.index_map
+    first_show.create_default_booking(4)
+    first_show.confirm_booking()
+    assert first_show.available_seats == 76
+    assert second_show.available_seats == 80
+    assert second_show._seat_map is None
+
+
+def test_persist_shows_in_data_dir(tmp_path):
+    catalog = ShowCatalog(data_dir=str(tmp_path))
+    catalog.add_show("s1", "Inception", 8, 10).book_tickets(4)
+    catalog.close()
+    assert (tmp_path / "S1.journal").exists()
+    recovered_catalog = ShowCatalog(data_dir=str(tmp_path))
+    cinema = recovered_catalog.add_show("S1", "Inception", 8, 10)
+    assert cinema.available_seats == 76
+    assert list(cinema.bookings) == ["GIC0001"]
+    recovered_catalog.close()
+
+
+def test_create_missing_data_dir(tmp_path):
+    data_dir = tmp_path / "data" / "shows"
+    catalog = ShowCatalog(data_dir=str(data_dir))
+    catalog.add_show("S1", "Inception", 8, 10).book_tickets(2)
+    catalog.close()
+    assert (data_dir / "S1.journal").exists()
+
+
+def test_add_show_with_store(tmp_path):
+    store = BookingStore(str(tmp_path / "bookings.db"))
+    catalog = ShowCatalog(store=store)
+    cinema = catalog.add_show("s1", "Inception", 8, 10)
+    booking_id = cinema.book_tickets(3)
+    catalog.close()
+    reopened_store = BookingStore(str(tmp_path / "bookings.db"))
+    assert reopened_store.get_booking("S1", booking_id) == [3, 4, 5]
+    reopened_store.close()
+
+
+def test_many_shows_build_index_map_once():
+    build_index_map.cache_clear()
+    get_hall_layout.cache_clear()
+    catalog = ShowCatalog()
+    for number in range(1000):
+        cinema = catalog.add_show(f"S{number}", "Inception", 12, 34)
+        assert cinema.index_map["L34"] == (11, 33)
+    assert build_index_map.cache_info().misses == 1
+    first_show, last_show = catalog.get_show("S0"), catalog.get_show("S999")
+    assert first_show.seat_codes is last_show.seat_codes
+    assert last_show.seat_codes[11][33] == "L34"
@@ -0,0 +1,41 @@
+import pytest
+
+from models.booking_id_allocator import BookingIdAllocator
+from models.cinema import Cinema
+from storage.booking_id_blocks import FILE_LOCK_SUPPORTED, FileBookingIdBlocks
+
+pytestmark = pytest.mark.skipif(
+    not FILE_LOCK_SUPPORTED, reason="locking files is not supported"
+)
+
+
+def test_blocks_are_shared_through_the_file(tmp_path):
+    path = str(tmp_path / "S1.ids")
+    allocator = BookingIdAllocator(FileBookingIdBlocks(path), block_size=5)
+    other_allocator = BookingIdAllocator(FileBookingIdBlocks(path), block_size=5)
+    assert allocator.issue() == 1
+    assert other_allocator.issue() == 6
+    other_allocator.advance_to(20)
+    assert allocator.issue() == 2
+    assert BookingIdAllocator(FileBookingIdBlocks(path)).issue() == 21
+
+
+def test_cinemas_share_booking_numbers(tmp_path):
+    path = str(tmp_path / "S1.ids")
+    cinema = Cinema(
+        "Inception",
+        8,
+        10,
+        id_allocator=BookingIdAllocator(FileBookingIdBlocks(path), block_size=2),
+    )
+    other_cinema = Cinema(
+        "Inception",
+        8,
+        10,
+        id_allocator=BookingIdAllocator(FileBookingIdBlocks(path), block_size=2),
+    )
+    assert cinema.book_tickets(1) == "GIC0001"
+    assert other_cinema.book_tickets(1) == "GIC0003"
+    assert cinema.book_tickets(1) == "GIC0002"
+    assert cinema.book_tickets(1) == "GIC0005"
+    assert cinema.last_booking_number == 5
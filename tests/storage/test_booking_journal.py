@@ -0,0 +1,100 @@
+import os
+from typing import Optional
+
+import pytest
+
+from models.cinema import Cinema
+from storage.booking_journal import BookingJournal
+
+
+def _book(
+    cinema: Cinema, num_tickets: int, seating_position: Optional[str] = None
+) -> str:
+    cinema.create_default_booking(num_tickets)
+    if seating_position is not None:
+        cinema.change_seating_position(seating_position)
+    booking_id = cinema.current_booking.booking_id
+    cinema.confirm_booking()
+    return booking_id
+
+
+def _assert_same_cinema(cinema: Cinema, recovered: Cinema):
+    assert recovered.seat_map.states == cinema.seat_map.states
+    assert recovered.bookings.keys() == cinema.bookings.keys()
+    for booking_id, booking in cinema.bookings.items():
+        assert recovered.bookings[booking_id].seats == booking.seats
+    recovered.seat_map.verify_counters()
+
+
+@pytest.mark.parametrize("snapshot_every", [0, 2, 3])
+def test_recover(tmp_path, snapshot_every):
+    path_prefix = str(tmp_path / "S1")
+    cinema = Cinema("Inception", 8, 10, show_id="S1")
+    journal = BookingJournal.open(cinema, path_prefix, snapshot_every=snapshot_every)
+    _book(cinema, 4)
+    _book(cinema, 3, "B03")
+    cinema.book_tickets(12)
+    cinema.release_booking("gic0001")
+    cinema.create_default_booking(2)
+    journal.close()
+    cinema.abandon_booking()
+    recovered = Cinema("Inception", 8, 10, show_id="S1")
+    recovered_journal = BookingJournal(path_prefix, snapshot_every=snapshot_every)
+    num_replayed = recovered_journal.recover(recovered)
+    assert num_replayed == (4 if snapshot_every == 0 else 4 % snapshot_every)
+    _assert_same_cinema(cinema, recovered)
+    assert recovered.journal is recovered_journal
+    assert recovered.last_booking_number == 3
+    assert _book(recovered, 2) == "GIC0004"
+
+
+def test_snapshot_truncates_journal(tmp_path):
+    path_prefix = str(tmp_path / "S1")
+    cinema = Cinema("Inception", 8, 10)
+    journal = BookingJournal.open(cinema, path_prefix, snapshot_every=0)
+    _book(cinema, 4)
+    cinema.create_default_booking(3)
+    journal.snapshot()
+    assert os.path.getsize(journal.journal_path) == 0
+    journal.close()
+    recovered = Cinema("Inception", 8, 10)
+    BookingJournal.open(recovered, path_prefix)
+    assert recovered.available_seats == 76
+    assert list(recovered.bookings) == ["GIC0001"]
+
+
+def test_recover_cuts_off_torn_record(tmp_path):
+    path_prefix = str(tmp_path / "S1")
+    cinema = Cinema("Inception", 8, 10)
+    journal = BookingJournal.open(cinema, path_prefix)
+    _book(cinema, 4)
+    journal.close()
+    valid_size = os.path.getsize(journal.journal_path)
+    with open(journal.journal_path, "a", encoding="utf-8") as journal_file:
+        journal_file.write('{"q":2,"t":"c","b":"GIC')
+    recovered = Cinema("Inception", 8, 10)
+    recovered_journal = BookingJournal(path_prefix)
+    assert recovered_journal.recover(recovered) == 1
+    assert os.path.getsize(journal.journal_path) == valid_size
+    assert recovered.available_seats == 76
+
+
+def test_recover_with_other_hall_dimensions(tmp_path):
+    path_prefix = str(tmp_path / "S1")
+    cinema = Cinema("Inception", 8, 10)
+    journal = BookingJournal.open(cinema, path_prefix)
+    _book(cinema, 4)
+    journal.snapshot()
+    journal.close()
+    with pytest.raises(ValueError):
+        BookingJournal.open(Cinema("Inception", 8, 12), path_prefix)
+
+
+def test_fsync_batching(tmp_path, monkeypatch):
+    fsync_calls = []
+    monkeypatch.setattr("os.fsync", fsync_calls.append)
+    cinema = Cinema("Inception", 8, 10)
+    BookingJournal.open(cinema, str(tmp_path / "S1"), fsync_every=3)
+    for _ in range(7):
+        cinema.book_tickets(1)
+    assert len(fsync_calls) == 2
@@ -0,0 +1,156 @@
+import threading
+
+import pytest
+
+from models.cinema import Cinema
+from storage.booking_store import BookingStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    booking_store = BookingStore(str(tmp_path / "bookings.db"), batch_size=3)
+    yield booking_store
+    booking_store.close()
+
+
+def test_add_and_get_booking(store):
+    store.add_booking("S1", "GIC0001", [5, 3, 4])
+    assert store.pending
+    assert store.get_booking("S1", "GIC0001") == [5, 3, 4]
+    store.add_booking("S1", "GIC0002", [6])
+    store.add_booking("S2", "GIC0001", [0, 1])
+    assert not store.pending
+    store.cache.clear()
+    assert store.get_booking("S1", "GIC0001") == [3, 4, 5]
+    assert store.get_booking("S2", "GIC0001") == [0, 1]
+    assert store.get_booking("S2", "GIC0002") is None
+    assert not store.has_booking("S2", "GIC0002")
+    assert store.count_bookings("S1") == 2
+
+
+def test_remove_booking(store):
+    store.add_booking("S1", "GIC0001", [0, 1])
+    store.add_booking("S1", "GIC0002", [2])
+    assert store.remove_booking("S1", "GIC0001") == [0, 1]
+    assert store.remove_booking("S1", "GIC0001") is None
+    assert not store.has_booking("S1", "GIC0001")
+    store.cache.clear()
+    assert not store.has_booking("S1", "GIC0001")
+    assert store.has_booking("S1", "GIC0002")
+
+
+def test_add_duplicated_booking(store):
+    store.add_booking("S1", "GIC0001", [0, 1])
+    with pytest.raises(ValueError):
+        store.add_booking("S1", "GIC0001", [2])
+    store.flush()
+    store.cache.clear()
+    with pytest.raises(ValueError):
+        store.add_booking("S1", "GIC0001", [2])
+    assert store.get_booking("S1", "GIC0001") == [0, 1]
+    store.add_booking("S1", "GIC0002", [5])
+    store.add_booking("S1", "GIC0003", [2, 1])
+    assert store.flush() == [("S1", "GIC0003")]
+    assert store.find_seat_booking("S1", 1) == "GIC0001"
+    assert store.find_seat_booking("S1", 2) is None
+    assert not store.has_booking("S1", "GIC0003")
+    store.cache.clear()
+    assert store.get_booking("S1", "GIC0002") == [5]
+    assert store.count_bookings("S1") == 2
+
+
+def test_list_seats(store):
+    store.add_booking("S1", "GIC0002", [4, 3])
+    store.add_booking("S1", "GIC0001", [9])
+    store.add_booking("S2", "GIC0001", [0])
+    assert store.list_seats("S1") == [(3, "GIC0002"), (4, "GIC0002"), (9, "GIC0001")]
+
+
+def test_cache_is_bounded(tmp_path):
+    store = BookingStore(str(tmp_path / "bookings.db"), batch_size=1, cache_size=2)
+    for number in range(5):
+        store.add_booking("S1", f"GIC{number:04d}", [number])
+    assert list(store.cache) == [("S1", "GIC0003"), ("S1", "GIC0004")]
+    assert store.get_booking("S1", "GIC0000") == [0]
+    store.close()
+
+
+def test_reopen(tmp_path):
+    path = str(tmp_path / "bookings.db")
+    store = BookingStore(path)
+    store.add_booking("S1", "GIC0001", [7, 8])
+    store.close()
+    reopened_store = BookingStore(path)
+    assert reopened_store.get_booking("S1", "GIC0001") == [7, 8]
+    reopened_store.close()
+
+
+def test_concurrent_readers(store):
+    for number in range(30):
+        store.add_booking("S1", f"GIC{number:04d}", [number])
+    store.flush()
+    store.cache.clear()
+    results = []
+
+    def _read():
+        results.append(
+            all(
+                store.get_booking("S1", f"GIC{number:04d}") == [number]
+                for number in range(30)
+            )
+        )
+
+    threads = [threading.Thread(target=_read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [True] * 8
+
+
+def test_cinema_with_store(store):
+    cinema = Cinema("Inception", 8, 10, show_id="S1")
+    cinema.attach_store(store)
+    cinema.create_default_booking(4)
+    cinema.confirm_booking()
+    booking_id = cinema.book_tickets(2)
+    assert cinema.bookings == {}
+    assert cinema.is_booking_id_exist("gic0001")
+    store.cache.clear()
+    cinema.check_booking(booking_id)
+    assert [(seat.row, seat.col) for seat in cinema.current_checking.seats] == [
+        (0, 2),
+        (0, 7),
+    ]
+    cinema.release_booking("GIC0001")
+    assert not cinema.is_booking_id_exist("GIC0001")
+    assert cinema.available_seats == 78
+    with pytest.raises(ValueError):
+        cinema.check_booking("GIC0001")
+
+
+def test_seat_owners_with_store(store):
+    cinema = Cinema("Inception", 8, 10, show_id="S1")
+    cinema.attach_store(store)
+    booking_id = cinema.book_tickets(2)
+    assert store.find_seat_booking("S1", 4) == booking_id
+    assert store.find_seat_booking("S1", 0) is None
+    restarted = Cinema("Inception", 8, 10, show_id="S1")
+    restarted.attach_store(store)
+    assert restarted.get_seat_owner("A05") == booking_id
+    assert restarted.seat_owners[4] == booking_id
+
+
+def test_restart_cinema_with_store(store):
+    cinema = Cinema("Inception", 8, 10, show_id="S1")
+    cinema.attach_store(store)
+    first_booking_id = cinema.book_tickets(3)
+    cinema.book_tickets(2)
+    restarted = Cinema("Inception", 8, 10, show_id="S1")
+    restarted.attach_store(store)
+    assert restarted.available_seats == 75
+    assert restarted.last_booking_number == 2
+    restarted.check_booking(first_booking_id)
+    assert len(restarted.current_checking.seats) == 3
+    assert restarted.book_tickets(1) == "GIC0003"
+    assert store.count_bookings("S1") == 3
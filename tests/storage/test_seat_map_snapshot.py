@@ -0,0 +1,84 @@
+import pytest
+
+from models.cinema import Cinema
+from storage.seat_map_snapshot import SeatMapSnapshot, write_snapshot
+
+
+def _write_cinema_snapshot(path: str) -> Cinema:
+    cinema = Cinema("Inception", 8, 10)
+    cinema.create_bookings_batch([4, 3], [None, "B03"])
+    cinema.create_default_booking(2)
+    write_snapshot(
+        path, cinema.seat_map, cinema.bookings, cinema.last_booking_number, 7
+    )
+    return cinema
+
+
+def test_load_snapshot_lazily(tmp_path):
+    path = str(tmp_path / "S1.snapshot")
+    cinema = _write_cinema_snapshot(path)
+    snapshot = SeatMapSnapshot(path)
+    assert (snapshot.rows, snapshot.cols, snapshot.sequence) == (8, 10, 7)
+    assert (snapshot.last_booking_number, snapshot.num_bookings) == (3, 2)
+    loaded = Cinema("Inception", 8, 10)
+    loaded.load_snapshot(snapshot)
+    assert loaded.available_seats == 73
+    assert loaded._seat_map is None
+    assert list(loaded.bookings) == ["GIC0001", "GIC0002"]
+    assert loaded.bookings["GIC0002"].seats == cinema.bookings["GIC0002"].seats
+    assert loaded.available_seats == 73
+    for seat in cinema.current_booking.seats:
+        assert loaded.seat_map.get_state(seat.row, seat.col) == "Empty"
+    loaded.seat_map.verify_counters()
+    cinema.abandon_booking()
+    assert loaded.screen_display() == cinema.screen_display()
+    assert loaded.seat_owners == cinema.seat_owners
+
+
+def test_changes_do_not_touch_snapshot_file(tmp_path):
+    path = str(tmp_path / "S1.snapshot")
+    _write_cinema_snapshot(path)
+    with open(path, "rb") as snapshot_file:
+        content = snapshot_file.read()
+    loaded = Cinema("Inception", 8, 10)
+    loaded.load_snapshot(SeatMapSnapshot(path))
+    loaded.book_tickets(10)
+    loaded.release_booking("GIC0001")
+    assert loaded.available_seats == 67
+    assert list(loaded.bookings) == ["GIC0002", "GIC0004"]
+    with open(path, "rb") as snapshot_file:
+        assert snapshot_file.read() == content
+
+
+def test_load_snapshot_in_thread_safe_mode(tmp_path):
+    path = str(tmp_path / "S1.snapshot")
+    _write_cinema_snapshot(path)
+    loaded = Cinema("Inception", 8, 10, thread_safe=True)
+    loaded.load_snapshot(SeatMapSnapshot(path))
+    assert loaded._seat_map is not None
+    assert loaded.book_tickets(2) == "GIC0004"
+
+
+@pytest.mark.parametrize("content", [b"GICS", b"XXXX" + bytes(60)])
+def test_open_invalid_snapshot(tmp_path, content):
+    path = tmp_path / "S1.snapshot"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        SeatMapSnapshot(str(path))
+
+
+def test_load_snapshot_of_other_hall(tmp_path):
+    path = str(tmp_path / "S1.snapshot")
+    _write_cinema_snapshot(path)
+    with pytest.raises(ValueError):
+        Cinema("Inception", 8, 12).load_snapshot(SeatMapSnapshot(path))
+
+
+def test_write_snapshot_with_too_long_booking_id(tmp_path):
+    cinema = Cinema("Inception", 8, 10)
+    cinema.book_tickets(1)
+    cinema.bookings["GIC" + "0" * 14] = cinema.bookings.pop("GIC0001")
+    with pytest.raises(ValueError):
+        write_snapshot(
+            str(tmp_path / "S1.snapshot"), cinema.seat_map, cinema.bookings, 1, 1
+        )
@@ -1,3 +1,5 @@
+import io
+
 import pytest
 
 from main import main
@@ -227,3 +229,23 @@ def test_booking_with_multiple_ticket_with_full_booking(monkeypatch, capfd):
     output, err = capfd.readouterr()
     for line in expected_outputs:
         assert line in output
+
+
+def test_buffered_console(monkeypatch, capfd):
+    monkeypatch.setattr("sys.stdin", io.StringIO("Inception 8 10\n1\n4\n\n3\n"))
+    with pytest.raises(SystemExit):
+        main(["--buffered"])
+    output, err = capfd.readouterr()
+    assert "A . . . o o o o . . .\n  1 2 3 4 5 6 7 8 9 10\n" in output
+    assert "Booking id: GIC0001 confirmed." in output
+    assert output.endswith("Thank you for using GIC Cinemas system. Bye!\n")
+
+
+def test_console_with_shows(monkeypatch, capfd):
+    monkeypatch.setattr("sys.stdin", io.StringIO("S2\n1\n2\n\n3\n"))
+    with pytest.raises(SystemExit):
+        main(["--show", "Inception 8 10", "--show", "Up 2 3"])
+    output, err = capfd.readouterr()
+    assert "[S2] Up at TBA (6 seats available)\n" in output
+    assert "B . . .\nA . o o\n  1 2 3\n" in output
+    assert "[1] Book tickets for Up (4 seats available)\n" in output
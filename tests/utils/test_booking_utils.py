@@ -1,22 +1,49 @@
 import pytest
 
+from models.booking import build_seat_runs
 from models.seat import Seat
+from models.seat_map import SeatMap
 from utils.booking_utils import (
+    build_index_map,
+    build_seat_codes,
+    format_booking_id,
     generate_booking_id,
     generate_default_seats,
     generate_seats_by_position,
     get_furthest_row_idx,
+    get_mid_most_order,
+    get_row_label,
+    get_seat_code,
+    parse_booking_id,
+    parse_seat_code,
+    relocate_seats,
 )
 
 
 @pytest.mark.parametrize(
-    "last_booking_number, result", [(0, "GIC0001"), (1, "GIC0002"), (9998, "GIC9999")]
+    "last_booking_number, result",
+    [(0, "GIC0001"), (1, "GIC0002"), (9998, "GIC9999"), (9999, "GIC10000")],
 )
 def test_generate_booking_id(last_booking_number, result):
     booking_id = generate_booking_id(last_booking_number)
     assert booking_id == result
 
 
+@pytest.mark.parametrize("booking_number", [1, 42, 9999, 10000, 1234567])
+def test_format_and_parse_booking_id(booking_number):
+    booking_id = format_booking_id(booking_number)
+    assert parse_booking_id(booking_id) == booking_number
+    assert parse_booking_id(booking_id.lower()) == booking_number
+
+
+@pytest.mark.parametrize(
+    "booking_id", ["", "GIC", "GIC001", "GIC00012", "ABC0001", "GIC12a4", "GIC١٢٣٤"]
+)
+def test_parse_invalid_booking_id(booking_id):
+    with pytest.raises(ValueError):
+        parse_booking_id(booking_id)
+
+
 @pytest.mark.parametrize(
     "rows, cols, booked_seats, expected_furthest_row_index",
     [
@@ -26,9 +53,9 @@ def test_generate_booking_id(last_booking_number, result):
     ],
 )
 def test_get_furthest_row_index(rows, cols, booked_seats, expected_furthest_row_index):
-    seat_map = [[Seat(row, col, "Empty") for col in range(cols)] for row in range(rows)]
+    seat_map = SeatMap(rows, cols)
     for row, col in booked_seats:
-        seat_map[row][col].update_state("Booked")
+        seat_map.set_state(row, col, "Booked")
     furthest_row_index = get_furthest_row_idx(seat_map)
     assert furthest_row_index == expected_furthest_row_index
 
@@ -42,9 +69,9 @@ def test_get_furthest_row_index(rows, cols, booked_seats, expected_furthest_row_
     ],
 )
 def test_get_furthest_row_index_with_errors(rows, cols, booked_seats):
-    seat_map = [[Seat(row, col, "Empty") for col in range(cols)] for row in range(rows)]
+    seat_map = SeatMap(rows, cols)
     for row, col in booked_seats:
-        seat_map[row][col].update_state("Booked")
+        seat_map.set_state(row, col, "Booked")
     with pytest.raises(ValueError):
         get_furthest_row_idx(seat_map)
 
@@ -118,9 +145,9 @@ def test_get_furthest_row_index_with_errors(rows, cols, booked_seats):
     ],
 )
 def test_generate_default_seats(rows, cols, booked_seats, num_tickets, expected_seats):
-    seat_map = [[Seat(row, col, "Empty") for col in range(cols)] for row in range(rows)]
+    seat_map = SeatMap(rows, cols)
     for row, col in booked_seats:
-        seat_map[row][col].update_state("Booked")
+        seat_map.set_state(row, col, "Booked")
     result_seats = generate_default_seats(seat_map, num_tickets)
     assert len(result_seats) == num_tickets
     assert all(
@@ -217,12 +244,122 @@ def test_generate_default_seats(rows, cols, booked_seats, num_tickets, expected_
 def test_generate_seats_by_position(
     rows, cols, booked_seats, num_tickets, start_row, start_col, expected_seats
 ):
-    seat_map = [[Seat(row, col, "Empty") for col in range(cols)] for row in range(rows)]
+    seat_map = SeatMap(rows, cols)
     for row, col in booked_seats:
-        seat_map[row][col].update_state("Booked")
+        seat_map.set_state(row, col, "Booked")
     result_seats = generate_seats_by_position(
         seat_map, num_tickets, start_row, start_col
     )
     assert len(result_seats) == num_tickets
     for seat in result_seats:
         assert seat in expected_seats and seat.state == "Reserved"
+
+
+@pytest.mark.parametrize(
+    "cols, expected_order",
+    [
+        (1, (0,)),
+        (2, (0, 1)),
+        (3, (1, 2, 0)),
+        (10, (4, 5, 3, 6, 2, 7, 1, 8, 0, 9)),
+    ],
+)
+def test_get_mid_most_order(cols, expected_order):
+    assert get_mid_most_order(cols) == expected_order
+    assert get_mid_most_order(cols) is get_mid_most_order(cols)
+
+
+@pytest.mark.parametrize(
+    "reserved_seats, start_row, start_col, expected_seats, changed_rows",
+    [
+        ([(0, 3), (0, 4), (0, 5), (0, 6)], 0, 3, [(0, 3), (0, 4), (0, 5), (0, 6)], []),
+        ([(0, 3), (0, 4), (0, 5), (0, 6)], 0, 5, [(0, 5), (0, 6), (0, 7), (0, 8)], [0]),
+        ([(0, 3), (0, 4)], 2, 8, [(2, 8), (2, 9)], [0, 2]),
+        ([(0, 8), (0, 9)], 0, 9, [(0, 9), (1, 4)], [0, 1]),
+    ],
+)
+def test_relocate_seats(
+    reserved_seats, start_row, start_col, expected_seats, changed_rows
+):
+    seat_map = SeatMap(8, 10)
+    seats = generate_seats_by_position(
+        seat_map, len(reserved_seats), *reserved_seats[0]
+    )
+    assert [(seat.row, seat.col) for seat in seats] == reserved_seats
+    row_versions = list(seat_map.row_versions)
+    transaction = seat_map.begin_transaction()
+    positions = relocate_seats(
+        transaction, build_seat_runs(reserved_seats), start_row, start_col
+    )
+    assert positions == expected_seats
+    assert all(seat_map.get_state(*position) == "Reserved" for position in positions)
+    assert seat_map.count("Reserved") == len(expected_seats)
+    assert [
+        row for row in range(8) if seat_map.row_versions[row] != row_versions[row]
+    ] == changed_rows
+    assert len(transaction.undo_log) == len(set(reserved_seats) ^ set(expected_seats))
+    transaction.rollback()
+    assert [
+        (row, col)
+        for row in range(8)
+        for col in range(10)
+        if seat_map.get_state(row, col) == "Reserved"
+    ] == reserved_seats
+
+
+@pytest.mark.parametrize(
+    "seat_code, position",
+    [
+        ("A01", (0, 0)),
+        ("h10", (7, 9)),
+        ("C05", (2, 4)),
+        ("A00", None),
+        ("A11", None),
+        ("I01", None),
+        ("A1", None),
+        ("A001", None),
+        ("01", None),
+        (" A01", None),
+        ("Ä01", None),
+    ],
+)
+def test_parse_seat_code(seat_code, position):
+    assert parse_seat_code(seat_code, 8, 10) == position
+
+
+def test_index_map_is_shared_and_read_only():
+    index_map = build_index_map(3, 12)
+    assert build_index_map(3, 12) is index_map
+    assert index_map["C12"] == (2, 11)
+    assert len(index_map) == 36
+    with pytest.raises(TypeError):
+        index_map["D01"] = (3, 0)
+
+
+def test_seat_codes_reverse_index_map():
+    seat_codes = build_seat_codes(3, 12)
+    assert build_seat_codes(3, 12) is seat_codes
+    assert seat_codes[1][0] == "B01"
+    for seat_code, (row, col) in build_index_map(3, 12).items():
+        assert seat_codes[row][col] == seat_code
+
+
+@pytest.mark.parametrize(
+    "row, col, seat_code",
+    [
+        (0, 0, "A01"),
+        (25, 9, "Z10"),
+        (26, 99, "AA100"),
+        (51, 4, "AZ05"),
+        (701, 998, "ZZ999"),
+    ],
+)
+def test_seat_codes_of_large_halls(row, col, seat_code):
+    assert get_seat_code(row, col) == seat_code
+    assert get_row_label(row) == seat_code.rstrip("0123456789")
+    assert parse_seat_code(seat_code.lower(), 702, 999) == (row, col)
+
+
+@pytest.mark.parametrize("seat_code", ["AA01", "A008", "A1000", "AAAA01", "A0100"])
+def test_parse_seat_code_out_of_large_hall(seat_code):
+    assert parse_seat_code(seat_code, 26, 999) is None
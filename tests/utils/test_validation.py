@@ -22,12 +22,17 @@ from utils.validation import (
         ("Inception 8 0", (False, None, None, None)),
         ("Inception -1 10", (False, None, None, None)),
         ("Inception 8 -10", (False, None, None, None)),
-        ("Inception 27 10", (False, None, None, None)),
-        ("Inception 26 55", (False, None, None, None)),
+        ("Inception 703 10", (False, None, None, None)),
+        ("Inception 26 1000", (False, None, None, None)),
         ("Inception 8 10", (True, "Inception", 8, 10)),
         ("Blue Sky 8 10", (True, "Blue Sky", 8, 10)),
         ("Blue Sky 8 10 ", (True, "Blue Sky", 8, 10)),
         ("Rooftop Sky Garden 26 50", (True, "Rooftop Sky Garden", 26, 50)),
+        ("  Blue \t Sky  8\t10", (True, "Blue Sky", 8, 10)),
+        ("2001 8 10", (True, "2001", 8, 10)),
+        ("Arena 100 200", (True, "Arena", 100, 200)),
+        ("Arena 702 999", (True, "Arena", 702, 999)),
+        ("Inception 8 10 x", (False, None, None, None)),
     ],
 )
 def test_validate_title_rows_seats_per_row(title_rows_seats_per_row_str, is_valid):
@@ -51,6 +56,15 @@ def test_validate_menu_selection(selection_str, is_valid):
     assert result == is_valid
 
 
+@pytest.mark.parametrize(
+    "selection_str, is_valid",
+    [("4", (True, "4")), ("9", (True, "9")), ("2", (False, None))],
+)
+def test_validate_menu_selection_with_options(selection_str, is_valid):
+    result = validate_menu_selection(selection_str, {"1", "4", "9"})
+    assert result == is_valid
+
+
 @pytest.mark.parametrize(
     "number_of_tickets_str, is_valid",
     [
@@ -1,8 +1,17 @@
-from typing import List
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
 
 import utils.constants as consts
 import utils.messages as msg
+from models.booking import build_seat_masks, build_seat_runs
 from models.seat import Seat
+from models.seat_map import SeatMap, SeatTransaction
+
+# The row label followed by the column number of at least two digits, e.g. A08,
+# AB10 or C123.
+SEAT_CODE_PATTERN = re.compile(r"([A-Za-z]{1,3})([0-9]{2,4})")
 
 
 def generate_booking_id(last_booking_number: int) -> str:
@@ -12,254 +21,461 @@ def generate_booking_id(last_booking_number: int) -> str:
     Returns:
         new booking id.
     """
-    next_id = "0000" + str(last_booking_number + 1)
-    return f"{consts.BOOKING_ID_PREFIX}{next_id[len(next_id) - 4 :]}"
+    return format_booking_id(last_booking_number + 1)
 
 
-def get_furthest_row_idx(seat_map: List[List[Seat]]) -> int:
+def format_booking_id(booking_number: int) -> str:
+    """Format a booking number as a booking id, e.g. GIC0007 or GIC12345.
+        The number is padded to 4 digits and grows wider beyond 9999.
+    Args:
+        booking_number(int): the booking number.
+    Returns:
+        the booking id.
+    """
+    digits = str(booking_number).zfill(consts.BOOKING_ID_MIN_DIGITS)
+    return f"{consts.BOOKING_ID_PREFIX}{digits}"
+
+
+def parse_booking_id(booking_id: str) -> int:
+    """Parse the booking number of a booking id, case-insensitive.
+    Args:
+        booking_id(str): the booking id.
+    Returns:
+        the booking number.
+    """
+    booking_id = booking_id.upper()
+    digits = booking_id[len(consts.BOOKING_ID_PREFIX) :]
+    if not (
+        booking_id.startswith(consts.BOOKING_ID_PREFIX)
+        and digits.isascii()
+        and digits.isdigit()
+        and format_booking_id(int(digits)) == booking_id
+    ):
+        raise ValueError(msg.MSG_INVALID_BOOKING_ID)
+    return int(digits)
+
+
+def get_furthest_row_idx(seat_map: SeatMap) -> int:
     """Get the furthest row index which is start row to reserve.
     Args:
-        seat_map(List[List[Seat]]): the seat map which contains two-dimensional array of Seat.
+        seat_map(SeatMap): the seat map which stores the state of all seats.
     Returns:
         an index of the row which has at least one Empty seat.
     """
-    furthest_row_idx = 0
-    while furthest_row_idx < len(seat_map):
-        if any(
-            [
-                seat
-                for seat in seat_map[furthest_row_idx]
-                if seat.state == consts.SEAT_STATE_EMPTY
-            ]
-        ):
-            return furthest_row_idx
-        furthest_row_idx += 1
-    raise ValueError(msg.MSG_INVALID_NO_EMPTY_SEAT)
+    furthest_row_idx = seat_map.first_row_with_space()
+    if furthest_row_idx == -1:
+        raise ValueError(msg.MSG_INVALID_NO_EMPTY_SEAT)
+    return furthest_row_idx
 
 
-def generate_default_seats(seat_map: List[List[Seat]], num_tickets: int) -> List[Seat]:
+class FreeSeats:
+    def __init__(
+        self, seat_map: SeatMap, released_masks: Optional[Dict[int, int]] = None
+    ):
+        """Initialize the free seats of a seat map as seen by an allocation plan.
+            Seats taken by the plan are removed from the free seats and seats
+            released by the plan are added to them, without changing the seat map.
+        Args:
+            seat_map(SeatMap): the seat map which stores the state of all seats.
+            released_masks(Dict[int, int]): the bitmask of the seat columns of every
+                row which are considered as Empty by the plan.
+        """
+        self.seat_map = seat_map
+        self.row_masks = {
+            row: mask | seat_map.free_masks[row]
+            for row, mask in (released_masks or {}).items()
+        }
+
+    def mask(self, row: int) -> int:
+        """Get the free-seat bitmask of given row."""
+        if row in self.row_masks:
+            return self.row_masks[row]
+        return self.seat_map.free_masks[row]
+
+    def take(self, row: int, col: int) -> None:
+        """Remove the seat at given position from the free seats."""
+        self.row_masks[row] = self.mask(row) & ~(1 << col)
+
+    def first_row_with_space(self, start_row: int = 0) -> int:
+        """Get the first row at or after given row which has at least one free seat.
+        Args:
+            start_row(int): the row index to start looking up.
+        Returns:
+            the row index, or -1 if there is no such row.
+        """
+        rows_mask = self.seat_map.rows_with_space
+        for row, mask in self.row_masks.items():
+            if mask:
+                rows_mask |= 1 << row
+            else:
+                rows_mask &= ~(1 << row)
+        rows_mask >>= start_row
+        if not rows_mask:
+            return -1
+        return start_row + (rows_mask & -rows_mask).bit_length() - 1
+
+
+def generate_default_seats(
+    seat_map: SeatMap, num_tickets: int, start_row: int = 0
+) -> List[Seat]:
     """Algorithm to generate default seats reservation:
     1. Begin at the furthest row and reserve all available seats in middle-most manner.
     2. If there are not enough seats available in the current row, proceed to the next row closer to the screen, reserving seats in a middle-most manner.
     Args:
-        seat_map(List[List[Seat]]): the seat map which contains two-dimensional array of Seat.
+        seat_map(SeatMap): the seat map which stores the state of all seats.
         num_tickets(int): number of tickets to reserve.
+        start_row(int): the row index to start looking up the furthest row.
+            All rows before it must have no Empty seat.
     Returns:
         a list of seats for reservation.
     """
-    result_seats = []
-    start_row = get_furthest_row_idx(seat_map)
-    while len(result_seats) < num_tickets:
-        result_seats = _reserve_row_by_mid_most(
-            seat_map, start_row, num_tickets, result_seats
-        )
-        start_row += 1
-    return result_seats
+    while True:
+        positions = plan_default_seats(FreeSeats(seat_map), num_tickets, start_row)
+        if _reserve_positions(seat_map, positions):
+            return seat_map.seats(positions)
 
 
-def _reserve_row_by_mid_most(
-    seat_map: List[List[Seat]],
-    start_row: int,
-    num_tickets: int,
-    result_seats: List[Seat],
-) -> List[Seat]:
-    """Reverse seats by looking at specified row by middle most strategy.
+def plan_default_seats(
+    free_seats: FreeSeats, num_tickets: int, start_row: int = 0
+) -> List[tuple]:
+    """Plan the default seats reservation without changing the seat map.
     Args:
-        seat_map(List[List[Seat]]): the seat map which contains two-dimensional array of Seat.
-        start_row(int): the row index to start looking up.
+        free_seats(FreeSeats): the free seats to plan on.
         num_tickets(int): number of tickets to reserve.
-        result_seats(List[Seat]): a list of seats which are reserved.
+        start_row(int): the row index to start looking up the furthest row.
     Returns:
-        a list of seats for reservation.
+        a list of (row, col) positions for reservation.
     """
-    mid_col = (len(seat_map[0]) - 1) // 2
-    right_col, left_col = mid_col + 1, mid_col - 1
-    result_seats = _reserve_at_mid(
-        seat_map, start_row, mid_col, num_tickets, result_seats
-    )
-    while len(result_seats) < num_tickets and (
-        right_col < len(seat_map[0]) or left_col > -1
-    ):
-        result_seats = _reserve_at_right(
-            seat_map, start_row, right_col, num_tickets, result_seats
-        )
-        result_seats = _reserve_at_left(
-            seat_map, start_row, left_col, num_tickets, result_seats
-        )
-        right_col += 1
-        left_col -= 1
-    return result_seats
+    positions = []
+    start_row = free_seats.first_row_with_space(start_row)
+    while len(positions) < num_tickets:
+        if start_row == -1:
+            raise ValueError(msg.MSG_INVALID_NO_EMPTY_SEAT)
+        positions = _plan_row_by_mid_most(free_seats, start_row, num_tickets, positions)
+        start_row = free_seats.first_row_with_space(start_row + 1)
+    return positions
 
 
-def _reserve_at_mid(
-    seat_map: List[List[Seat]],
-    start_row: int,
-    mid_col: int,
-    num_tickets: int,
-    result_seats,
-) -> List[Seat]:
-    """Possible to reserve at mid
+@lru_cache(maxsize=None)
+def get_mid_most_order(cols: int) -> Tuple[int, ...]:
+    """Get the middle-most visiting order of the columns of a row.
+        The middle column comes first, then the columns alternate right and left.
+        The order only depends on the row width, so it is shared by all halls.
     Args:
-        seat_map(List[List[Seat]]): the seat map which contains two-dimensional array of Seat.
-        start_row(int): the row index of the seat to reserve.
-        mid_col(int): the column index of the seat to reserve.
-        num_tickets(int): number of tickets to reserve.
-        result_seats(List[Seat]): a list of seats which are reserved.
+        cols(int): number of seats in each row.
     Returns:
-        a list of seats for reservation.
+        a tuple of column indexes in visiting order.
     """
-    if (
-        len(result_seats) < num_tickets
-        and seat_map[start_row][mid_col].state == consts.SEAT_STATE_EMPTY
-    ):
-        seat_map[start_row][mid_col].update_state(consts.SEAT_STATE_RESERVED)
-        result_seats.append(seat_map[start_row][mid_col])
-    return result_seats
+    mid_col = (cols - 1) // 2
+    order = [mid_col] if cols else []
+    for distance in range(1, cols):
+        if mid_col + distance < cols:
+            order.append(mid_col + distance)
+        if mid_col - distance > -1:
+            order.append(mid_col - distance)
+    return tuple(order)
 
 
-def _reserve_at_right(
-    seat_map: List[List[Seat]],
-    start_row: int,
-    right_col: int,
-    num_tickets: int,
-    result_seats,
-) -> List[Seat]:
-    """Possible to reserve at right
+@lru_cache(maxsize=None)
+def get_mid_most_ranks(cols: int) -> Tuple[int, ...]:
+    """Get the rank of every column in the middle-most visiting order.
     Args:
-        seat_map(List[List[Seat]]): the seat map which contains two-dimensional array of Seat.
-        start_row(int): the row index of the seat to reserve.
-        right_col(int): the column index of the seat to reserve.
-        num_tickets(int): number of tickets to reserve.
-        result_seats(List[Seat]): a list of seats which are reserved.
+        cols(int): number of seats in each row.
     Returns:
-        a list of seats for reservation.
+        a tuple which maps the column index to its rank.
     """
-    if (
-        len(result_seats) < num_tickets
-        and seat_map[start_row][right_col].state == consts.SEAT_STATE_EMPTY
-    ):
-        seat_map[start_row][right_col].update_state(consts.SEAT_STATE_RESERVED)
-        result_seats.append(seat_map[start_row][right_col])
-    return result_seats
+    ranks = [0] * cols
+    for rank, col in enumerate(get_mid_most_order(cols)):
+        ranks[col] = rank
+    return tuple(ranks)
 
 
-def _reserve_at_left(
-    seat_map: List[List[Seat]],
+def _plan_row_by_mid_most(
+    free_seats: FreeSeats,
     start_row: int,
-    left_col: int,
     num_tickets: int,
-    result_seats,
-) -> List[Seat]:
-    """Possible to reserve at left
+    positions: List[tuple],
+) -> List[tuple]:
+    """Plan seats by looking at specified row by middle most strategy.
     Args:
-        seat_map(List[List[Seat]]): the seat map which contains two-dimensional array of Seat.
-        start_row(int): the row index of the seat to reserve.
-        left_col(int): the column index of the seat to reserve.
+        free_seats(FreeSeats): the free seats to plan on.
+        start_row(int): the row index to start looking up.
         num_tickets(int): number of tickets to reserve.
-        result_seats(List[Seat]): a list of seats which are reserved.
+        positions(List[tuple]): a list of (row, col) positions which are planned.
     Returns:
-        a list of seats for reservation.
+        a list of (row, col) positions for reservation.
     """
-    if (
-        len(result_seats) < num_tickets
-        and seat_map[start_row][left_col].state == consts.SEAT_STATE_EMPTY
-    ):
-        seat_map[start_row][left_col].update_state(consts.SEAT_STATE_RESERVED)
-        result_seats.append(seat_map[start_row][left_col])
-    return result_seats
+    free_mask = free_seats.mask(start_row)
+    num_needed = num_tickets - len(positions)
+    if not free_mask or num_needed <= 0:
+        return positions
+    cols = free_seats.seat_map.cols
+    if free_mask.bit_count() <= num_needed:
+        selected_cols = sorted(
+            _iter_cols(free_mask), key=get_mid_most_ranks(cols).__getitem__
+        )
+    else:
+        selected_cols = []
+        for col in get_mid_most_order(cols):
+            if free_mask >> col & 1:
+                selected_cols.append(col)
+                if len(selected_cols) == num_needed:
+                    break
+    for col in selected_cols:
+        free_seats.take(start_row, col)
+        positions.append((start_row, col))
+    return positions
 
 
-def _reserve_row_by_right_most(
-    seat_map: List[List[Seat]],
+def _plan_row_by_right_most(
+    free_seats: FreeSeats,
     start_row: int,
     start_col: int,
     no_of_seats: int,
-    result_seats: List[Seat],
-) -> List[Seat]:
-    """Reverse seats by looking at specified row by right most strategy.
+    positions: List[tuple],
+) -> List[tuple]:
+    """Plan seats by looking at specified row by right most strategy.
     Args:
-        seat_map(List[List[Seat]]): the seat map which contains two-dimensional array of Seat.
+        free_seats(FreeSeats): the free seats to plan on.
         start_row(int): the row index to start looking up.
         start_col(int): the column index to start looking up.
         no_of_seats(int): number of tickets to reserve.
-        result_seats(List[Seat]): a list of seats which are reserved.
+        positions(List[tuple]): a list of (row, col) positions which are planned.
     Returns:
-        a list of seats for reservation.
+        a list of (row, col) positions for reservation.
     """
-    while len(result_seats) < no_of_seats and start_col < len(seat_map[0]):
-        if seat_map[start_row][start_col].state == consts.SEAT_STATE_EMPTY:
-            seat_map[start_row][start_col].update_state(consts.SEAT_STATE_RESERVED)
-            result_seats.append(seat_map[start_row][start_col])
-        start_col += 1
-    return result_seats
+    for col in _iter_cols(free_seats.mask(start_row) >> start_col << start_col):
+        if len(positions) >= no_of_seats:
+            break
+        free_seats.take(start_row, col)
+        positions.append((start_row, col))
+    return positions
+
+
+def _iter_cols(mask: int) -> Iterator[int]:
+    """Iterate the column indexes of the set bits of a bitmask in ascending order."""
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
 
 
 def generate_seats_by_position(
-    seat_map: List[List[Seat]], num_tickets: int, start_row: int, start_col: int
+    seat_map: SeatMap, num_tickets: int, start_row: int, start_col: int
 ) -> List[Seat]:
     """Algorithm to generate seats reservation at specific position:
         1. Begin at the specified position (`start_row`, `start_col`) and reserve all available seats to the right of the cinema hall.
         2. If there are not enough seats available in the current row, proceed to the next row closer to the screen, reserving seats in a middle-most manner.
         3. If there are still not enough seats, return the `start_row` and continue reserving all seats available at the current row and next row further from the screen, again in a middle-most manner.
     Args:
-        seat_map(List[List[Seat]]): the seat map which contains two-dimensional array of Seat.
+        seat_map(SeatMap): the seat map which stores the state of all seats.
         num_tickets(int): number of tickets to reserve.
         start_row(int): the row index to start looking up.
         start_col(int): the column index to start looking up.
     Returns:
         a list of seats for reservation.
     """
-    result_seats = []
-    result_seats = _reserve_row_by_right_most(
-        seat_map, start_row, start_col, num_tickets, result_seats
+    while True:
+        positions = plan_seats_by_position(
+            FreeSeats(seat_map), num_tickets, start_row, start_col
+        )
+        if _reserve_positions(seat_map, positions):
+            return seat_map.seats(positions)
+
+
+def plan_seats_by_position(
+    free_seats: FreeSeats, num_tickets: int, start_row: int, start_col: int
+) -> List[tuple]:
+    """Plan the seats reservation at specific position without changing the seat map.
+    Args:
+        free_seats(FreeSeats): the free seats to plan on.
+        num_tickets(int): number of tickets to reserve.
+        start_row(int): the row index to start looking up.
+        start_col(int): the column index to start looking up.
+    Returns:
+        a list of (row, col) positions for reservation.
+    """
+    positions = []
+    positions = _plan_row_by_right_most(
+        free_seats, start_row, start_col, num_tickets, positions
     )
-    result_seats = _select_overflow_seats_by_mid_most(
-        seat_map, num_tickets, start_row, result_seats
+    positions = _select_overflow_seats_by_mid_most(
+        free_seats, num_tickets, start_row, positions
     )
-    return result_seats
+    return positions
 
 
 def _select_overflow_seats_by_mid_most(
-    seat_map: List[List[Seat]],
+    free_seats: FreeSeats,
     num_tickets: int,
     start_row: int,
-    result_seats: List[Seat],
-) -> List[Seat]:
+    positions: List[tuple],
+) -> List[tuple]:
     """Select overflow seats by middle most.
     Args:
-        seat_map(List[List[Seat]]): the seat map which contains two-dimensional array of Seat.
+        free_seats(FreeSeats): the free seats to plan on.
         num_tickets(int): number of tickets to reserve.
         start_row(int): the row index to start looking up.
-        result_seats(List[Seat]): a list of seats which are reserved.
+        positions(List[tuple]): a list of (row, col) positions which are planned.
     Returns:
-        a list of seats for reservation.
+        a list of (row, col) positions for reservation.
     """
     next_row = start_row
     goto_closer_row = True
-    while len(result_seats) < num_tickets:
+    while len(positions) < num_tickets:
         next_row += 1 if goto_closer_row else -1
-        if next_row == len(seat_map):
+        if next_row == free_seats.seat_map.rows:
             next_row = start_row
             goto_closer_row = False
-        result_seats = _reserve_row_by_mid_most(
-            seat_map, next_row, num_tickets, result_seats
+        if next_row < 0:
+            raise ValueError(msg.MSG_INVALID_NO_EMPTY_SEAT)
+        positions = _plan_row_by_mid_most(free_seats, next_row, num_tickets, positions)
+    return positions
+
+
+def _reserve_positions(seat_map: SeatMap, positions: List[tuple]) -> bool:
+    """Atomically reserve the seats at given positions if all of them are Empty.
+    Args:
+        seat_map(SeatMap): the seat map which stores the state of all seats.
+        positions(List[tuple]): a list of (row, col) positions to reserve.
+    Returns:
+        a boolean value to indicate the seats are reserved or not.
+    """
+    return seat_map.compare_and_set(
+        [
+            (row, col, consts.SEAT_CODE_EMPTY, consts.SEAT_CODE_RESERVED)
+            for row, col in positions
+        ]
+    )
+
+
+def relocate_seats(
+    transaction: SeatTransaction,
+    runs: List[Tuple[int, int, int]],
+    start_row: int,
+    start_col: int,
+) -> List[tuple]:
+    """Move reserved seats to the specific position.
+        The new seats are planned as if the given seats were released, then only
+        the seats which differ between the old and the new selection are changed.
+        The plan is retried when another booking takes one of its seats meanwhile.
+        The seats are compared row by row as bitmasks, without Seat objects.
+    Args:
+        transaction(SeatTransaction): the transaction which records the changes.
+        runs(List[Tuple[int, int, int]]): the (row, start_col, length) runs of the
+            reserved seats to move.
+        start_row(int): the row index to start looking up.
+        start_col(int): the column index to start looking up.
+    Returns:
+        a list of (row, col) positions of the reserved seats at the new position.
+    """
+    seat_map = transaction.seat_map
+    old_masks = build_seat_masks(runs)
+    num_tickets = sum(length for _, _, length in runs)
+    while True:
+        free_seats = FreeSeats(seat_map, old_masks)
+        positions = plan_seats_by_position(
+            free_seats, num_tickets, start_row, start_col
         )
-    return result_seats
+        new_masks = build_seat_masks(build_seat_runs(positions))
+        changes = []
+        for row in sorted(old_masks.keys() | new_masks.keys()):
+            old_mask = old_masks.get(row, 0)
+            new_mask = new_masks.get(row, 0)
+            changes += [
+                (row, col, consts.SEAT_CODE_RESERVED, consts.SEAT_CODE_EMPTY)
+                for col in _iter_cols(old_mask & ~new_mask)
+            ]
+            changes += [
+                (row, col, consts.SEAT_CODE_EMPTY, consts.SEAT_CODE_RESERVED)
+                for col in _iter_cols(new_mask & ~old_mask)
+            ]
+        if transaction.compare_and_set(changes):
+            break
+    return positions
 
 
-def build_index_map(rows: int, cols: int) -> dict:
+@lru_cache(maxsize=None)
+def build_index_map(rows: int, cols: int) -> Mapping[str, tuple]:
     """Build index map for all seats in the cinema.
+        It is built once per hall shape and shared read-only by all halls.
     Args:
         rows(int): number of rows
         cols(int): number of columns
     Returns:
-         a dictionary contains all indexes.
+         a read-only dictionary contains all indexes.
     """
     index_map = {}
-    for row in range(rows):
-        for col in range(cols):
-            col_str = f"0{col + 1}"
-            col_str = col_str[len(col_str) - 2 :]
-            key = f"{consts.ALPHABET_LIST[row]}{col_str}"
-            index_map[key] = (row, col)
-    return index_map
+    for row, row_codes in enumerate(build_seat_codes(rows, cols)):
+        for col, seat_code in enumerate(row_codes):
+            index_map[seat_code] = (row, col)
+    return MappingProxyType(index_map)
+
+
+@lru_cache(maxsize=None)
+def build_seat_codes(rows: int, cols: int) -> Tuple[Tuple[str, ...], ...]:
+    """Build the codes of all seats in the cinema, the reverse of the index map.
+        It is built once per hall shape and shared by all halls.
+    Args:
+        rows(int): number of rows
+        cols(int): number of columns
+    Returns:
+        a tuple of rows, each a tuple of the seat codes by column index.
+    """
+    return tuple(
+        tuple(get_seat_code(row, col) for col in range(cols)) for row in range(rows)
+    )
+
+
+def parse_seat_code(seat_code: str, rows: int, cols: int) -> Optional[tuple]:
+    """Parse a seating position code into its indexes, case-insensitive.
+    Args:
+        seat_code(str): the code of the seat, e.g. A08.
+        rows(int): number of rows of the hall.
+        cols(int): number of seats in each row of the hall.
+    Returns:
+        the (row, col) indexes of the seat, or None if it is not in the hall.
+    """
+    match = SEAT_CODE_PATTERN.fullmatch(seat_code)
+    if match is None:
+        return None
+    row_label, col_digits = match.groups()
+    row = -1
+    for letter in row_label.upper():
+        row = (row + 1) * len(consts.ALPHABET_LIST) + ord(letter) - ord("A")
+    col = int(col_digits) - 1
+    if row >= rows or not 0 <= col < cols or col_digits != _format_col(col):
+        return None
+    return row, col
+
+
+def get_seat_code(row: int, col: int) -> str:
+    """Get the seating position code of a seat, e.g. A08, AB10 or C123.
+    Args:
+        row(int): the row index of the seat.
+        col(int): the column index of the seat.
+    Returns:
+        the code of the seat.
+    """
+    return f"{get_row_label(row)}{_format_col(col)}"
+
+
+@lru_cache(maxsize=None)
+def get_row_label(row: int) -> str:
+    """Get the label of a row, A to Z, then AA, AB, ... ZZ.
+    Args:
+        row(int): the row index.
+    Returns:
+        the label of the row.
+    """
+    label = ""
+    row += 1
+    while row:
+        row, letter = divmod(row - 1, len(consts.ALPHABET_LIST))
+        label = consts.ALPHABET_LIST[letter] + label
+    return label
+
+
+def _format_col(col: int) -> str:
+    """Format the column number of a seat code, padded to two digits."""
+    return str(col + 1).zfill(consts.SEAT_CODE_MIN_COLUMN_DIGITS)
@@ -4,9 +4,20 @@ SEAT_STATE_BOOKED = "Booked"
 DISPLAY_EMPTY = "."
 DISPLAY_RESERVED = "o"
 DISPLAY_BOOKED = "#"
+SEAT_CODE_EMPTY = 0
+SEAT_CODE_RESERVED = 1
+SEAT_CODE_BOOKED = 2
+SEAT_STATE_CODES = {
+    SEAT_STATE_EMPTY: SEAT_CODE_EMPTY,
+    SEAT_STATE_RESERVED: SEAT_CODE_RESERVED,
+    SEAT_STATE_BOOKED: SEAT_CODE_BOOKED,
+}
+SEAT_CODE_STATES = (SEAT_STATE_EMPTY, SEAT_STATE_RESERVED, SEAT_STATE_BOOKED)
+SEAT_CODE_DISPLAYS = (DISPLAY_EMPTY, DISPLAY_RESERVED, DISPLAY_BOOKED)
 BOOKING_STATUS_RESERVED = "Reserved"
 BOOKING_STATUS_CONFIRMED = "Confirmed"
 BOOKING_ID_PREFIX = "GIC"
+BOOKING_ID_MIN_DIGITS = 4
 ALPHABET_LIST = [
     "A",
     "B",
@@ -37,5 +48,42 @@ ALPHABET_LIST = [
 ]
 PROCESSING_BOOKING_MODE = "Booking_Mode"
 PROCESSING_CHECKING_MODE = "Checking_Mode"
-MAX_ROWS = 26
-MAX_COLUMNS = 50
+NUM_ROW_LOCKS = 16
+DEFAULT_SESSION_ID = "default"
+SESSION_TOKEN_BYTES = 16
+SHOW_START_TIME_FORMAT = "%Y-%m-%d %H:%M"
+MAX_ROWS = 702
+MAX_COLUMNS = 999
+SEAT_CODE_MIN_COLUMN_DIGITS = 2
+DEFAULT_SERVER_HOST = "127.0.0.1"
+DEFAULT_SERVER_PORT = 8888
+SERVER_SHOW_ID_PREFIX = "S"
+SERVER_BACKLOG = 1024
+DIALOG_STATE_CREATE_CINEMA = "Create_Cinema"
+DIALOG_STATE_SELECT_SHOW = "Select_Show"
+DIALOG_STATE_MAIN_MENU = "Main_Menu"
+DIALOG_STATE_CINEMA_HANDLER = "Cinema_Handler"
+BOOKING_STATE_NUMBER_OF_TICKETS = "Number_Of_Tickets"
+BOOKING_STATE_SEATING_POSITION = "Seating_Position"
+MENU_OPTION_BOOK_TICKETS = "1"
+MENU_OPTION_CHECK_BOOKINGS = "2"
+MENU_OPTION_EXIT = "3"
+MENU_OPTIONS = (MENU_OPTION_BOOK_TICKETS, MENU_OPTION_CHECK_BOOKINGS, MENU_OPTION_EXIT)
+BATCH_COMMAND_CREATE = "create"
+BATCH_COMMAND_BOOK = "book"
+BATCH_COMMAND_RELOCATE = "relocate"
+BATCH_COMMAND_CONFIRM = "confirm"
+BATCH_COMMAND_CHECK = "check"
+OUTPUT_BUFFER_SIZE = 65536
+JOURNAL_FILE_SUFFIX = ".journal"
+SNAPSHOT_FILE_SUFFIX = ".snapshot"
+JOURNAL_FSYNC_EVERY = 64
+JOURNAL_SNAPSHOT_EVERY = 10000
+JOURNAL_RECORD_CONFIRM = "c"
+JOURNAL_RECORD_RELEASE = "r"
+BATCH_COMMAND_RELEASE = "release"
+DEFAULT_SHOW_ID = "default"
+STORE_BATCH_SIZE = 256
+STORE_POOL_SIZE = 4
+STORE_CACHE_SIZE = 4096
+BOOKING_ID_BLOCK_SIZE = 64
@@ -1,19 +1,30 @@
 MSG_BEGIN = (
     "Please define movie title and seating map in [Title] [Row] [SeatsPerRow] format:"
 )
-MSG_WELCOME = "Welcome to GIC Cinemas\n[1] Book tickets for {movie_title} ({seats_available} seats available)\n[2] Check bookings\n[3] Exit\nPlease enter your selection:"
+MSG_WELCOME = "Welcome to GIC Cinemas"
+MSG_MENU_OPTION = "[{option}] {label}"
+MSG_MENU_SELECTION = "Please enter your selection:"
+MSG_MENU_BOOK_TICKETS = (
+    "Book tickets for {movie_title} ({seats_available} seats available)"
+)
+MSG_MENU_CHECK_BOOKINGS = "Check bookings"
+MSG_MENU_EXIT = "Exit"
 MSG_INPUT_NUMBER_OF_TICKETS = (
     "Enter number of tickets to book, or enter blank to go back to main menu:"
 )
 MSG_INPUT_SEATING_POSITION = (
     "Enter blank to accept seat selection, or enter new seating position:"
 )
+MSG_INPUT_SHOW_ID = "Please select a show by entering its show id:"
 MSG_INPUT_BOOKING_ID = "Enter booking id, or enter blank to go back to main menu:"
 MSG_OUTPUT_SUCCESSFULLY_RESERVED = (
     "Successfully reserved {num_tickets} {movie_title} tickets."
 )
 MSG_OUTPUT_BOOKING_ID = "Booking id: {booking_id}"
 MSG_OUTPUT_BOOKING_CONFIRMED = "Booking id: {booking_id} confirmed."
+MSG_OUTPUT_SHOW = (
+    "[{show_id}] {movie_title} at {start_time} ({seats_available} seats available)"
+)
 MSG_OUTPUT_GOODBYE = "Thank you for using GIC Cinemas system. Bye!"
 MSG_INVALID_MOVIE_TITLE_ROWS_SEATS_PER_ROW = (
     "Invalid movie title or rows or seats per row. Please try again."
@@ -23,6 +34,11 @@ MSG_INVALID_NUMBER_OF_TICKETS = "Invalid number of tickets. Please try again."
 MSG_INVALID_SEATING_POSITION = "Invalid seating position. Please try again."
 MSG_INVALID_BOOKING_ID = "Invalid booking id. Please try again."
 MSG_NOT_EXIST_BOOKING_ID = "Booking id [{booking_id}] does not exist. Please try again."
+MSG_INVALID_SHOW_ID = "Invalid show id. Please try again."
+MSG_NOT_EXIST_SHOW_ID = "Show id [{show_id}] does not exist. Please try again."
+MSG_DUPLICATED_SHOW_ID = "Show id [{show_id}] already exists."
+MSG_DUPLICATED_BOOKING_ID = "Booking id [{booking_id}] already exists."
+MSG_NOT_EXIST_SESSION_ID = "Booking session does not exist."
 MSG_INVALID_EXCEEDING_NUMBER_OF_TICKETS = (
     "Sorry, there are only {num_seats} seats available."
 )
@@ -38,6 +54,29 @@ MSG_INVALID_STATUS_RESERVED = (
 MSG_INVALID_STATUS_CONFIRMED = (
     "Invalid booking seats. For Confirmed booking, all seat's state must be Booked."
 )
+MSG_INVALID_SEAT_COUNTERS = "Seat counters do not match the seat map."
 MSG_INVALID_NO_EMPTY_SEAT = "There is no Empty seat."
 MSG_INFO_SELECTED_SEATS = "Selected seats:\n"
 MSG_INFO_SCREEN = "SCREEN"
+MSG_INFO_NO_START_TIME = "TBA"
+MSG_INVALID_SHOW_DEFINITION = (
+    "Invalid show [{show}]. Please define it in [Title] [Row] [SeatsPerRow] format."
+)
+MSG_INFO_SERVING = "Serving GIC Cinemas on {host}:{port}"
+MSG_INVALID_BLOCKING_INPUT = (
+    "Blocking input is not supported, feed the dialog with lines instead."
+)
+MSG_DUPLICATED_MENU_OPTION = "Menu option [{option}] is already registered."
+MSG_NOT_EXIST_PENDING_BOOKING = (
+    "There is no pending booking. Please book tickets first."
+)
+MSG_INVALID_BATCH_COMMAND = "Invalid command [{command}]."
+MSG_MISSING_BATCH_FIELD = "Missing field [{field}]."
+MSG_INVALID_SEAT_MAP_SNAPSHOT = (
+    "Invalid seat map snapshot. The hall dimensions do not match."
+)
+MSG_INVALID_SNAPSHOT_FILE = "Invalid snapshot file [{path}]."
+MSG_FILE_LOCK_NOT_SUPPORTED = "Locking files is not supported on this platform."
+MSG_INVALID_SNAPSHOT_BOOKING_ID = (
+    "Booking id [{booking_id}] is too long to be stored in a snapshot."
+)
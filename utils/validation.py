@@ -1,5 +1,43 @@
+import re
+from typing import Collection, Optional, Tuple
+
 import utils.constants as consts
 
+# [Title] [Row] [SeatsPerRow], the title is everything before the last two numbers.
+HALL_DEFINITION_PATTERN = re.compile(r"\s*(\S.*?)\s+([0-9]+)\s+([0-9]+)\s*")
+
+# Show ids name the journal and snapshot files, so they stay safe in a file name.
+SHOW_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def parse_hall_definition(hall_definition_str: str) -> Optional[Tuple[str, int, int]]:
+    """Parse movie title, rows and seats per row in one pass.
+    Args:
+        hall_definition_str(str): input string in [Title] [Row] [SeatsPerRow] format.
+    Returns:
+        a tuple of movie title, rows and seats per row, or None if it is invalid.
+    """
+    if not hall_definition_str:
+        return None
+    match = HALL_DEFINITION_PATTERN.fullmatch(hall_definition_str)
+    if match is None:
+        return None
+    title, rows_str, seats_per_row_str = match.groups()
+    rows, seats_per_row = int(rows_str), int(seats_per_row_str)
+    if not (0 < rows <= consts.MAX_ROWS and 0 < seats_per_row <= consts.MAX_COLUMNS):
+        return None
+    return " ".join(title.split()), rows, seats_per_row
+
+
+def is_valid_show_id(show_id: str) -> bool:
+    """Check whether a show id only has letters, digits, underscores and hyphens.
+    Args:
+        show_id(str): the show id.
+    Returns:
+        a boolean value to indicate the show id is valid or not.
+    """
+    return show_id is not None and SHOW_ID_PATTERN.fullmatch(show_id) is not None
+
 
 def validate_title_rows_seats_per_row(title_rows_seats_per_row_str: str) -> tuple:
     """Validate string input of movie title, rows, seats per row.
@@ -8,39 +46,25 @@ def validate_title_rows_seats_per_row(title_rows_seats_per_row_str: str) -> tupl
     Return:
         a tuple values to indicate whether movie title, rows, seats per row are valid or not.
     """
-    if not title_rows_seats_per_row_str:
-        return False, None, None, None
-    title_rows_seats_per_row = title_rows_seats_per_row_str.split()
-    if len(title_rows_seats_per_row) < 3:
-        return False, None, None, None
-    try:
-        title = " ".join(title_rows_seats_per_row[: len(title_rows_seats_per_row) - 2])
-        rows = int(title_rows_seats_per_row[len(title_rows_seats_per_row) - 2])
-        seats_per_row = int(title_rows_seats_per_row[len(title_rows_seats_per_row) - 1])
-        if not title:
-            return False, None, None, None
-        if (
-            rows <= 0
-            or rows > consts.MAX_ROWS
-            or seats_per_row <= 0
-            or seats_per_row > consts.MAX_COLUMNS
-        ):
-            return False, None, None, None
-        return True, title, rows, seats_per_row
-    except ValueError:
+    hall_definition = parse_hall_definition(title_rows_seats_per_row_str)
+    if hall_definition is None:
         return False, None, None, None
+    return (True, *hall_definition)
 
 
-def validate_menu_selection(selection_str: str) -> tuple:
+def validate_menu_selection(
+    selection_str: str, options: Collection[str] = consts.MENU_OPTIONS
+) -> tuple:
     """Validate selection  of the menu.
     Args:
         selection_str (str): given input string
+        options (Collection[str]): the options of the menu.
     Returns:
         a tuple values to indicate the selection of the menu is valid or not.
     """
     if selection_str is None or selection_str == "":
         return False, None
-    return (True, selection_str) if selection_str in ["1", "2", "3"] else (False, None)
+    return (True, selection_str) if selection_str in options else (False, None)
 
 
 def validate_number_of_tickets(number_of_tickets_str: str) -> tuple: